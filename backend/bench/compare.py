@@ -0,0 +1,86 @@
+"""
+Compare two benchmark result files written by bench.run.
+
+    python -m bench.compare baseline.json candidate.json --threshold 10
+
+Prints every shared metric with its relative change and marks regressions:
+latencies that grew, or throughputs that dropped, by more than --threshold
+percent. Exits with status 1 on regressions when --fail-on-regression is set.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Leaf metric name -> True when higher is better
+_DIRECTIONS = {
+    "items_per_s": True,
+    "throughput_rps": True,
+    "mean": False,
+    "p50": False,
+    "p95": False,
+    "p99": False,
+}
+
+
+def flatten(results: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Flatten micro/macro sections to "layer.case.metric" -> value for the
+    metrics listed in _DIRECTIONS.
+    """
+    flat: Dict[str, float] = {}
+
+    def walk(prefix: str, node: Any) -> None:
+        if not isinstance(node, dict):
+            return
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                walk(path, value)
+            elif key in _DIRECTIONS and isinstance(value, (int, float)):
+                flat[path] = float(value)
+
+    for layer in ("micro", "macro"):
+        walk(layer, results.get(layer, {}))
+    return flat
+
+
+def compare(base: Dict[str, Any], candidate: Dict[str, Any], threshold: float) -> List[Tuple[str, float, float, float, bool]]:
+    old, new = flatten(base), flatten(candidate)
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        change = (after - before) / before * 100.0 if before else 0.0
+        higher_is_better = _DIRECTIONS[key.rsplit(".", 1)[-1]]
+        regressed = (-change if higher_is_better else change) > threshold
+        rows.append((key, before, after, change, regressed))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=5.0, help="Regression threshold in percent")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    base = json.loads(args.baseline.read_text(encoding="utf-8"))
+    candidate = json.loads(args.candidate.read_text(encoding="utf-8"))
+    rows = compare(base, candidate, args.threshold)
+
+    width = max((len(row[0]) for row in rows), default=10)
+    print(f"{'metric':<{width}}  {'baseline':>12}  {'candidate':>12}  {'change':>8}")
+    for key, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{key:<{width}}  {before:>12.3f}  {after:>12.3f}  {change:>+7.1f}%{flag}")
+
+    regressions = sum(1 for row in rows if row[4])
+    print(f"\n{len(rows)} metrics compared, {regressions} regressed beyond {args.threshold:.1f}%")
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Fixed Russian-language corpus for benchmarks. Kept in code so every run, on
+every machine, measures exactly the same inputs.
+"""
+from typing import List
+
+HEADLINES: List[str] = [
+    "Учёные раскрыли секрет, о котором молчали годами",
+    "Вы не поверите, что случилось с этим городом",
+    "Центробанк сохранил ключевую ставку на прежнем уровне",
+    "Правительство утвердило бюджет на следующий год",
+    "Эта простая привычка изменит вашу жизнь навсегда",
+    "В Москве открылась новая станция метро",
+    "Врачи в шоке: этот продукт есть в каждом холодильнике",
+    "Минфин разместил облигации федерального займа на 30 млрд рублей",
+    "Звезда сериала показала то, что скрывала десять лет",
+    "Росстат опубликовал данные об инфляции за сентябрь",
+    "Только посмотрите, что нашли рабочие под старым домом",
+    "Сборная России сыграла вничью в товарищеском матче",
+    "Никто не ожидал такого финала: пользователи сети в восторге",
+    "В Петербурге отремонтируют Дворцовый мост",
+    "Шокирующая правда о том, чем нас кормят в кафе",
+    "Компания отчиталась о росте выручки на 12 процентов",
+    "Секретный способ сэкономить на коммунальных платежах",
+    "Госдума приняла закон о защите персональных данных в первом чтении",
+    "Вот почему вам никогда не стоит делать это утром",
+    "На Камчатке зафиксировали извержение вулкана Безымянный",
+]
+
+_PARAGRAPHS: List[str] = [
+    "Министерство экономического развития представило обновлённый прогноз. "
+    "По оценке ведомства, рост ВВП в текущем году составит около двух процентов, "
+    "а инфляция замедлится к концу года.",
+    "«Мы видим устойчивое восстановление потребительского спроса», — заявил министр "
+    "на пресс-конференции. По его словам, ключевую роль сыграли меры поддержки бизнеса.",
+    "Эксперты относятся к прогнозу сдержанно. «Риски остаются высокими, особенно со "
+    "стороны внешней торговли», — отметил главный экономист крупного банка.",
+    "Жители района несколько месяцев жаловались на состояние дороги. После публикаций "
+    "в местных СМИ администрация пообещала провести ремонт до конца лета.",
+    "«Работы начнутся уже в следующем месяце, подрядчик выбран», — сообщили в пресс-службе "
+    "мэрии. Горожане, впрочем, не спешат радоваться и вспоминают прошлые обещания.",
+    "Вообще говоря, в целом можно сказать, что ситуация, безусловно, является довольно "
+    "непростой, и, как известно, многие аспекты, так или иначе, требуют внимания.",
+    "Исследователи из Новосибирска разработали новый метод очистки воды. Технология "
+    "позволяет удалять до девяноста процентов примесей без использования реагентов.",
+    "«Это действительно прорыв, мы долго шли к этому результату», — рассказал руководитель "
+    "лаборатории. Первые промышленные испытания запланированы на следующий год.",
+    "Футбольный клуб объявил о подписании контракта с новым нападающим. Сумма сделки "
+    "не раскрывается, однако, по данным журналистов, она стала рекордной для клуба.",
+    "«Я счастлив присоединиться к команде и сделаю всё, чтобы оправдать доверие», — сказал "
+    "игрок. Болельщики встретили новость с воодушевлением.",
+]
+
+
+def _article(index: int, paragraphs: int) -> str:
+    picked = [_PARAGRAPHS[(index + i) % len(_PARAGRAPHS)] for i in range(paragraphs)]
+    return "\n\n".join(picked)
+
+
+# Articles of increasing length (1..10 paragraphs), so chunking and padding are exercised
+ARTICLES: List[str] = [_article(i, 1 + i % 10) for i in range(20)]
+
+# Texts for the water detector: short notes up to multi-paragraph articles
+WATER_TEXTS: List[str] = _PARAGRAPHS + ARTICLES[:10]
+
+PUBLISHED_DATE = "2024-09-15"
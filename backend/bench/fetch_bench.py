@@ -0,0 +1,97 @@
+"""
+Throughput and tail-latency test of the async fetch path against the local
+stub upstream (no network access needed).
+
+    python -m bench.fetch_bench --requests 500 --hosts 4 --latency-ms 50 --slow-rate 0.02
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+from bench.stats import percentile
+from bench.stub_upstream import StubUpstream
+from src.services.async_fetcher import AsyncFetcher
+from src.services.fetcher import FetchError
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    stub = StubUpstream(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        error_rate=args.error_rate,
+    )
+    # Distinct loopback addresses act as distinct hosts for the per-host limit.
+    hosts = [f"127.0.0.{i + 1}" for i in range(args.hosts)]
+    port = await stub.start(hosts)
+    fetcher = AsyncFetcher(
+        max_concurrency=args.concurrency,
+        per_host_concurrency=args.per_host,
+        read_timeout=args.read_timeout,
+        total_timeout=args.total_timeout,
+        use_cache=False,
+        # The stub upstream listens on loopback
+        allow_private=True,
+    )
+
+    urls = [f"http://{hosts[i % len(hosts)]}:{port}/article/{i}" for i in range(args.requests)]
+
+    latencies: List[float] = []
+    failures = 0
+
+    async def one(url: str) -> None:
+        nonlocal failures
+        started = time.perf_counter()
+        try:
+            result = await fetcher.fetch(url)
+            if result.get("error"):
+                failures += 1
+        except FetchError:
+            failures += 1
+        latencies.append((time.perf_counter() - started) * 1000.0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(url) for url in urls))
+    elapsed = time.perf_counter() - started
+    await stub.stop()
+
+    latencies.sort()
+    return {
+        "requests": args.requests,
+        "failures": failures,
+        "elapsed_s": elapsed,
+        "throughput_rps": args.requests / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": percentile(latencies, 1.0),
+        },
+        "upstream_peak_active": stub.stats.peak_active,
+        "upstream_peak_active_by_host": stub.stats.peak_active_by_host,
+        "fetcher": fetcher.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Async fetch benchmark against a local stub upstream")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-ms", type=float, default=1000.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--read-timeout", type=float, default=5.0)
+    parser.add_argument("--total-timeout", type=float, default=10.0)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
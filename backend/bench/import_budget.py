@@ -0,0 +1,135 @@
+"""
+Check that the API boots fast: importing src.api.app and answering the first
+GET /health must stay under a time budget, and must not import any ML or
+parsing library (those load with the models, in the background).
+
+    python -m bench.import_budget --budget-ms 1000
+    python -m bench.import_budget --show-slowest 20
+
+Each run starts a fresh interpreter; the median of --repeat runs is compared
+with the budget. Exits with status 1 when the budget is exceeded or a heavy
+module was imported, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Top-level packages that must not be imported while booting
+HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "onnxruntime",
+    "numpy",
+    "pandas",
+    "sklearn",
+    "joblib",
+    "pymorphy3",
+    "newspaper",
+    "bs4",
+    "sentimen_analiz",
+    "components",
+    "parser",
+)
+
+# Runs in the child interpreter. The app is called directly over ASGI so no
+# HTTP client library adds to the measured imports.
+_PROBE = """
+import asyncio, json, sys, time
+
+started = time.perf_counter()
+from src.api.app import app
+imported = time.perf_counter()
+
+async def health():
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": "/health", "raw_path": b"/health", "query_string": b"",
+             "root_path": "", "headers": [], "client": ("probe", 0), "server": ("probe", 80)}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages[0]["status"]
+
+status = asyncio.run(health())
+served = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000.0,
+    "health_ms": (served - started) * 1000.0,
+    "status": status,
+    "heavy": sorted(name for name in %r if name in sys.modules),
+}))
+""" % (HEAVY_MODULES,)
+
+
+def _probe(importtime: bool = False) -> Dict[str, Any]:
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", _PROBE]
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    completed = subprocess.run(command, cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    if importtime:
+        result["importtime"] = completed.stderr
+    return result
+
+
+def slowest_imports(importtime_log: str, top: int) -> List[Dict[str, Any]]:
+    """
+    Parse `python -X importtime` output into the `top` imports with the
+    largest cumulative time.
+    """
+    rows = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        rows.append({"module": name, "self_ms": int(self_us) / 1000.0, "cumulative_ms": int(cumulative_us) / 1000.0})
+    return sorted(rows, key=lambda row: row["cumulative_ms"], reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fail when API startup exceeds its import-time budget")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="Budget for import + first /health")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh-interpreter runs; the median is checked")
+    parser.add_argument("--show-slowest", type=int, default=0, help="Also list the N slowest imports")
+    args = parser.parse_args()
+
+    runs = [_probe() for _ in range(max(1, args.repeat))]
+    health_ms = statistics.median(run["health_ms"] for run in runs)
+    heavy = sorted({name for run in runs for name in run["heavy"]})
+    report: Dict[str, Any] = {
+        "budget_ms": args.budget_ms,
+        "import_ms": statistics.median(run["import_ms"] for run in runs),
+        "health_ms": health_ms,
+        "health_status": runs[-1]["status"],
+        "heavy_modules": heavy,
+    }
+    if args.show_slowest:
+        report["slowest"] = slowest_imports(_probe(importtime=True)["importtime"], args.show_slowest)
+    print(json.dumps(report, indent=2))
+
+    failures = []
+    if health_ms > args.budget_ms:
+        failures.append(f"startup took {health_ms:.0f} ms, budget is {args.budget_ms:.0f} ms")
+    if heavy:
+        failures.append(f"heavy modules imported at startup: {', '.join(heavy)}")
+    if report["health_status"] != 200:
+        failures.append(f"/health answered {report['health_status']}")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+In-process load tests of the HTTP endpoints: requests go through the full
+FastAPI app (validation, executors, batching, caches) over an ASGI transport,
+without sockets, so numbers reflect the service and not the network.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from bench.corpus import ARTICLES, HEADLINES, PUBLISHED_DATE, WATER_TEXTS
+from bench.stats import latency_summary
+
+
+def _analysis_payload(i: int) -> Dict[str, Any]:
+    return {"input_type": "text", "text": ARTICLES[i % len(ARTICLES)], "published_date": PUBLISHED_DATE}
+
+
+def _clickbait_payload(i: int) -> Dict[str, Any]:
+    return {"headline": HEADLINES[i % len(HEADLINES)]}
+
+
+def _water_payload(i: int) -> Dict[str, Any]:
+    return {"text": WATER_TEXTS[i % len(WATER_TEXTS)], "include_features": True}
+
+
+ENDPOINTS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "/analysis": _analysis_payload,
+    "/clickbait/analyze": _clickbait_payload,
+    "/water-detection": _water_payload,
+}
+
+
+async def _load(client: Any, path: str, payload: Callable[[int], Dict[str, Any]], requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(path, json=payload(i))
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "elapsed_s": elapsed,
+        "throughput_rps": requests / elapsed if elapsed else 0.0,
+        "statuses": statuses,
+        "latency_ms": latency_summary(latencies),
+    }
+
+
+async def _run(requests: int, concurrency: int, endpoints: List[str]) -> Dict[str, Any]:
+    import httpx
+
+    from src.api.app import create_app
+    from src.services.executor import shutdown_executors
+    from src.services.models import warm_up_models
+
+    # The ASGI transport does not run the lifespan; load and warm models up front
+    # so the first requests do not pay for it
+    readiness = warm_up_models()
+    app = create_app()
+    results: Dict[str, Any] = {"models": readiness["models"]}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for path in endpoints:
+            payload = ENDPOINTS[path]
+            try:
+                await client.post(path, json=payload(0))  # warm the route itself
+                results[path] = await _load(client, path, payload, requests, concurrency)
+            except Exception as exc:
+                # e.g. /analysis without the parser, freshness and sentiment
+                # packages under code/; the other endpoints are still measured
+                results[path] = {"error": f"{type(exc).__name__}: {exc}"}
+    shutdown_executors(wait=True)
+    return results
+
+
+def run_macro(requests: int, concurrency: int, endpoints: Optional[List[str]] = None) -> Dict[str, Any]:
+    try:
+        return asyncio.run(_run(requests, concurrency, endpoints or list(ENDPOINTS)))
+    except ImportError as exc:
+        # The app itself could not be imported; endpoint failures are recorded per endpoint
+        return {"error": f"{type(exc).__name__}: {exc}"}
@@ -0,0 +1,112 @@
+"""
+Micro-benchmarks of the detectors, called directly (no HTTP, no executors):
+water feature extraction, clickbait predict/predict_batch and sentiment
+chunked scoring. Each case runs `repeat` times after one warm-up call.
+"""
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from bench.corpus import ARTICLES, HEADLINES, WATER_TEXTS
+from bench.stats import latency_summary
+
+
+def _measure(fn: Callable[[], Any], items: int, repeat: int) -> Dict[str, Any]:
+    fn()  # warm-up: lazy init, allocator, kernel selection
+    latencies: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000.0)
+    total_s = sum(latencies) / 1000.0
+    return {
+        "runs": repeat,
+        "items_per_run": items,
+        "items_per_s": items * repeat / total_s if total_s else 0.0,
+        "latency_ms": latency_summary(latencies),
+    }
+
+
+def bench_water(repeat: int) -> Dict[str, Any]:
+    from src.services import water_detector
+
+    analyzer = water_detector.load_model()
+    text = WATER_TEXTS[len(WATER_TEXTS) // 2]
+    return {
+        "extract_features": _measure(lambda: analyzer.extract_features(text), 1, repeat),
+        "extract_features_corpus": _measure(
+            lambda: [analyzer.extract_features(t) for t in WATER_TEXTS], len(WATER_TEXTS), repeat
+        ),
+        "analyze_batch": _measure(lambda: analyzer.analyze_batch(WATER_TEXTS), len(WATER_TEXTS), repeat),
+    }
+
+
+def bench_clickbait(repeat: int) -> Dict[str, Any]:
+    from src.services import clickbait_detector
+
+    detector = clickbait_detector.load_model()
+    results = {
+        "score": _measure(lambda: detector.score(HEADLINES[0]), 1, repeat),
+        "score_batch": _measure(lambda: detector.score_batch(HEADLINES), len(HEADLINES), repeat),
+    }
+    # The ONNX backend only implements score/score_batch
+    if hasattr(detector, "predict"):
+        results["predict"] = _measure(lambda: detector.predict(HEADLINES[0]), 1, repeat)
+        results["predict_loop"] = _measure(
+            lambda: [detector.predict(h) for h in HEADLINES], len(HEADLINES), repeat
+        )
+        results["predict_batch"] = _measure(lambda: detector.predict_batch(HEADLINES), len(HEADLINES), repeat)
+    return results
+
+
+def _sentiment_analyzer() -> Any:
+    try:
+        from src.services import sentiment_adapter
+
+        return sentiment_adapter.load_model()
+    except ImportError:
+        # code/sentimen_analiz is not available: drive the checkpoint directly,
+        # which is all the batched chunking path needs
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        from src.lib.sentiment_config import SENTIMENT_MODEL_PATH
+
+        return SimpleNamespace(
+            tokenizer=AutoTokenizer.from_pretrained(str(SENTIMENT_MODEL_PATH)),
+            model=AutoModelForSequenceClassification.from_pretrained(str(SENTIMENT_MODEL_PATH)).eval(),
+            confidence_threshold=0.5,
+        )
+
+
+def bench_sentiment(repeat: int) -> Dict[str, Any]:
+    from src.services.sentiment_batch import score_texts, supports_batching
+
+    analyzer = _sentiment_analyzer()
+    results: Dict[str, Any] = {}
+    if supports_batching(analyzer):
+        results["score_texts_articles"] = _measure(lambda: score_texts(analyzer, ARTICLES), len(ARTICLES), repeat)
+        results["score_texts_headlines"] = _measure(
+            lambda: score_texts(analyzer, HEADLINES), len(HEADLINES), repeat
+        )
+    if hasattr(analyzer, "predict_sentiment_with_chunking"):
+        results["predict_sentiment_with_chunking"] = _measure(
+            lambda: [analyzer.predict_sentiment_with_chunking(a) for a in ARTICLES], len(ARTICLES), repeat
+        )
+    return results
+
+
+BENCHES: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "water": bench_water,
+    "clickbait": bench_clickbait,
+    "sentiment": bench_sentiment,
+}
+
+
+def run_micro(repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, bench in BENCHES.items():
+        try:
+            results[name] = bench(repeat)
+        except Exception as exc:  # report and keep going with the other detectors
+            results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+    return results
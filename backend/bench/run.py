@@ -0,0 +1,101 @@
+"""
+Run the benchmark suite and save the results as JSON.
+
+    python -m bench.run --output bench-results/baseline.json
+    python -m bench.run --layer micro --repeat 50 --output after.json
+    python -m bench.compare bench-results/baseline.json after.json
+
+By default the detectors use the stand-in models from bench.standin_models;
+pass --models real to benchmark the checkpoints configured in the environment.
+The result cache is disabled unless --cache is given, so repeated corpus
+inputs are really recomputed.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from bench.standin_models import DEFAULT_DIR, build_standins
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _meta(args: argparse.Namespace) -> Dict[str, Any]:
+    meta: Dict[str, Any] = {
+        "label": args.label,
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "models": args.models,
+        "result_cache": args.cache,
+        "clickbait_backend": os.getenv("CLICKBAIT_BACKEND", "torch"),
+    }
+    try:
+        import torch
+
+        meta["torch"] = torch.__version__
+        meta["torch_threads"] = torch.get_num_threads()
+    except ImportError:
+        pass
+    return meta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks and in-process load tests")
+    parser.add_argument("--layer", choices=("micro", "macro", "all"), default="all")
+    parser.add_argument("--models", choices=("standin", "real"), default="standin")
+    parser.add_argument("--standin-dir", type=Path, default=DEFAULT_DIR)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per micro-benchmark case")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint in the load test")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--endpoint", action="append", help="Load-test only these endpoints (repeatable)")
+    parser.add_argument("--cache", action="store_true", help="Keep the result cache enabled")
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output", type=Path, help="Write results here (JSON); printed when omitted")
+    args = parser.parse_args()
+
+    # Configuration is read at import time, so the environment is set before
+    # anything under src/ is imported
+    code_dir = Path(__file__).resolve().parents[1] / "code"
+    os.environ.setdefault("CLICKBAIT_MODULE_PATH", str(code_dir / "klikbait/predict.py"))
+    os.environ.setdefault("WATER_MODULE_PATH", str(code_dir / "water/water_analyzer.py"))
+    if args.models == "standin":
+        os.environ.update(build_standins(args.standin_dir))
+    if not args.cache:
+        os.environ["RESULT_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("FETCH_CACHE_ENABLED", "false")
+
+    from bench.macro import run_macro
+    from bench.micro import run_micro
+
+    results: Dict[str, Any] = {"meta": _meta(args)}
+    if args.layer in ("micro", "all"):
+        results["micro"] = run_micro(args.repeat)
+    if args.layer in ("macro", "all"):
+        results["macro"] = run_macro(args.requests, args.concurrency, args.endpoint)
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+        print(f"results written to {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Small stand-in models so benchmarks run without the production checkpoints:
+tiny randomly initialised BERT classifiers for clickbait and sentiment (same
+labels as the real ones, vocabulary built from the benchmark corpus) and a
+linear water-quality regressor fitted on the corpus features. Scores are
+meaningless; shapes, tokenization and code paths are the real ones.
+
+    python -m bench.standin_models --output /tmp/news-analysis-bench-models
+"""
+import argparse
+import importlib.util
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bench.corpus import ARTICLES, HEADLINES, WATER_TEXTS
+
+DEFAULT_DIR = Path(os.getenv("BENCH_STANDIN_DIR", "/tmp/news-analysis-bench-models"))
+
+CLICKBAIT_LABELS = {0: "не кликбейт", 1: "кликбейт"}
+SENTIMENT_LABELS = {0: "NEGATIVE", 1: "NEUTRAL", 2: "POSITIVE"}
+_SPECIAL = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+_VERSION = 1  # bump to rebuild existing stand-ins
+
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def _pre_tokenize(text: str) -> List[str]:
+    # Same normalisation as the uncased BERT pre-tokenizer: lowercase, strip accents
+    text = unicodedata.normalize("NFD", text.lower())
+    text = "".join(c for c in text if unicodedata.category(c) != "Mn")
+    return _WORD_RE.findall(text)
+
+
+def _vocabulary(texts: List[str], max_words: int = 2000) -> List[str]:
+    # Characters cover every word as "##"-pieces, frequent words get their own ids
+    words = [w for text in texts for w in _pre_tokenize(text)]
+    chars = sorted({c for w in words for c in w})
+    frequent = [w for w, _ in Counter(words).most_common(max_words) if len(w) > 1]
+    return _SPECIAL + chars + [f"##{c}" for c in chars] + frequent
+
+
+def _build_bert(output: Path, labels: Dict[int, str], seed: int) -> None:
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    output.mkdir(parents=True, exist_ok=True)
+    vocab = _vocabulary(HEADLINES + ARTICLES + WATER_TEXTS)
+    vocab_file = output / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab) + "\n", encoding="utf-8")
+    tokenizer = BertTokenizerFast.from_pretrained(str(output), do_lower_case=True)
+
+    torch.manual_seed(seed)
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        max_position_embeddings=512,
+        num_labels=len(labels),
+        id2label=labels,
+        label2id={v: k for k, v in labels.items()},
+    )
+    BertForSequenceClassification(config).eval().save_pretrained(output)
+    tokenizer.save_pretrained(output)
+
+
+def _build_water(output: Path, module_path: Path) -> None:
+    import joblib
+    import numpy as np
+    from sklearn.linear_model import LinearRegression
+
+    spec = importlib.util.spec_from_file_location("water_analyzer", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+
+    analyzer = module.WaterAnalyzer(model_path=None)
+    X = analyzer.features_matrix([analyzer.extract_features(text) for text in WATER_TEXTS])
+    rng = np.random.default_rng(0)
+    model = LinearRegression().fit(X, rng.uniform(0.0, 1.0, size=len(WATER_TEXTS)))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(model, output)
+
+
+def build_standins(output_dir: Path = DEFAULT_DIR, water_module: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Build (or reuse) the stand-in models under `output_dir` and return the
+    environment variables pointing the service at them.
+    """
+    if water_module is None:
+        water_module = Path(__file__).resolve().parents[1] / "code/water/water_analyzer.py"
+    output_dir = Path(output_dir)
+    marker = output_dir / "standins.json"
+    paths = {
+        "CLICKBAIT_MODEL_PATH": output_dir / "clickbait",
+        "SENTIMENT_MODEL_PATH": output_dir / "sentiment",
+        "WATER_MODEL_PATH": output_dir / "water.pkl",
+    }
+    env = {name: str(path) for name, path in paths.items()}
+
+    if marker.exists() and json.loads(marker.read_text(encoding="utf-8")).get("version") == _VERSION:
+        return env
+
+    _build_bert(paths["CLICKBAIT_MODEL_PATH"], CLICKBAIT_LABELS, seed=1)
+    _build_bert(paths["SENTIMENT_MODEL_PATH"], SENTIMENT_LABELS, seed=2)
+    _build_water(paths["WATER_MODEL_PATH"], water_module)
+    marker.write_text(json.dumps({"version": _VERSION, **env}), encoding="utf-8")
+    return env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build stand-in models for benchmarks")
+    parser.add_argument("--output", type=Path, default=DEFAULT_DIR)
+    args = parser.parse_args()
+    print(json.dumps(build_standins(args.output), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Local stand-in for news sites: an asyncio HTTP server that serves a fixed
+Russian article for any path, with configurable latency, slow-tail and error
+rates. Lets the async fetch path be load-tested without network access.
+
+    python -m bench.stub_upstream --port 8081 --latency-ms 50 --jitter-ms 20
+"""
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+
+ARTICLE_HTML = """<!doctype html>
+<html lang="ru"><head>
+<meta charset="utf-8">
+<title>Власти города объявили о запуске новой транспортной программы</title>
+<meta property="og:title" content="Власти города объявили о запуске новой транспортной программы">
+<meta property="article:published_time" content="2026-10-16T09:30:00+03:00">
+<meta name="author" content="Анна Смирнова">
+</head><body><article>
+<h1>Власти города объявили о запуске новой транспортной программы</h1>
+<p>Мэрия представила программу обновления общественного транспорта на ближайшие пять лет.
+По словам вице-мэра, «новые автобусы выйдут на линии уже весной».</p>
+<p>Эксперты отмечают, что проект потребует значительных вложений. «Без поддержки федерального
+бюджета сроки могут сдвинуться», — заявил директор транспортного института.</p>
+<p>Жители в целом положительно оценили инициативу, однако попросили уделить внимание окраинам.</p>
+</article></body></html>
+"""
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    active: int = 0
+    peak_active: int = 0
+    peak_active_by_host: dict = field(default_factory=dict)
+    _active_by_host: dict = field(default_factory=dict)
+
+
+class StubUpstream:
+    def __init__(
+        self,
+        latency_ms: float = 20.0,
+        jitter_ms: float = 10.0,
+        slow_rate: float = 0.0,
+        slow_ms: float = 1000.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = 0,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.stats = StubStats()
+        self._servers: List[asyncio.AbstractServer] = []
+        self.port: Optional[int] = None
+
+    async def start(self, hosts: Sequence[str] = ("127.0.0.1",), port: int = 0) -> int:
+        """
+        Listen on every address in `hosts` on one port (picked by the OS when 0).
+        Several loopback addresses let clients see several distinct hosts.
+        """
+        for host in hosts:
+            server = await asyncio.start_server(self._handle, host, port)
+            port = server.sockets[0].getsockname()[1]
+            self._servers.append(server)
+        self.port = port
+        return port
+
+    async def stop(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        host = ""
+        try:
+            request_line = await reader.readline()
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "host":
+                    host = value.strip()
+
+            stats = self.stats
+            stats.requests += 1
+            stats.active += 1
+            stats.peak_active = max(stats.peak_active, stats.active)
+            by_host = stats._active_by_host
+            by_host[host] = by_host.get(host, 0) + 1
+            stats.peak_active_by_host[host] = max(stats.peak_active_by_host.get(host, 0), by_host[host])
+            try:
+                delay = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+                if self.random.random() < self.slow_rate:
+                    delay = self.slow_ms
+                await asyncio.sleep(max(0.0, delay) / 1000.0)
+
+                if b" /redirect" in request_line:
+                    writer.write(b"HTTP/1.1 302 Found\r\nLocation: /article\r\nContent-Length: 0\r\n\r\n")
+                elif self.random.random() < self.error_rate:
+                    writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n")
+                else:
+                    body = ARTICLE_HTML.encode("utf-8")
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\n"
+                        b"Content-Type: text/html; charset=utf-8\r\n"
+                        + f"Content-Length: {len(body)}\r\n".encode("ascii")
+                        + b"Connection: close\r\n\r\n"
+                        + body
+                    )
+                await writer.drain()
+            finally:
+                stats.active -= 1
+                by_host[host] -= 1
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    stub = StubUpstream(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        error_rate=args.error_rate,
+    )
+    port = await stub.start([args.host], args.port)
+    print(f"stub upstream listening on http://{args.host}:{port}/")
+    await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub news upstream for fetch load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Share of requests served after --slow-ms")
+    parser.add_argument("--slow-ms", type=float, default=1000.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    asyncio.run(_serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
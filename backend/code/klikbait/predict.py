@@ -1,5 +1,10 @@
+from typing import Dict, Iterable, List, Optional
+
+import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
 
+CLICKBAIT_LABEL = "кликбейт"
+
 
 class ClickbaitDetector:
 
@@ -36,8 +41,51 @@ class ClickbaitDetector:
         return result
 
     def predict_batch(self, texts):
-        return self.classifier(texts)
+        texts = list(texts)
+        if not texts:
+            return []
+        # One padded forward pass for the whole list instead of one call per text
+        return self.classifier(texts, batch_size=len(texts), truncation=True)
+
+    def score(self, text: str, thresholds: Optional[Iterable[float]] = None) -> Dict:
+        return self.score_batch([text], thresholds=thresholds)[0]
+
+    def score_batch(self, texts, thresholds: Optional[Iterable[float]] = None) -> List[Dict]:
+        """
+        Score texts with a single forward pass and return, for each text, the top
+        label and score (same as `predict`), the probability of every label and,
+        when `thresholds` are given, the clickbait decision at each threshold.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        thresholds = list(thresholds) if thresholds is not None else None
+
+        encoded = self.tokenizer(texts, padding=True, truncation=True, return_tensors="pt")
+        with torch.no_grad():
+            logits = self.model(**encoded).logits
+        if logits.shape[-1] == 1:
+            probs = torch.sigmoid(logits)
+        else:
+            probs = torch.softmax(logits, dim=-1)
+
+        id2label = self.model.config.id2label
+        results = []
+        for row in probs.tolist():
+            top = max(range(len(row)), key=row.__getitem__)
+            result = {
+                "label": id2label[top],
+                "score": row[top],
+                "probabilities": {id2label[i]: p for i, p in enumerate(row)},
+            }
+            if thresholds is not None:
+                result["decisions"] = {t: self.decide(result, t) for t in thresholds}
+            results.append(result)
+        return results
+
+    @staticmethod
+    def decide(result: Dict, threshold: float = 0.5) -> bool:
+        return result["label"] == CLICKBAIT_LABEL and result["score"] >= threshold
 
     def is_clickbait(self, text: str, threshold: float = 0.5) -> bool:
-        result = self.predict(text)
-        return result["label"] == "кликбейт" and result["score"] >= threshold
+        return self.decide(self.score(text), threshold)
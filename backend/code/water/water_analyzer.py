@@ -1,18 +1,141 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Iterable, Iterator, Optional, Tuple, List
 import re
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 import joblib
+import numpy as np
 import pandas as pd
 import pymorphy3
-from collections import Counter
+from collections import Counter, OrderedDict
 
 warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
 
+WORD_RE = re.compile(r'\b[а-яА-ЯёЁ]+\b')
+
+
+class MorphCache:
+    """
+    Bounded, thread-safe LRU cache of (normal_form, POS) keyed by lowercased
+    surface form, shared by all feature extractors and across requests.
+    """
+
+    def __init__(self, morph, maxsize: int = 100_000):
+        self.morph = morph
+        self.maxsize = max(0, maxsize)
+        self._entries: "OrderedDict[str, Tuple[str, Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _parse(self, key: str) -> Tuple[str, Optional[str]]:
+        parsed = self.morph.parse(key)[0]
+        return parsed.normal_form, parsed.tag.POS
+
+    def lookup(self, word: str) -> Tuple[str, Optional[str]]:
+        key = word.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._parse(key)
+        self._store(key, entry)
+        return entry
+
+    def normal_form(self, word: str) -> str:
+        return self.lookup(word)[0]
+
+    def pos(self, word: str) -> Optional[str]:
+        return self.lookup(word)[1]
+
+    def _store(self, key: str, entry: Tuple[str, Optional[str]]) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def seed(self, words: Iterable[str]) -> int:
+        count = 0
+        for word in words:
+            key = word.strip().lower()
+            if not key or count >= self.maxsize:
+                continue
+            self._store(key, self._parse(key))
+            count += 1
+        return count
+
+    def seed_from_file(self, path: str, top_n: Optional[int] = None) -> int:
+        """
+        Seed from a frequency table: one word form per line, most frequent first,
+        optionally followed by a tab and its count.
+        """
+        def words():
+            with open(path, encoding="utf-8") as fh:
+                for idx, line in enumerate(fh):
+                    if top_n is not None and idx >= top_n:
+                        break
+                    yield line.split("\t", 1)[0]
+
+        return self.seed(words())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def build_morph_seed_table(texts: Iterable[str], output_path: str, top_n: int = 50_000) -> int:
+    """
+    Write the `top_n` most frequent word forms of a corpus as a table for
+    `MorphCache.seed_from_file`.
+    """
+    counts = Counter()
+    for text in texts:
+        counts.update(w.lower() for w in WORD_RE.findall(str(text)))
+    most_common = counts.most_common(top_n)
+    with open(output_path, "w", encoding="utf-8") as fh:
+        for word, count in most_common:
+            fh.write(f"{word}\t{count}\n")
+    return len(most_common)
+
+
+# Feature-only analyzer living in each process-pool worker (see `_init_feature_worker`).
+_worker_analyzer = None
+
+
+def _init_feature_worker(morph_cache_size: int) -> None:
+    global _worker_analyzer
+    _worker_analyzer = WaterAnalyzer(model_path=None, morph_cache_size=morph_cache_size)
+
+
+def _extract_features_chunk(texts: List[str]) -> List[Dict[str, float]]:
+    return [_worker_analyzer.extract_features(text) for text in texts]
+
 
 class WaterAnalyzer:
-    def __init__(self, model_path: str = "ruber_quality_model.pkl"):
-        self.model = joblib.load(model_path)
+    def __init__(self, model_path: Optional[str] = "ruber_quality_model.pkl",
+                 morph_cache_size: int = 100_000,
+                 morph_seed_path: Optional[str] = None,
+                 morph_seed_top_n: Optional[int] = None):
+        # model_path=None builds a feature-extraction-only analyzer
+        self.model = joblib.load(model_path) if model_path else None
         self.morph = pymorphy3.MorphAnalyzer()
+        self.morph_cache = MorphCache(self.morph, maxsize=morph_cache_size)
+        if morph_seed_path:
+            self.morph_cache.seed_from_file(morph_seed_path, top_n=morph_seed_top_n)
 
         self.feature_names = [
             "readability_index",
@@ -27,10 +150,10 @@ class WaterAnalyzer:
     
     def analyze_text_simple(self, text: str) -> Tuple[int, int, int]:
         raw_sentences = re.split(r'[.!?…]+', text)
-        words = re.findall(r'\b[а-яА-ЯёЁ]+\b', text)
+        words = WORD_RE.findall(text)
         syllables = 0
         for word in words:
-            normal_word = self.morph.parse(word)[0].normal_form
+            normal_word = self.morph_cache.normal_form(word)
             syllables += self.count_syllables(normal_word)
         cleaned_sentences = []
         for s in raw_sentences:
@@ -48,11 +171,11 @@ class WaterAnalyzer:
         return round(index, 2)
     
     def pos_ratios(self, text: str) -> Tuple[float, float]:
-        words = re.findall(r'\b[а-яА-ЯёЁ]+\b', text)
+        words = WORD_RE.findall(text)
         pos = Counter()
         
         for w in words:
-            p = self.morph.parse(w)[0].tag.POS
+            p = self.morph_cache.pos(w)
             pos[p] += 1
         
         total = sum(pos.values())
@@ -65,7 +188,7 @@ class WaterAnalyzer:
         return adj / total, adv / total
     
     def repetition_ratio(self, text: str) -> float:
-        words = re.findall(r'\b[а-яА-ЯёЁ]+\b', text.lower())
+        words = WORD_RE.findall(text.lower())
         if not words:
             return 0.0
         
@@ -84,18 +207,42 @@ class WaterAnalyzer:
             "repetition_ratio": rep_r
         }
     
-    def predict(self, text: str, return_proba: bool = False) -> Dict:
-        features = self.extract_features(text)
-        X = pd.DataFrame([features])[self.feature_names].values
-        
+    def extract_features_many(self, texts: List[str],
+                              pool: Optional[ProcessPoolExecutor] = None,
+                              workers: int = 1) -> List[Dict[str, float]]:
+        if pool is None or len(texts) < 2:
+            return [self.extract_features(text) for text in texts]
+
+        # A few slices per worker keeps the pool busy without tiny tasks
+        step = max(1, -(-len(texts) // (workers * 4)))
+        slices = [texts[i:i + step] for i in range(0, len(texts), step)]
+        features = []
+        for part in pool.map(_extract_features_chunk, slices):
+            features.extend(part)
+        return features
+
+    def features_matrix(self, features: List[Dict[str, float]]) -> np.ndarray:
+        return np.array(
+            [[f[name] for name in self.feature_names] for f in features],
+            dtype=float,
+        ).reshape(len(features), len(self.feature_names))
+
+    def score_matrix(self, X: np.ndarray) -> np.ndarray:
+        """
+        Water probability for every row of a feature matrix in one model call.
+        """
+        if len(X) == 0:
+            return np.zeros(0)
         try:
-            proba_all = self.model.predict(X)
-            water_proba = float(proba_all[0])
+            proba = np.asarray(self.model.predict(X), dtype=float).reshape(-1)
         except Exception:
-            proba_all = self.model.predict_proba(X)[0]
-            water_proba = float(proba_all[0]) if len(proba_all) > 0 else 0.0
+            proba_all = np.asarray(self.model.predict_proba(X), dtype=float)
+            proba = proba_all[:, 0] if proba_all.shape[1] > 0 else np.zeros(len(X))
+        return np.clip(proba, 0.0, 1.0)
 
-        water_proba = max(0.0, min(1.0, water_proba))
+    def _result(self, text: str, features: Dict[str, float], water_proba: float,
+                return_proba: bool) -> Dict:
+        water_proba = float(water_proba)
         is_water = bool(water_proba >= 0.5)
         label = "ВОДА" if is_water else "НЕ ВОДА"
 
@@ -115,6 +262,19 @@ class WaterAnalyzer:
             }
         
         return result
+
+    def predict_many(self, texts: List[str], return_proba: bool = False,
+                     pool: Optional[ProcessPoolExecutor] = None,
+                     workers: int = 1) -> List[Dict]:
+        features = self.extract_features_many(texts, pool=pool, workers=workers)
+        probas = self.score_matrix(self.features_matrix(features))
+        return [
+            self._result(text, f, p, return_proba)
+            for text, f, p in zip(texts, features, probas)
+        ]
+
+    def predict(self, text: str, return_proba: bool = False) -> Dict:
+        return self.predict_many([text], return_proba=return_proba)[0]
     
     def interpret_features(self, features: Dict[str, float]) -> Dict[str, str]:
         interpretations = {}
@@ -163,42 +323,78 @@ class WaterAnalyzer:
         
         return result
     
-    def analyze_batch(self, texts: List[str]) -> List[Dict]:
-        results = []
-        for text in texts:
-            results.append(self.analyze(text, detailed=True))
+    def analyze_batch(self, texts: List[str], detailed: bool = True) -> List[Dict]:
+        results = self.predict_many(list(texts), return_proba=True)
+        if detailed:
+            for result in results:
+                result["interpretations"] = self.interpret_features(result["features"])
         return results
+
+    def iter_csv(self, csv_path: str, text_column: str = "text",
+                 chunk_size: int = 10_000, workers: int = 0) -> Iterator[pd.DataFrame]:
+        """
+        Read the CSV in chunks and yield each chunk with prediction and feature
+        columns added. Features of a chunk are extracted together (in a process
+        pool when `workers` > 1) and scored with one `model.predict` call.
+        """
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_feature_worker,
+                initargs=(self.morph_cache.maxsize,),
+            )
+        try:
+            for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+                if text_column not in chunk.columns:
+                    raise ValueError(f"Column '{text_column}' not found")
+
+                texts = chunk[text_column].fillna("").astype(str).tolist()
+                features = self.extract_features_many(texts, pool=pool, workers=workers)
+                X = self.features_matrix(features)
+                water_proba = self.score_matrix(X)
+                is_water = water_proba >= 0.5
+
+                chunk["is_water"] = is_water
+                chunk["water_label"] = np.where(is_water, "ВОДА", "НЕ ВОДА")
+                chunk["confidence"] = water_proba
+                chunk["water_probability"] = water_proba
+                for idx, feature in enumerate(self.feature_names):
+                    chunk[feature] = X[:, idx]
+                yield chunk
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def stream_csv(self, csv_path: str, output_path: str, text_column: str = "text",
+                   chunk_size: int = 10_000, workers: int = 0) -> int:
+        """
+        Analyze a CSV of any size in constant memory, appending each scored chunk
+        to `output_path`. Returns the number of rows written.
+        """
+        rows = 0
+        for idx, chunk in enumerate(self.iter_csv(csv_path, text_column, chunk_size, workers)):
+            if idx == 0:
+                chunk.to_csv(output_path, index=False, encoding='utf-8-sig')
+            else:
+                chunk.to_csv(output_path, index=False, header=False, mode='a', encoding='utf-8')
+            rows += len(chunk)
+        return rows
     
     def analyze_csv(self, csv_path: str, text_column: str = "text", 
-                    output_path: str = None) -> pd.DataFrame:
-        df = pd.read_csv(csv_path)
-        
-        if text_column not in df.columns:
-            raise ValueError(f"Column '{text_column}' not found")
-        
-        results = []
-        for text in df[text_column]:
-            result = self.predict(text, return_proba=True)
-            results.append(result)
-        
-        is_water_values = []
-        water_label_values = []
-        confidence_values = []
-        water_prob_values = []
-        for r in results:
-            is_water_values.append(r["is_water"])
-            water_label_values.append(r["water_label"])
-            confidence_values.append(r["confidence"])
-            water_prob_values.append(r["probabilities"]["water"])
-        df["is_water"] = is_water_values
-        df["water_label"] = water_label_values
-        df["confidence"] = confidence_values
-        df["water_probability"] = water_prob_values
-        for feature in self.feature_names:
-            feature_values = []
-            for r in results:
-                feature_values.append(r["features"][feature])
-            df[feature] = feature_values
+                    output_path: str = None, chunk_size: int = 10_000,
+                    workers: int = 0) -> pd.DataFrame:
+        """
+        Same engine as `stream_csv`, but also returns the whole result as one
+        DataFrame. Use `stream_csv` for corpora that don't fit in memory.
+        """
+        chunks = list(self.iter_csv(csv_path, text_column, chunk_size, workers))
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.read_csv(csv_path)
+            if text_column not in df.columns:
+                raise ValueError(f"Column '{text_column}' not found")
         
         if output_path:
             df.to_csv(output_path, index=False, encoding='utf-8-sig')
@@ -1,8 +1,40 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
 
 from src.api.routes import router as analyze_router
 from src.api.routes_clickbait import router as clickbait_router
+from src.api.routes_jobs import router as jobs_router
+from src.api.routes_models import router as models_router
 from src.api.routes_water import router as water_router
+from src.api.profiling import ProfilingMiddleware
+from src.api.timing import TimingMiddleware
+from src.lib.jobs_config import JOBS_ENABLED
+from src.lib.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics
+from src.lib.server_config import MODEL_WARMUP_ENABLED
+from src.services.async_fetcher import async_fetch_stats
+from src.services.executor import executor_stats, shutdown_executors
+from src.services.fetcher import fetch_cache_stats, parser_pool_stats
+from src.services.jobs import start_job_workers, stop_job_workers
+from src.services.models import readiness, start_warm_up
+from src.services.result_cache import result_cache_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start loading and warming all models in parallel as soon as the server starts,
+    and the workers draining the job queue.
+    """
+    if MODEL_WARMUP_ENABLED:
+        start_warm_up()
+    if JOBS_ENABLED:
+        start_job_workers()
+    yield
+    if JOBS_ENABLED:
+        stop_job_workers()
+    shutdown_executors(wait=False)
 
 
 def create_app() -> FastAPI:
@@ -12,15 +44,51 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="News Analysis API",
         version="0.1.0",
+        lifespan=lifespan,
     )
+    app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(TimingMiddleware)
 
     @app.get("/health", tags=["health"])
     async def health() -> dict:
         return {"status": "ok"}
 
+    @app.get("/ready", tags=["health"])
+    async def ready() -> JSONResponse:
+        """
+        Report per-model readiness and load/warm-up times; 503 until the required
+        models are warm. A failed optional model answers 200 with status "degraded".
+        With warm-up disabled models load lazily and the service is always ready.
+        """
+        report = readiness()
+        if not MODEL_WARMUP_ENABLED:
+            report.update(ready=True, status="ready")
+        return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+    @app.get("/executor/stats", tags=["health"])
+    async def inference_executor_stats() -> dict:
+        return executor_stats()
+
+    @app.get("/cache/stats", tags=["health"])
+    async def cache_stats() -> dict:
+        return {"results": result_cache_stats(), "fetch": fetch_cache_stats()}
+
+    @app.get("/fetch/stats", tags=["health"])
+    async def fetch_stats() -> dict:
+        return {"parser_pool": parser_pool_stats(), "async": async_fetch_stats()}
+
+    @app.get("/metrics", tags=["health"], include_in_schema=False)
+    async def metrics() -> Response:
+        """
+        Prometheus text exposition of stage, request, queue and model metrics for this process.
+        """
+        return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
     app.include_router(analyze_router)
     app.include_router(clickbait_router)
     app.include_router(water_router)
+    app.include_router(jobs_router)
+    app.include_router(models_router)
 
     return app
 
@@ -1,17 +1,156 @@
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
 import uvicorn
+from uvicorn.config import STARTUP_FAILURE
+
+from src.lib.server_config import (
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+    WORKER_TORCH_THREADS,
+)
+from src.lib.torch_threads import pin_torch_threads_before_fork, set_worker_torch_threads
 
 from .app import app
 
 
+logger = logging.getLogger(__name__)
+
+
+def memory_usage() -> Dict[str, int]:
+    """
+    Return RSS/PSS and shared/private memory of the current process in KiB.
+    PSS splits shared copy-on-write pages between the processes mapping them,
+    so summing PSS across workers gives the real footprint; RSS overcounts.
+    """
+    usage: Dict[str, int] = {}
+    try:
+        with open("/proc/self/smaps_rollup", encoding="ascii") as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                if key in ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"):
+                    usage[key.lower()] = int(rest.split()[0])
+    except OSError:  # pragma: no cover - non-Linux
+        pass
+    return usage
+
+
+def _serve_worker(sock: socket.socket, index: int) -> int:
+    """
+    Run one uvicorn worker on the shared socket and return its exit status.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    set_worker_torch_threads(WORKER_TORCH_THREADS)
+    logger.info("worker %d (pid %d) started, memory %s", index, os.getpid(), memory_usage())
+
+    config = uvicorn.Config(app, host=SERVER_HOST, port=SERVER_PORT, reload=False)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    # uvicorn returns normally when the app fails to start (e.g. lifespan error)
+    return 0 if server.started else STARTUP_FAILURE
+
+
+def run_prefork(workers: int) -> int:
+    """
+    Load all models in this master process, then fork `workers` uvicorn workers
+    that share one listening socket and the model weights copy-on-write.
+    Dead workers are restarted; SIGTERM/SIGINT are forwarded to all workers.
+    Returns the exit status: 1 when a worker failed while shutting down.
+    """
+    from src.services.models import preload_models
+
+    logging.basicConfig(level=logging.INFO)
+    # Keep the master single-threaded in torch; workers restore their own count
+    pin_torch_threads_before_fork()
+    loaded = preload_models()
+    # Move everything allocated so far out of the GC's reach so collections in
+    # the workers don't touch (and copy) the shared pages.
+    gc.collect()
+    gc.freeze()
+    logger.info("master (pid %d) preloaded %s, memory %s", os.getpid(), loaded, memory_usage())
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((SERVER_HOST, SERVER_PORT))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children: Dict[int, int] = {}
+    stopping = False
+    exit_status = 0
+
+    def spawn(index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                status = _serve_worker(sock, index)
+            except SystemExit as exc:
+                status = exc.code if isinstance(exc.code, int) else 1
+            except BaseException:
+                logger.exception("worker %d crashed", index)
+            finally:
+                # Skip the master's atexit handlers, but report the real status
+                os._exit(status)
+        children[pid] = index
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for index in range(workers):
+        spawn(index)
+
+    while children:
+        try:
+            pid, wait_status = os.wait()
+        except ChildProcessError:
+            break
+        status = os.waitstatus_to_exitcode(wait_status)
+        index = children.pop(pid, None)
+        if index is None:
+            continue
+        if stopping:
+            # A clean shutdown ends in status 0 (or SIGTERM before uvicorn took over)
+            if status not in (0, -signal.SIGTERM):
+                logger.warning("worker %d (pid %d) exited with status %d", index, pid, status)
+                exit_status = 1
+            continue
+        logger.warning("worker %d (pid %d) exited with status %d, restarting", index, pid, status)
+        time.sleep(1.0)
+        spawn(index)
+
+    sock.close()
+    return exit_status
+
+
 def run() -> None:
+    if SERVER_WORKERS > 1:
+        sys.exit(run_prefork(SERVER_WORKERS))
+
     uvicorn.run(
         app,
-        host="0.0.0.0",
-        port=8000,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
         reload=False,
     )
 
 
 if __name__ == "__main__":
     run()
-
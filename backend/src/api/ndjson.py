@@ -0,0 +1,65 @@
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from src.services.executor import run_inference
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _validation_messages(exc: ValidationError) -> List[str]:
+    messages = []
+    for error in exc.errors():
+        loc = ".".join(str(part) for part in error.get("loc", ()))
+        messages.append(f"{loc}: {error['msg']}" if loc else error["msg"])
+    return messages
+
+
+async def stream_batch(
+    items: List[Any],
+    request_model: Type[BaseModel],
+    line_model: Type[BaseModel],
+    family: str,
+    batch_fn: Callable[[List[BaseModel]], List[BaseModel]],
+    chunk_size: int,
+) -> AsyncIterator[str]:
+    """
+    Validate every item on its own, score valid items `chunk_size` at a time through
+    `batch_fn` on the family's executor and yield one NDJSON line per item, in input
+    order, as soon as its chunk is scored. Identical items are computed once.
+    """
+    validated: List[Optional[BaseModel]] = []
+    errors: Dict[int, List[str]] = {}
+    for index, item in enumerate(items):
+        try:
+            validated.append(request_model.model_validate(item))
+        except ValidationError as exc:
+            validated.append(None)
+            errors[index] = _validation_messages(exc)
+
+    computed: Dict[str, BaseModel] = {}
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(items), chunk_size):
+        chunk = range(start, min(start + chunk_size, len(items)))
+
+        pending: Dict[str, BaseModel] = {}
+        for index in chunk:
+            request = validated[index]
+            if request is None:
+                continue
+            key = request.model_dump_json()
+            if key not in computed:
+                pending.setdefault(key, request)
+
+        if pending:
+            responses = await run_inference(family, batch_fn, list(pending.values()))
+            computed.update(zip(pending.keys(), responses))
+
+        for index in chunk:
+            request = validated[index]
+            if request is None:
+                line = line_model(index=index, errors=errors[index])
+            else:
+                line = line_model(index=index, result=computed[request.model_dump_json()])
+            yield line.model_dump_json(exclude_none=True) + "\n"
@@ -0,0 +1,86 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.lib.profiling import (
+    choose_mode,
+    current_profile_request,
+    reset_profile_request,
+    start_profile_request,
+)
+from src.lib.profiling_config import PROFILING_ENABLED, PROFILING_HEADER
+
+
+class ProfilingMiddleware:
+    """
+    Mark requests selected for profiling (by header or sampling). The handler's
+    inference call is profiled on its executor thread; the response then carries
+    X-Profile-File with the written profile, or, for "inline", the text report
+    replaces the response body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        mode = choose_mode(Headers(scope=scope).get(PROFILING_HEADER))
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = start_profile_request(mode)
+        try:
+            if mode == "inline":
+                await self._inline(scope, receive, send)
+            else:
+                await self.app(scope, receive, self._with_profile_headers(send))
+        finally:
+            reset_profile_request(token)
+
+    def _with_profile_headers(self, send: Send) -> Send:
+        async def wrapped(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                request = current_profile_request()
+                headers = list(message.get("headers", []))
+                if request is not None and request.path:
+                    headers.append((b"x-profile-file", request.path.encode()))
+                if request is not None and request.skipped:
+                    headers.append((b"x-profile-skipped", request.skipped.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        return wrapped
+
+    async def _inline(self, scope: Scope, receive: Receive, send: Send) -> None:
+        start: dict = {}
+        body = bytearray()
+
+        async def buffer(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                body.extend(message.get("body", b""))
+
+        await self.app(scope, receive, buffer)
+
+        request = current_profile_request()
+        if request is None or request.report is None:
+            # Nothing was profiled (no inference call, or another profile was running)
+            headers = list(start.get("headers", []))
+            if request is not None and request.skipped:
+                headers.append((b"x-profile-skipped", request.skipped.encode()))
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": bytes(body)})
+            return
+
+        report = request.report.encode()
+        headers = [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(report)).encode()),
+            (b"x-profile-original-status", str(start.get("status", 500)).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": report})
@@ -1,7 +1,11 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
 from src.api.schemas import AnalyzeRequest, AnalyzeResponse
-from src.services.analyzer import analyze_request
+from src.api.sse import SSE_HEADERS, SSE_MEDIA_TYPE, stream_events
+from src.services.analyzer import analyze_request_async, prepare_analysis_stream
+from src.services.model_registry import registry
+from src.services.sentiment_batch import get_padding_stats
 
 
 router = APIRouter()
@@ -13,11 +17,33 @@ async def analysis_endpoint(payload: AnalyzeRequest) -> AnalyzeResponse:
     Analyze news content from URL or raw text and return structured article
     fields, freshness, and sentiment.
     """
-    return analyze_request(payload)
+    return await analyze_request_async(payload)
+
+
+@router.post("/analysis/stream", tags=["analysis"])
+async def analysis_stream_endpoint(payload: AnalyzeRequest) -> StreamingResponse:
+    """
+    Same analysis as /analysis, streamed as server-sent events while it runs:
+    article, freshness, quotes, main_sentiment, one quote_sentiment per quote,
+    then result with the complete AnalyzeResponse (or error if a step fails).
+    """
+    events = await prepare_analysis_stream(payload)
+    return StreamingResponse(stream_events(events), media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS)
 
 
 # Backward compatibility for previous /analyze path
 @router.post("/analyze", response_model=AnalyzeResponse, tags=["analysis"])
 async def analyze_endpoint(payload: AnalyzeRequest) -> AnalyzeResponse:  # pragma: no cover
-    return analyze_request(payload)
+    return await analyze_request_async(payload)
 
+
+
+@router.get("/sentiment/stats", tags=["analysis"])
+async def sentiment_stats_endpoint() -> dict:
+    """
+    Report tokens processed versus padded by batched sentiment inference, and
+    the batching mode the current model passed its parity check with.
+    """
+    handle = registry.peek("sentiment")
+    mode = getattr(handle.model, "batch_scoring_mode", None) if handle is not None else None
+    return {**get_padding_stats(), "batching_mode": mode}
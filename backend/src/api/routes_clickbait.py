@@ -1,7 +1,21 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
-from src.api.schemas_clickbait import ClickbaitAnalyzeRequest, ClickbaitAnalyzeResponse
-from src.services.clickbait_detector import analyze_clickbait
+from src.api.ndjson import NDJSON_MEDIA_TYPE, stream_batch
+from src.api.schemas_clickbait import (
+    ClickbaitAnalyzeRequest,
+    ClickbaitAnalyzeResponse,
+    ClickbaitBatchItemResult,
+    ClickbaitBatchRequest,
+)
+from src.lib.clickbait_config import CLICKBAIT_BATCH_MAX_SIZE
+from src.services.clickbait_detector import (
+    analyze_clickbait,
+    analyze_clickbait_batch,
+    get_backend_info,
+    get_batching_stats,
+)
+from src.services.executor import run_inference
 
 router = APIRouter()
 
@@ -11,4 +25,30 @@ async def clickbait_analyze_endpoint(payload: ClickbaitAnalyzeRequest) -> Clickb
     """
     Evaluate a headline and return clickbait status with confidence data.
     """
-    return analyze_clickbait(payload)
+    return await run_inference("clickbait", analyze_clickbait, payload)
+
+
+@router.post("/clickbait/analyze/batch", tags=["clickbait"])
+async def clickbait_analyze_batch_endpoint(payload: ClickbaitBatchRequest) -> StreamingResponse:
+    """
+    Evaluate many headlines. Streams one NDJSON line per item in input order
+    (`ClickbaitBatchItemResult`), with per-item validation errors.
+    """
+    lines = stream_batch(
+        payload.items,
+        request_model=ClickbaitAnalyzeRequest,
+        line_model=ClickbaitBatchItemResult,
+        family="clickbait",
+        batch_fn=analyze_clickbait_batch,
+        chunk_size=CLICKBAIT_BATCH_MAX_SIZE,
+    )
+    return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get("/clickbait/stats", tags=["clickbait"])
+async def clickbait_stats_endpoint() -> dict:
+    """
+    Report micro-batching batch-size and queue-wait statistics and the active
+    inference backend.
+    """
+    return {**get_batching_stats(), "backend": get_backend_info()}
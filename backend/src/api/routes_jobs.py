@@ -0,0 +1,48 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from src.api.schemas_jobs import JobCreateRequest, JobResponse
+from src.services.jobs import get_job, job_stats, parse_job_payload, submit_job
+
+router = APIRouter()
+
+# Plain `def` endpoints: the job queue is a blocking SQLite client, so FastAPI
+# runs them in its threadpool instead of on the event loop.
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED, tags=["jobs"])
+def create_job_endpoint(payload: JobCreateRequest) -> JobResponse:
+    """
+    Queue an analysis, clickbait or water request and return its job id at once.
+    The payload is validated now; poll GET /jobs/{job_id} for the result.
+    """
+    try:
+        request = parse_job_payload(payload.kind, payload.payload)
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", "payload", *error["loc"])} for error in exc.errors(include_url=False)]
+        raise RequestValidationError(errors) from exc
+    return JobResponse.from_row(submit_job(payload.kind, request))
+
+
+@router.get("/jobs/stats", tags=["jobs"])
+def job_stats_endpoint() -> dict:
+    """
+    Report job counts by status and the number of workers in this process.
+    """
+    return job_stats()
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse, tags=["jobs"])
+def get_job_endpoint(job_id: str) -> JobResponse:
+    """
+    Return the job's status, with the endpoint's response once it succeeded
+    or the error once it failed.
+    """
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "JOB_NOT_FOUND", "message": f"Job {job_id} not found"},
+        )
+    return JobResponse.from_row(job)
@@ -0,0 +1,121 @@
+import hmac
+import math
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException, status
+
+from src.api.schemas_models import ModelReloadRequest
+from src.lib.server_config import (
+    MODEL_RELOAD_ENABLED,
+    MODEL_RELOAD_MIN_INTERVAL_SECONDS,
+    MODEL_RELOAD_ROOT,
+    MODEL_RELOAD_TOKEN,
+    SERVER_WORKERS,
+)
+from src.services.model_registry import registry
+
+router = APIRouter()
+
+# Model name -> time.monotonic() of the last reload this process started
+_last_reload: Dict[str, float] = {}
+
+
+def _check_token(authorization: Optional[str]) -> None:
+    if MODEL_RELOAD_TOKEN is None:
+        return
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), MODEL_RELOAD_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"code": "UNAUTHORIZED", "message": "A valid reload token is required"},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def _check_rate(name: str) -> None:
+    last = _last_reload.get(name)
+    if last is None:
+        return
+    wait = MODEL_RELOAD_MIN_INTERVAL_SECONDS - (time.monotonic() - last)
+    if wait > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={"code": "RELOAD_RATE_LIMITED", "message": f"{name} was reloaded recently; retry in {wait:.0f}s"},
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
+
+
+def _checkpoint_path(path: Optional[str]) -> Optional[str]:
+    if path is None:
+        return None
+    if MODEL_RELOAD_ROOT is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "RELOAD_PATH_NOT_ALLOWED", "message": "Set MODEL_RELOAD_ROOT to reload from a new path"},
+        )
+    resolved = Path(path).resolve()
+    if not resolved.is_relative_to(Path(MODEL_RELOAD_ROOT).resolve()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "RELOAD_PATH_NOT_ALLOWED", "message": f"{path} is outside MODEL_RELOAD_ROOT"},
+        )
+    if not resolved.exists():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "CHECKPOINT_NOT_FOUND", "message": f"{path} does not exist"},
+        )
+    return str(resolved)
+
+
+@router.get("/models", tags=["models"])
+async def models_endpoint() -> dict:
+    """
+    Report the serving version of every model, retired versions still draining
+    in-flight requests, and the state of the last reload.
+    """
+    return registry.status()
+
+
+@router.post("/models/{name}/reload", status_code=status.HTTP_202_ACCEPTED, tags=["models"])
+async def reload_model_endpoint(
+    name: str,
+    payload: Optional[ModelReloadRequest] = None,
+    authorization: Optional[str] = Header(default=None),
+) -> dict:
+    """
+    Load a new version of a model in the background, warm it up and switch
+    traffic to it; the old version is freed after its in-flight requests.
+    Poll GET /models for progress. A reload applies to the process serving
+    the request, so it is refused in pre-fork mode (SERVER_WORKERS > 1),
+    where workers would end up serving different versions. Requires
+    MODEL_RELOAD_ENABLED (and the MODEL_RELOAD_TOKEN bearer token when set);
+    each model is reloaded at most once per MODEL_RELOAD_MIN_INTERVAL_SECONDS.
+    """
+    if not MODEL_RELOAD_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": "RELOAD_DISABLED", "message": "Model reload is disabled"},
+        )
+    _check_token(authorization)
+    if SERVER_WORKERS > 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "code": "RELOAD_UNSUPPORTED",
+                "message": "Reload switches one worker only; restart the server to change models when SERVER_WORKERS > 1",
+            },
+        )
+    if name not in registry.names():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "MODEL_NOT_FOUND", "message": f"Unknown model {name}"},
+        )
+    _check_rate(name)
+    payload = payload or ModelReloadRequest()
+    result = registry.reload(name, _checkpoint_path(payload.path), payload.version)
+    # Joining a reload already in progress does not use up the interval
+    if result["started"]:
+        _last_reload[name] = time.monotonic()
+    return result
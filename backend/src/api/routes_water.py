@@ -1,7 +1,20 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
-from src.api.schemas_water import WaterAnalyzeRequest, WaterAnalyzeResponse
-from src.services.water_detector import analyze_water
+from src.api.ndjson import NDJSON_MEDIA_TYPE, stream_batch
+from src.api.schemas_water import (
+    WaterAnalyzeRequest,
+    WaterAnalyzeResponse,
+    WaterBatchItemResult,
+    WaterBatchRequest,
+)
+from src.lib.water_config import WATER_BATCH_CHUNK_SIZE
+from src.services.executor import run_inference
+from src.services.water_detector import (
+    analyze_water,
+    analyze_water_batch,
+    get_morph_cache_stats,
+)
 
 router = APIRouter()
 
@@ -11,4 +24,29 @@ async def water_detection(payload: WaterAnalyzeRequest) -> WaterAnalyzeResponse:
     """
     Analyze text for water content and return label with confidence and optional feature signals.
     """
-    return analyze_water(payload)
+    return await run_inference("water", analyze_water, payload)
+
+
+@router.post("/water-detection/batch", tags=["water"])
+async def water_detection_batch(payload: WaterBatchRequest) -> StreamingResponse:
+    """
+    Analyze many texts. Streams one NDJSON line per item in input order
+    (`WaterBatchItemResult`), with per-item validation errors.
+    """
+    lines = stream_batch(
+        payload.items,
+        request_model=WaterAnalyzeRequest,
+        line_model=WaterBatchItemResult,
+        family="water",
+        batch_fn=analyze_water_batch,
+        chunk_size=WATER_BATCH_CHUNK_SIZE,
+    )
+    return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get("/water-detection/stats", tags=["water"])
+async def water_detection_stats() -> dict:
+    """
+    Report hit-rate statistics of the shared morphology cache.
+    """
+    return get_morph_cache_stats()
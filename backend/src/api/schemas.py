@@ -54,6 +54,16 @@ class FreshnessResult(BaseModel):
     source_date: Optional[str] = None
 
 
+class QuoteFound(BaseModel):
+    quote_text: str
+    position: int
+    author: Optional[str] = None
+
+
+class QuotesFound(BaseModel):
+    quotes: list[QuoteFound]
+
+
 class QuoteSentiment(BaseModel):
     quote_text: str
     sentiment_label: Literal["positive", "neutral", "negative"]
@@ -79,6 +89,7 @@ class AnalysisMeta(BaseModel):
     analysis_version: str
     analyzed_at: str
     seed: int
+    cached: bool = Field(default=False, description="True when served from the result cache.")
 
 
 class AnalyzeResponse(BaseModel):
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
+from src.lib.clickbait_config import CLICKBAIT_BATCH_ENDPOINT_MAX_ITEMS
+
 
 class ClickbaitAnalyzeRequest(BaseModel):
     headline: str = Field(..., min_length=5, max_length=200, description="Headline text to evaluate (trimmed).")
@@ -25,9 +27,27 @@ class ClickbaitAnalyzeResponse(BaseModel):
     contract_version: str
     detector_version: str
     evaluated_at: Optional[datetime] = None
+    cached: bool = Field(default=False, description="True when served from the result cache.")
 
 
 class ClickbaitErrorResponse(BaseModel):
     code: str
     message: str
     errors: Optional[list[str]] = None
+
+
+class ClickbaitBatchRequest(BaseModel):
+    items: list[Any] = Field(
+        ...,
+        min_length=1,
+        max_length=CLICKBAIT_BATCH_ENDPOINT_MAX_ITEMS,
+        description="ClickbaitAnalyzeRequest objects; each one is validated separately.",
+    )
+
+
+class ClickbaitBatchItemResult(BaseModel):
+    """One NDJSON line of the batch response: either a result or validation errors."""
+
+    index: int
+    result: Optional[ClickbaitAnalyzeResponse] = None
+    errors: Optional[list[str]] = None
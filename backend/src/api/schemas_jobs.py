@@ -0,0 +1,48 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+JobKind = Literal["analysis", "clickbait", "water"]
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobCreateRequest(BaseModel):
+    kind: JobKind = Field(..., description="analysis (AnalyzeRequest), clickbait (ClickbaitAnalyzeRequest) or water (WaterAnalyzeRequest).")
+    payload: Dict[str, Any] = Field(..., description="Request body of the matching synchronous endpoint.")
+
+
+class JobError(BaseModel):
+    code: str
+    message: str
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: JobKind
+    status: JobStatus
+    attempts: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Response of the synchronous endpoint, once succeeded.")
+    error: Optional[JobError] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "JobResponse":
+        def when(timestamp: Optional[float]) -> Optional[datetime]:
+            return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp is not None else None
+
+        return cls(
+            job_id=row["id"],
+            kind=row["kind"],
+            status=row["status"],
+            attempts=row["attempts"],
+            created_at=when(row["created_at"]),
+            started_at=when(row["started_at"]),
+            finished_at=when(row["finished_at"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=json.loads(row["error"]) if row["error"] else None,
+        )
@@ -0,0 +1,14 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ModelReloadRequest(BaseModel):
+    path: Optional[str] = Field(
+        default=None,
+        description="Checkpoint to load; defaults to the configured one. Must lie under MODEL_RELOAD_ROOT.",
+    )
+    version: Optional[str] = Field(
+        default=None,
+        description="Version reported in detector_version/analysis_version; defaults to '<configured>+r<n>'.",
+    )
@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
-from src.lib.water_config import TEXT_MAX_LENGTH, TEXT_MIN_LENGTH
+from src.lib.water_config import TEXT_MAX_LENGTH, TEXT_MIN_LENGTH, WATER_BATCH_ENDPOINT_MAX_ITEMS
 
 
 class FeatureMetrics(BaseModel):
@@ -45,9 +45,27 @@ class WaterAnalyzeResponse(BaseModel):
     detector_version: str
     evaluated_at: Optional[datetime] = None
     errors: Optional[List[str]] = None
+    cached: bool = Field(default=False, description="True when served from the result cache.")
 
 
 class WaterErrorResponse(BaseModel):
     code: str
     message: str
     errors: Optional[List[str]] = None
+
+
+class WaterBatchRequest(BaseModel):
+    items: List[Any] = Field(
+        ...,
+        min_length=1,
+        max_length=WATER_BATCH_ENDPOINT_MAX_ITEMS,
+        description="WaterAnalyzeRequest objects; each one is validated separately.",
+    )
+
+
+class WaterBatchItemResult(BaseModel):
+    """One NDJSON line of the batch response: either a result or validation errors."""
+
+    index: int
+    result: Optional[WaterAnalyzeResponse] = None
+    errors: Optional[List[str]] = None
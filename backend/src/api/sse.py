@@ -0,0 +1,35 @@
+import json
+from typing import Any, AsyncIterator, Tuple
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_event(event: str, data: Any, event_id: int) -> str:
+    if isinstance(data, BaseModel):
+        payload = data.model_dump_json()
+    else:
+        payload = json.dumps(data, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+async def stream_events(events: AsyncIterator[Tuple[str, Any]]) -> AsyncIterator[str]:
+    """
+    Serialize (event, data) pairs as server-sent events. A failure after the
+    stream started is reported as a final `error` event with the usual
+    {"code", "message"} body, since the HTTP status is already sent.
+    """
+    event_id = 0
+    try:
+        async for event, data in events:
+            yield format_event(event, data, event_id)
+            event_id += 1
+    except HTTPException as exc:
+        detail = exc.detail if isinstance(exc.detail, dict) else {"code": "ERROR", "message": str(exc.detail)}
+        yield format_event("error", detail, event_id)
+    except Exception as exc:
+        yield format_event("error", {"code": "ANALYSIS_ERROR", "message": str(exc)}, event_id)
@@ -0,0 +1,60 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.lib.metrics import (
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_SECONDS,
+    current_timings,
+    reset_request_timings,
+    server_timing_header,
+    start_request_timings,
+)
+
+
+def _route_label(scope: Scope) -> str:
+    # Routing stores the matched route in the scope; templates keep label
+    # cardinality bounded and unmatched paths share one label
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+class TimingMiddleware:
+    """
+    Record request latency per route and the number of requests in flight, and
+    attach a Server-Timing header with the stages timed so far to every response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        token = start_request_timings()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                header = server_timing_header(current_timings(), time.perf_counter() - started)
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", header.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=_route_label(scope),
+                status=str(status_code),
+            )
+            reset_request_timings(token)
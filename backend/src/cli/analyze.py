@@ -1,8 +1,10 @@
 import argparse
 import json
+import sys
 from typing import Any, Dict
 
 from src.api.schemas import AnalyzeRequest
+from src.lib.server_config import WORKER_TORCH_THREADS
 from src.services.analyzer import analyze_request
 
 
@@ -24,12 +26,81 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Optional request identifier",
     )
+
+    bulk = parser.add_argument_group("bulk mode")
+    bulk.add_argument(
+        "--input",
+        type=str,
+        help="JSONL or CSV file of records with 'url' or 'text' ('-' for stdin); enables bulk mode",
+    )
+    bulk.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        default=None,
+        help="Input format (default: from the file extension, jsonl for stdin)",
+    )
+    bulk.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="JSONL output file (default: stdout)",
+    )
+    bulk.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes",
+    )
+    bulk.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Checkpoint file for resuming (default: <output>.checkpoint)",
+    )
+    bulk.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and start over",
+    )
+    bulk.add_argument(
+        "--torch-threads",
+        type=int,
+        default=WORKER_TORCH_THREADS,
+        help="Torch threads per worker process (0 keeps the torch default)",
+    )
     return parser.parse_args()
 
 
+def _run_bulk(args: argparse.Namespace) -> None:
+    from src.cli.bulk import run_bulk
+
+    if args.url or args.text:
+        raise SystemExit("--input cannot be combined with --url or --text.")
+    try:
+        stats = run_bulk(
+            args.input,
+            output_path=args.output,
+            fmt=args.format,
+            workers=args.workers,
+            checkpoint_path=args.checkpoint,
+            restart=args.restart,
+            torch_threads=args.torch_threads,
+        )
+    except KeyboardInterrupt:
+        raise SystemExit("Interrupted; run the same command again to resume.")
+    print(
+        f"processed {stats['processed']} (failed {stats['failed']}), skipped {stats['skipped']} already done",
+        file=sys.stderr,
+    )
+
+
 def main() -> None:
     args = _parse_args()
 
+    if args.input:
+        _run_bulk(args)
+        return
+
     if args.url and args.text:
         raise SystemExit("Provide either --url or --text, not both.")
 
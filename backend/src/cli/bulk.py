@@ -0,0 +1,236 @@
+import csv
+import json
+import multiprocessing
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, TextIO, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.api.schemas import AnalyzeRequest
+from src.lib.torch_threads import pin_torch_threads_before_fork, set_worker_torch_threads
+from src.services.analyzer import analyze_request
+
+# Items queued ahead of the workers, per worker: keeps them busy without
+# reading a whole archive into memory
+_QUEUE_DEPTH = 4
+
+Item = Tuple[int, Any]
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[Any]:
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ValueError(f"Invalid JSON: {exc}")
+
+
+def _read_csv(stream: TextIO) -> Iterator[Any]:
+    for row in csv.DictReader(stream):
+        # Empty cells mean "not provided", as an absent JSON key would
+        yield {key: value for key, value in row.items() if key and value not in (None, "")}
+
+
+def read_items(stream: TextIO, fmt: str) -> Iterator[Item]:
+    """
+    Yield (index, record) for every input record. The index is the record's
+    position in the input, so it is stable across runs over the same input.
+    Unreadable records are yielded as ValueError and reported in the output.
+    """
+    reader = _read_csv if fmt == "csv" else _read_jsonl
+    return enumerate(reader(stream))
+
+
+def _to_request(raw: Any) -> AnalyzeRequest:
+    if isinstance(raw, Exception):
+        raise raw
+    if not isinstance(raw, dict):
+        raise ValueError("Each record must be an object with 'url' or 'text'")
+    if "input_type" not in raw:
+        raw = {**raw, "input_type": "url" if raw.get("url") else "text"}
+    return AnalyzeRequest(**raw)
+
+
+def analyze_item(item: Item) -> Tuple[int, bool, str]:
+    """
+    Analyze one record and return (index, failed, output JSON line).
+    Failures become an error object in the line, never an exception, so one
+    bad record does not stop the run.
+    """
+    index, raw = item
+    record: Dict[str, Any] = {"index": index, "request_id": raw.get("request_id") if isinstance(raw, dict) else None}
+    try:
+        record["result"] = json.loads(analyze_request(_to_request(raw)).model_dump_json())
+    except (ValidationError, ValueError) as exc:
+        record["error"] = {"code": "INVALID_INPUT", "message": str(exc)}
+    except HTTPException as exc:
+        record["error"] = exc.detail if isinstance(exc.detail, dict) else {"code": "ERROR", "message": str(exc.detail)}
+    except Exception as exc:
+        record["error"] = {"code": "ANALYSIS_ERROR", "message": str(exc)}
+    return index, "error" in record, json.dumps(record, ensure_ascii=False)
+
+
+class Checkpoint:
+    """
+    Append-only record of finished input indices. The first line names the
+    input it belongs to; each further line is one index, written after the
+    item's output line is flushed. An interrupted run therefore never loses
+    a result, and at worst repeats the item that was in flight (the output
+    line carries the same index).
+    """
+
+    def __init__(self, path: Path, source: str) -> None:
+        self.path = path
+        self.source = source
+        self.done: Set[int] = set()
+        self._fh: Optional[TextIO] = None
+
+    def load(self) -> bool:
+        """
+        Read an existing checkpoint; returns False when there is none.
+        """
+        if not self.path.exists():
+            return False
+        with self.path.open(encoding="utf-8") as fh:
+            header = json.loads(fh.readline() or "{}")
+            if header.get("input") != self.source:
+                raise SystemExit(
+                    f"Checkpoint {self.path} belongs to input {header.get('input')!r}, not {self.source!r}. "
+                    "Pass --restart to start over."
+                )
+            for line in fh:
+                if line.strip().isdigit():
+                    self.done.add(int(line))
+        return True
+
+    def open(self, resume: bool) -> None:
+        self._fh = self.path.open("a" if resume else "w", encoding="utf-8")
+        if not resume:
+            self._fh.write(json.dumps({"input": self.source}) + "\n")
+            self._fh.flush()
+
+    def mark(self, index: int) -> None:
+        self.done.add(index)
+        self._fh.write(f"{index}\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+
+
+def _init_worker(torch_threads: int) -> None:
+    # The parent handles Ctrl-C and terminates the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    set_worker_torch_threads(torch_threads)
+
+
+def _bounded(items: Iterable[Item], slots: threading.Semaphore, stop: threading.Event) -> Iterator[Item]:
+    # Pool.imap* drain their input eagerly; a slot is released per result.
+    # The pool's feeder thread runs this, and Pool.terminate() joins it: once
+    # `stop` is set it must stop waiting for a slot, or Ctrl-C hangs the run.
+    for item in items:
+        while not slots.acquire(timeout=0.1):
+            if stop.is_set():
+                return
+        if stop.is_set():
+            return
+        yield item
+
+
+def _results(items: Iterable[Item], workers: int, torch_threads: int) -> Iterator[Tuple[int, bool, str]]:
+    if workers <= 1:
+        for item in items:
+            yield analyze_item(item)
+        return
+
+    from src.services.models import preload_models
+
+    # Load the sentiment model once here; forked workers share its weights
+    # copy-on-write (the same scheme as the pre-fork server). Torch stays
+    # single-threaded in the parent: an OpenMP pool does not survive fork.
+    pin_torch_threads_before_fork()
+    preload_models(["sentiment"])
+    slots = threading.Semaphore(workers * _QUEUE_DEPTH)
+    stop = threading.Event()
+    pool = multiprocessing.get_context("fork").Pool(workers, initializer=_init_worker, initargs=(torch_threads,))
+    try:
+        for result in pool.imap_unordered(analyze_item, _bounded(items, slots, stop)):
+            slots.release()
+            yield result
+        pool.close()
+    finally:
+        stop.set()
+        pool.terminate()
+        pool.join()
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def run_bulk(
+    input_path: str,
+    output_path: Optional[str] = None,
+    fmt: Optional[str] = None,
+    workers: int = 1,
+    checkpoint_path: Optional[str] = None,
+    restart: bool = False,
+    torch_threads: int = 0,
+) -> Dict[str, int]:
+    """
+    Analyze every record of a JSONL or CSV file ("-" for stdin) and stream
+    one JSON line per record to `output_path` (stdout when omitted), in
+    completion order. Each record holds `url` or `text` plus the optional
+    AnalyzeRequest fields. With a checkpoint (by default next to the output
+    file) an interrupted run resumes where it stopped and appends to the
+    output. Returns counts of processed, failed and skipped records.
+    """
+    fmt = _detect_format(input_path, fmt)
+    source = input_path if input_path == "-" else str(Path(input_path).resolve())
+    if checkpoint_path is None and output_path:
+        checkpoint_path = f"{output_path}.checkpoint"
+
+    checkpoint = Checkpoint(Path(checkpoint_path), source) if checkpoint_path else None
+    resume = False
+    if checkpoint is not None and not restart:
+        resume = checkpoint.load()
+    done = checkpoint.done if checkpoint is not None else set()
+
+    stats = {"processed": 0, "failed": 0, "skipped": 0}
+    in_stream = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8", newline="")
+    out_stream = open(output_path, "a" if resume else "w", encoding="utf-8") if output_path else sys.stdout
+    if checkpoint is not None:
+        checkpoint.open(resume)
+
+    def pending() -> Iterator[Item]:
+        for index, raw in read_items(in_stream, fmt):
+            if index in done:
+                stats["skipped"] += 1
+                continue
+            yield index, raw
+
+    try:
+        for index, failed, line in _results(pending(), workers, torch_threads):
+            out_stream.write(line + "\n")
+            out_stream.flush()
+            if checkpoint is not None:
+                checkpoint.mark(index)
+            stats["processed"] += 1
+            stats["failed"] += failed
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+    return stats
@@ -0,0 +1,9 @@
+import os
+
+# Content-addressed cache of analysis results (/analysis, /clickbait/analyze,
+# /water-detection). The SQLite tier is enabled by setting RESULT_CACHE_SQLITE_PATH.
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "10000"))
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+RESULT_CACHE_SQLITE_PATH = os.getenv("RESULT_CACHE_SQLITE_PATH") or None
+RESULT_CACHE_SQLITE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_SQLITE_TTL_SECONDS", "604800"))
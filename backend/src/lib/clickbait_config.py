@@ -13,3 +13,23 @@ CLICKBAIT_MODULE_PATH = Path(
 CLICKBAIT_THRESHOLD = float(os.getenv("CLICKBAIT_THRESHOLD", "0.5"))
 CLICKBAIT_CONTRACT_VERSION = os.getenv("CLICKBAIT_CONTRACT_VERSION", "0.1.0")
 CLICKBAIT_DETECTOR_VERSION = os.getenv("CLICKBAIT_DETECTOR_VERSION", "clickbait_model_v1")
+
+# Micro-batching of concurrent /clickbait/analyze calls
+CLICKBAIT_BATCHING_ENABLED = os.getenv("CLICKBAIT_BATCHING_ENABLED", "true").lower() in ("1", "true", "yes")
+CLICKBAIT_BATCH_MAX_SIZE = int(os.getenv("CLICKBAIT_BATCH_MAX_SIZE", "32"))
+CLICKBAIT_BATCH_MAX_WAIT_MS = float(os.getenv("CLICKBAIT_BATCH_MAX_WAIT_MS", "5"))
+
+# POST /clickbait/analyze/batch
+CLICKBAIT_BATCH_ENDPOINT_MAX_ITEMS = int(os.getenv("CLICKBAIT_BATCH_ENDPOINT_MAX_ITEMS", "1000"))
+
+# Inference backend: "torch" (transformers) or "onnx" (onnxruntime). The ONNX graph
+# is exported once per checkpoint state and cached next to the model as
+# "<CLICKBAIT_ONNX_PATH stem>-<digest>.onnx" (a reloaded checkpoint exports into
+# its own directory); the service falls back to torch when onnxruntime is not
+# installed or the ONNX scores drift from torch.
+CLICKBAIT_BACKEND = os.getenv("CLICKBAIT_BACKEND", "torch").lower()
+CLICKBAIT_ONNX_PATH = Path(
+    os.getenv("CLICKBAIT_ONNX_PATH", CLICKBAIT_MODEL_PATH / "model.onnx")
+).resolve()
+CLICKBAIT_ONNX_INTRA_OP_THREADS = int(os.getenv("CLICKBAIT_ONNX_INTRA_OP_THREADS", "0"))  # 0 = onnxruntime default
+CLICKBAIT_ONNX_PARITY_TOLERANCE = float(os.getenv("CLICKBAIT_ONNX_PARITY_TOLERANCE", "1e-3"))
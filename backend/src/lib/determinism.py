@@ -1,53 +1,92 @@
 import os
 import random
+import threading
 from dataclasses import dataclass
 from typing import Optional
 
-try:
-    import numpy as np  # type: ignore
-except Exception:  # pragma: no cover - numpy is optional
-    np = None  # type: ignore
-
-try:
-    import torch  # type: ignore
-except Exception:  # pragma: no cover - torch is optional
-    torch = None  # type: ignore
-
 
 CONTRACT_VERSION = "0.1.0"
 MODEL_VERSION = os.getenv("MODEL_VERSION", "rubert_finetuned_v1")
+# Process-wide deterministic kernels for torch (set once, before models load)
+DETERMINISTIC_INFERENCE = os.getenv("DETERMINISTIC_INFERENCE", "true").lower() in ("1", "true", "yes")
 
 
 @dataclass
 class DeterminismContext:
+    """
+    Values echoed in API responses. The seed identifies the request; inference
+    itself does not sample (models run in eval mode with deterministic kernels,
+    see `configure_deterministic_inference`).
+    """
+
     seed: int
     contract_version: str = CONTRACT_VERSION
     model_version: str = MODEL_VERSION
 
 
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_deterministic_inference() -> None:
+    """
+    One-time process setup for reproducible inference: deterministic torch
+    kernels and no cuDNN autotuning. Models run in eval mode, so with these
+    settings a forward pass does not depend on any RNG state. Model loaders
+    call it right after importing their torch-based module, so torch is fully
+    imported by then. Idempotent.
+    """
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        if DETERMINISTIC_INFERENCE:
+            try:
+                import torch
+            except ImportError:  # pragma: no cover - torch is optional
+                torch = None  # type: ignore
+            if torch is not None:
+                torch.use_deterministic_algorithms(True, warn_only=True)
+                torch.backends.cudnn.deterministic = True
+                torch.backends.cudnn.benchmark = False
+        _configured = True
+
+
 def set_seed(seed: int) -> None:
     """
-    Configure deterministic random seed for Python, NumPy and torch (if available).
+    Seed the process-global Python, NumPy and torch RNGs. For offline scripts
+    only: request handling uses `create_determinism_context`, which leaves
+    global state alone.
     """
     random.seed(seed)
 
-    if np is not None:
+    try:
+        import numpy as np
+
         np.random.seed(seed)
+    except ImportError:  # pragma: no cover - numpy is optional
+        pass
+
+    try:
+        import torch
 
-    if torch is not None:
         torch.manual_seed(seed)
         if torch.cuda.is_available():  # pragma: no cover - depends on system
             torch.cuda.manual_seed_all(seed)
+    except ImportError:  # pragma: no cover - torch is optional
+        pass
+
+
+def _new_seed() -> int:
+    # os.urandom is thread- and fork-safe, unlike a shared Random instance
+    return int.from_bytes(os.urandom(4), "big") & 0x7FFFFFFF
 
 
 def create_determinism_context(seed: Optional[int] = None) -> DeterminismContext:
     """
-    Create and apply a deterministic context, returning the values
-    that should be echoed in API responses.
+    Create the request's determinism context, returning the values that
+    should be echoed in API responses.
     """
-    if seed is None:
-        seed = random.randint(0, 2**31 - 1)
-
-    set_seed(seed)
-    return DeterminismContext(seed=seed)
-
+    return DeterminismContext(seed=_new_seed() if seed is None else seed)
@@ -0,0 +1,37 @@
+import os
+
+# Cache of fetched articles keyed by canonical URL. Failures (fetch errors and
+# parser-reported errors) are cached for the shorter negative TTL.
+FETCH_CACHE_ENABLED = os.getenv("FETCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+FETCH_CACHE_SIZE = int(os.getenv("FETCH_CACHE_SIZE", "2000"))
+FETCH_CACHE_TTL_SECONDS = float(os.getenv("FETCH_CACHE_TTL_SECONDS", "900"))
+FETCH_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("FETCH_CACHE_NEGATIVE_TTL_SECONDS", "60"))
+
+# Pool of long-lived NewsParser instances (one HTTP session each) reused across requests.
+NEWS_PARSER_POOL_SIZE = int(os.getenv("NEWS_PARSER_POOL_SIZE", "4"))
+NEWS_PARSER_MAX_USES = int(os.getenv("NEWS_PARSER_MAX_USES", "500"))
+NEWS_PARSER_MAX_AGE_SECONDS = float(os.getenv("NEWS_PARSER_MAX_AGE_SECONDS", "1800"))
+NEWS_PARSER_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("NEWS_PARSER_ACQUIRE_TIMEOUT_SECONDS", "30"))
+
+# URL fetch backend for /analysis: "parser" (NewsParser via the scraping proxy,
+# blocking) or "async" (direct asyncio HTTP fetch with concurrency limits).
+FETCH_BACKEND = os.getenv("FETCH_BACKEND", "parser").lower()
+ASYNC_FETCH_MAX_CONCURRENCY = int(os.getenv("ASYNC_FETCH_MAX_CONCURRENCY", "64"))
+ASYNC_FETCH_PER_HOST_CONCURRENCY = int(os.getenv("ASYNC_FETCH_PER_HOST_CONCURRENCY", "4"))
+ASYNC_FETCH_CONNECT_TIMEOUT_SECONDS = float(os.getenv("ASYNC_FETCH_CONNECT_TIMEOUT_SECONDS", "5"))
+ASYNC_FETCH_READ_TIMEOUT_SECONDS = float(os.getenv("ASYNC_FETCH_READ_TIMEOUT_SECONDS", "15"))
+ASYNC_FETCH_TOTAL_TIMEOUT_SECONDS = float(os.getenv("ASYNC_FETCH_TOTAL_TIMEOUT_SECONDS", "30"))
+ASYNC_FETCH_MAX_BYTES = int(os.getenv("ASYNC_FETCH_MAX_BYTES", str(5 * 1024 * 1024)))
+ASYNC_FETCH_MAX_REDIRECTS = int(os.getenv("ASYNC_FETCH_MAX_REDIRECTS", "5"))
+# The async backend connects to user-supplied URLs directly (not through the
+# scraping proxy), so hosts and redirect targets resolving to loopback, private,
+# link-local or reserved addresses are refused. Enable only for local testing.
+ASYNC_FETCH_ALLOW_PRIVATE_NETWORKS = os.getenv("ASYNC_FETCH_ALLOW_PRIVATE_NETWORKS", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+ASYNC_FETCH_USER_AGENT = os.getenv(
+    "ASYNC_FETCH_USER_AGENT",
+    "Mozilla/5.0 (compatible; NewsAnalysisBot/0.1)",
+)
@@ -0,0 +1,157 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_ABANDONED = json.dumps({"code": "JOB_ABANDONED", "message": "The worker stopped while running the job"})
+
+_COLUMNS = (
+    "id, kind, payload, status, result, error, attempts,"
+    " created_at, started_at, finished_at, lease_expires_at"
+)
+
+
+class JobQueue:
+    """
+    Durable FIFO job queue in a SQLite file. Any number of threads and
+    processes may submit and claim jobs; a claim is a single write
+    transaction, so each job goes to exactly one worker. A claimed job holds
+    a lease, which its worker renews while it runs: if its process dies, the
+    job is claimed again after the lease expires, up to `max_attempts` times.
+    Renewing and finishing name the attempt (`attempts` from `claim`), so an
+    attempt that lost its lease cannot overwrite a newer one. Payloads and
+    results are stored as strings, errors as JSON objects with code and
+    message. The connection is opened lazily per process, as in SQLiteCache.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 600.0, max_attempts: int = 3) -> None:
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit; claims open their own write transaction
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL,"
+                " status TEXT NOT NULL, result TEXT, error TEXT,"
+                " attempts INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL,"
+                " started_at REAL, finished_at REAL, lease_expires_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def submit(self, kind: str, payload: str) -> Dict[str, Any]:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._connection().execute(
+                "INSERT INTO jobs (id, kind, payload, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, payload, QUEUED, time.time()),
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection().execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Take the oldest runnable job (queued, or running with an expired
+        lease) and mark it running. Returns None when there is none. Jobs
+        whose lease expired on their last attempt are failed instead.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ?, lease_expires_at = NULL"
+                    " WHERE status = ? AND lease_expires_at <= ? AND attempts >= ?",
+                    (FAILED, _ABANDONED, now, RUNNING, now, self.max_attempts),
+                )
+                row = conn.execute(
+                    f"SELECT {_COLUMNS} FROM jobs WHERE status = ? OR (status = ? AND lease_expires_at <= ?)"
+                    " ORDER BY created_at LIMIT 1",
+                    (QUEUED, RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, lease_expires_at = ?"
+                    " WHERE id = ?",
+                    (RUNNING, now, now + self.lease_seconds, row["id"]),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        job = dict(row)
+        job.update(status=RUNNING, attempts=job["attempts"] + 1, started_at=now)
+        return job
+
+    def renew(self, job_id: str, attempts: int) -> bool:
+        """
+        Extend the lease of a running attempt. Returns False when the attempt
+        no longer holds the job (its lease expired and it was claimed again).
+        """
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = ? AND attempts = ?",
+                (time.time() + self.lease_seconds, job_id, RUNNING, attempts),
+            )
+            return cursor.rowcount == 1
+
+    def _finish(self, job_id: str, attempts: int, status: str, result: Optional[str], error: Optional[str]) -> bool:
+        with self._lock:
+            cursor = self._connection().execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_expires_at = NULL"
+                " WHERE id = ? AND status = ? AND attempts = ?",
+                (status, result, error, time.time(), job_id, RUNNING, attempts),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, attempts: int, result: str) -> bool:
+        return self._finish(job_id, attempts, SUCCEEDED, result, None)
+
+    def fail(self, job_id: str, attempts: int, error: str) -> bool:
+        return self._finish(job_id, attempts, FAILED, None, error)
+
+    def purge_finished(self, older_than_seconds: float) -> int:
+        cutoff = time.time() - older_than_seconds
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at <= ?",
+                (SUCCEEDED, FAILED, cutoff),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {QUEUED: 0, RUNNING: 0, SUCCEEDED: 0, FAILED: 0}
+        counts.update({status: count for status, count in rows})
+        return {"path": self.path, **counts}
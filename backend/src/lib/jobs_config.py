@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+# Backend root (backend/src/lib/jobs_config.py -> backend/src -> backend)
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+# Asynchronous jobs (POST /jobs). Jobs are stored in a local SQLite database and
+# drained by JOBS_WORKERS threads in every server process; processes sharing the
+# database file share the queue.
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() in ("1", "true", "yes")
+# Anchored to the backend directory, not the working directory, so every
+# process (and every pre-fork worker) shares one database wherever it starts.
+JOBS_DB_PATH = os.getenv("JOBS_DB_PATH", str(BACKEND_ROOT / "data" / "jobs.sqlite3"))
+JOBS_WORKERS = int(os.getenv("JOBS_WORKERS", "2"))
+# Idle workers poll the database this often (jobs submitted by the same process
+# wake a worker immediately).
+JOBS_POLL_INTERVAL_SECONDS = float(os.getenv("JOBS_POLL_INTERVAL_SECONDS", "1.0"))
+# A running job whose process died is picked up again once its lease expires,
+# at most JOBS_MAX_ATTEMPTS times in total.
+JOBS_LEASE_SECONDS = float(os.getenv("JOBS_LEASE_SECONDS", "600"))
+JOBS_MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS", "3"))
+# Finished jobs (and their results) are kept this long.
+JOBS_RESULT_TTL_SECONDS = float(os.getenv("JOBS_RESULT_TTL_SECONDS", "86400"))
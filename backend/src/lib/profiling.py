@@ -0,0 +1,130 @@
+import contextvars
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.lib.profiling_config import (
+    PROFILING_ENABLED,
+    PROFILING_INLINE_TOP_N,
+    PROFILING_OUTPUT_DIR,
+    PROFILING_SAMPLE_RATE,
+)
+
+_FILE_VALUES = ("1", "true", "yes", "file")
+
+
+@dataclass
+class ProfileRequest:
+    """
+    One profiled request. A request may run several profiled steps (stage
+    graph, batched sentiment, SSE steps); their profiles add up in `stats`.
+    """
+
+    mode: str  # "file" | "inline"
+    path: Optional[str] = None
+    stats: Optional[pstats.Stats] = None
+    skipped: Optional[str] = None
+
+    @property
+    def report(self) -> Optional[str]:
+        if self.stats is None:
+            return None
+        stream = io.StringIO()
+        self.stats.stream = stream
+        self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILING_INLINE_TOP_N)
+        return stream.getvalue()
+
+
+_current: contextvars.ContextVar[Optional[ProfileRequest]] = contextvars.ContextVar("profile_request", default=None)
+
+# cProfile hooks one thread, but only one profiler may be active per process on
+# Python 3.12+; profiled runs are serialized and concurrent ones run unprofiled.
+_profile_lock = threading.Lock()
+
+
+def choose_mode(header_value: Optional[str]) -> Optional[str]:
+    """
+    Decide whether to profile a request from its profiling header and the
+    sampling rate. Returns "file", "inline" or None.
+    """
+    if not PROFILING_ENABLED:
+        return None
+    value = (header_value or "").strip().lower()
+    if value == "inline":
+        return "inline"
+    if value in _FILE_VALUES:
+        return "file"
+    if PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE:
+        return "file"
+    return None
+
+
+def start_profile_request(mode: str) -> contextvars.Token:
+    return _current.set(ProfileRequest(mode=mode))
+
+
+def reset_profile_request(token: contextvars.Token) -> None:
+    _current.reset(token)
+
+
+def current_profile_request() -> Optional[ProfileRequest]:
+    return _current.get()
+
+
+def profiling_active() -> bool:
+    """
+    True while serving a request that asked to be profiled. Used to bypass the
+    result cache and clickbait micro-batching so model time lands in the profile.
+    """
+    return _current.get() is not None
+
+
+def run_profiled(label: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call `fn`, profiling it with cProfile when the current request asked for it.
+    The profile is added to the request's: written to PROFILING_OUTPUT_DIR or
+    kept for the inline report.
+    """
+    request = _current.get()
+    if request is None:
+        return fn(*args, **kwargs)
+    if not _profile_lock.acquire(blocking=False):
+        request.skipped = "busy"
+        return fn(*args, **kwargs)
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            _save(request, label, profiler)
+    finally:
+        _profile_lock.release()
+
+
+def _save(request: ProfileRequest, label: str, profiler: cProfile.Profile) -> None:
+    # Called under _profile_lock, so the steps of one request never race here
+    if request.stats is None:
+        request.stats = pstats.Stats(profiler)
+    else:
+        request.stats.add(profiler)
+    if request.mode == "inline":
+        return
+
+    if request.path is None:
+        directory = Path(PROFILING_OUTPUT_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        request.path = str(directory / f"{stamp}-{label}-{os.getpid()}-{uuid.uuid4().hex[:8]}.pstats")
+    # The file always holds every step profiled so far
+    request.stats.dump_stats(request.path)
@@ -0,0 +1,11 @@
+import os
+
+# Opt-in request profiling. With PROFILING_ENABLED a request is profiled when it
+# sends the PROFILING_HEADER ("1"/"file" writes a .pstats file to
+# PROFILING_OUTPUT_DIR, "inline" returns the report as the response body) or
+# when it is picked by PROFILING_SAMPLE_RATE (0..1, written to a file).
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILING_HEADER = os.getenv("PROFILING_HEADER", "X-Profile")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_OUTPUT_DIR = os.getenv("PROFILING_OUTPUT_DIR", "/tmp/news-analysis-profiles")
+PROFILING_INLINE_TOP_N = int(os.getenv("PROFILING_INLINE_TOP_N", "60"))
@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+# Repository root (backend/src/lib/sentiment_config.py -> backend/src -> backend -> repo)
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+SENTIMENT_MODEL_PATH = Path(
+    os.getenv("SENTIMENT_MODEL_PATH", REPO_ROOT / "code/sentimen_analiz/rubert_finetuned")
+).resolve()
+
+# Batched RuBERT inference: main-text chunks and quotes are packed together into
+# batches of SENTIMENT_BATCH_SIZE segments of at most SENTIMENT_MAX_LENGTH tokens.
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
+SENTIMENT_MAX_LENGTH = int(os.getenv("SENTIMENT_MAX_LENGTH", "512"))
+# The batched path is checked against the analyzer's own chunking API when a
+# model loads; scores may differ by at most this much (labels must match).
+SENTIMENT_BATCH_PARITY_TOLERANCE = float(os.getenv("SENTIMENT_BATCH_PARITY_TOLERANCE", "1e-3"))
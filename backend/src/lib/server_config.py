@@ -0,0 +1,40 @@
+import os
+
+from src.lib.clickbait_config import CLICKBAIT_BATCH_MAX_SIZE
+
+# Inference executor pool sizes, one dedicated thread pool per model family.
+# The clickbait pool must be at least as large as the micro-batch size, since
+# each pool thread waits on the batcher while its headline is being scored.
+SENTIMENT_EXECUTOR_WORKERS = int(os.getenv("SENTIMENT_EXECUTOR_WORKERS", "2"))
+CLICKBAIT_EXECUTOR_WORKERS = int(os.getenv("CLICKBAIT_EXECUTOR_WORKERS", str(CLICKBAIT_BATCH_MAX_SIZE)))
+WATER_EXECUTOR_WORKERS = int(os.getenv("WATER_EXECUTOR_WORKERS", "2"))
+# Pool for the light, independent stages of one /analysis request (freshness,
+# quote extraction, placeholder), shared by all concurrent requests. Sentiment
+# scoring stays on the sentiment pool.
+STAGE_EXECUTOR_WORKERS = int(os.getenv("STAGE_EXECUTOR_WORKERS", "8"))
+
+# HTTP server. SERVER_WORKERS > 1 enables the pre-fork mode: models are loaded
+# once in the master process and shared copy-on-write with forked workers.
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))
+# torch intra-op threads per worker; 0 keeps the torch default.
+WORKER_TORCH_THREADS = int(os.getenv("WORKER_TORCH_THREADS", "0"))
+
+# Load and warm up all models at startup instead of on the first request.
+MODEL_WARMUP_ENABLED = os.getenv("MODEL_WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+# Models /ready waits for. The others (clickbait and water answer with a
+# fallback without their model) only make the service "degraded" if they fail.
+READY_REQUIRED_MODELS = tuple(
+    name.strip() for name in os.getenv("READY_REQUIRED_MODELS", "sentiment").split(",") if name.strip()
+)
+
+# Hot reload (POST /models/{name}/reload), off unless enabled. Without
+# MODEL_RELOAD_ROOT only the configured checkpoints can be reloaded; with it, a
+# new checkpoint path may be given as long as it lies under that directory.
+# With MODEL_RELOAD_TOKEN set, callers must send "Authorization: Bearer <token>".
+# A model is reloaded at most once per MODEL_RELOAD_MIN_INTERVAL_SECONDS.
+MODEL_RELOAD_ENABLED = os.getenv("MODEL_RELOAD_ENABLED", "false").lower() in ("1", "true", "yes")
+MODEL_RELOAD_ROOT = os.getenv("MODEL_RELOAD_ROOT") or None
+MODEL_RELOAD_TOKEN = os.getenv("MODEL_RELOAD_TOKEN") or None
+MODEL_RELOAD_MIN_INTERVAL_SECONDS = float(os.getenv("MODEL_RELOAD_MIN_INTERVAL_SECONDS", "60"))
@@ -0,0 +1,37 @@
+from typing import Optional
+
+
+# torch's own intra-op thread count, saved by the process that forks workers
+# before it pins itself to one thread; forked workers inherit it
+_default_threads: Optional[int] = None
+
+
+def pin_torch_threads_before_fork() -> None:
+    """
+    Keep torch single-threaded in a process that is about to fork: an OpenMP
+    pool started before fork is not usable in the children. torch's default
+    thread count is remembered for `set_worker_torch_threads`.
+    """
+    global _default_threads
+    try:
+        import torch  # type: ignore
+    except Exception:  # pragma: no cover - torch is optional
+        return
+    if _default_threads is None:
+        _default_threads = torch.get_num_threads()
+    torch.set_num_threads(1)
+
+
+def set_worker_torch_threads(threads: int) -> None:
+    """
+    Set torch intra-op threads in a forked worker; 0 restores the default the
+    parent had before `pin_torch_threads_before_fork`.
+    """
+    try:
+        import torch  # type: ignore
+    except Exception:  # pragma: no cover - torch is optional
+        return
+    if threads <= 0:
+        threads = _default_threads or 0
+    if threads > 0:
+        torch.set_num_threads(threads)
@@ -16,3 +16,13 @@ WATER_DETECTOR_VERSION = os.getenv("WATER_DETECTOR_VERSION", "water-detector-1.0
 
 TEXT_MIN_LENGTH = int(os.getenv("WATER_TEXT_MIN_LENGTH", "20"))
 TEXT_MAX_LENGTH = int(os.getenv("WATER_TEXT_MAX_LENGTH", "10000"))
+
+# Shared lemma/POS cache for the water analyzer. The optional seed table lists
+# the most frequent word forms (one per line, optional "\tcount"), most frequent first.
+WATER_MORPH_CACHE_SIZE = int(os.getenv("WATER_MORPH_CACHE_SIZE", "100000"))
+WATER_MORPH_SEED_PATH = os.getenv("WATER_MORPH_SEED_PATH") or None
+WATER_MORPH_SEED_TOP_N = int(os.getenv("WATER_MORPH_SEED_TOP_N", "20000"))
+
+# POST /water-detection/batch: item limit and how many items are scored per model call
+WATER_BATCH_ENDPOINT_MAX_ITEMS = int(os.getenv("WATER_BATCH_ENDPOINT_MAX_ITEMS", "500"))
+WATER_BATCH_CHUNK_SIZE = int(os.getenv("WATER_BATCH_CHUNK_SIZE", "32"))
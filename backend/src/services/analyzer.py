@@ -1,7 +1,10 @@
+import asyncio
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 
@@ -11,6 +14,8 @@ from src.api.schemas import (
     AnalyzeResponse,
     ArticleContent,
     FreshnessResult,
+    QuoteFound,
+    QuotesFound,
     SentimentResult,
     SentimentSummary,
     QuoteSentiment,
@@ -20,12 +25,19 @@ from src.lib.determinism import (
     MODEL_VERSION,
     create_determinism_context,
 )
+from src.lib.fetch_config import FETCH_BACKEND
+from src.lib.metrics import timed_stage
+from .async_fetcher import fetch_article_async
+from .executor import get_executor, run_inference
 from .fetcher import FetchError, fetch_article
+from .model_registry import ModelHandle, registry
 from .parser_adapter import normalize_article
+from .result_cache import cached_call, lookup_cached, normalize_text, store_cached
 from .sentiment_adapter import (
     analyze_sentiment_segments,
     get_model_version,
 )
+from .stage_graph import StageGraph
 
 
 def _ensure_code_on_path() -> None:
@@ -38,38 +50,204 @@ def _ensure_code_on_path() -> None:
 
 _ensure_code_on_path()
 
-from components.freshness import assess_freshness  # type: ignore  # noqa: E402
-from parser.quotes_test import (  # type: ignore  # noqa: E402
-    find_quotes_and_authors,
-    replace_quotes_with_placeholder,
-)
 
+def import_pipeline_modules() -> None:
+    """
+    Import the code/ packages the analysis stages use. Each stage imports its
+    own on first use so that importing this module (and booting the app) stays
+    cheap; model warm-up calls this to take the cost off the first request.
+    """
+    import components.freshness  # type: ignore  # noqa: F401
+    import parser.quotes_test  # type: ignore  # noqa: F401
+
+
+def _cache_input(payload: AnalyzeRequest) -> Dict[str, Any]:
+    return {
+        "input_type": payload.input_type,
+        "url": payload.url.strip() if payload.url else None,
+        "text": normalize_text(payload.text),
+        "published_date": payload.published_date,
+        "language": payload.language,
+    }
 
-def analyze_request(payload: AnalyzeRequest) -> AnalyzeResponse:
+
+def _cache_version() -> str:
+    return f"{CONTRACT_VERSION}:{get_model_version()}"
+
+
+def analyze_request(payload: AnalyzeRequest, article: Optional[ArticleContent] = None) -> AnalyzeResponse:
     """
     Orchestrate fetching/parsing (for URLs) or using raw text, then sentiment analysis,
-    freshness scoring, and assemble the AnalyzeResponse object.
+    freshness scoring, and assemble the AnalyzeResponse object. Repeated inputs are
+    served from the result cache. `article` skips the fetch when the URL was
+    already fetched (async fetch path).
     """
+    failed_stages: List[str] = []
+    response, cached = cached_call(
+        "analysis",
+        _cache_version(),
+        _cache_input(payload),
+        AnalyzeResponse,
+        lambda: _analyze_request(payload, article, failed_stages),
+        # Fallbacks and failed stages are never cached, so a retry can succeed
+        cacheable=lambda _: not failed_stages,
+    )
+    response.request_id = payload.request_id
+    if cached:
+        _refresh_cached(response)
+    return response
+
+
+def _refresh_cached(response: AnalyzeResponse) -> None:
+    # Freshness depends on today's date, and analyzed_at and seed belong to
+    # this request: recompute them rather than replaying the cached ones.
+    # Cached responses never hold a failed stage, so their only freshness
+    # error is the message of an "unknown" verdict, listed first.
+    stale_errors = len(_freshness_errors(response.freshness))
+    freshness = _freshness_stage(response.article)
+    response.freshness = freshness.value
+    response.errors = freshness.errors + response.errors[stale_errors:]
     ctx = create_determinism_context()
-    errors: list[str] = []
+    response.meta.analyzed_at = datetime.now(timezone.utc).isoformat()
+    response.meta.seed = ctx.seed
+    response.meta.cached = True
+
+
+async def analyze_request_async(payload: AnalyzeRequest) -> AnalyzeResponse:
+    """
+    Async entry point for the API. With FETCH_BACKEND=async, URL inputs are
+    fetched on the event loop (bounded, cancellable) and only the CPU-bound
+    analysis runs on the sentiment executor.
+    """
+    article = None
+    if payload.input_type == "url" and FETCH_BACKEND == "async":
+        article = await _fetch_article_async(payload.url)
+    return await run_inference("sentiment", analyze_request, payload, article)
+
+
+async def _fetch_article_async(url: Optional[str]) -> ArticleContent:
+    _require_url(url)
+    try:
+        with timed_stage("fetch"):
+            raw = await fetch_article_async(url)
+    except FetchError as exc:
+        raise _fetch_error(exc) from exc
+    return _article_from_raw(raw)
+
 
-    # Build article content
-    article: ArticleContent
-    if payload.input_type == "url":
-        article = _article_from_url(payload.url)
+async def prepare_analysis_stream(payload: AnalyzeRequest) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Resolve the input for a streaming analysis and return the event iterator.
+    Input and fetch errors raise here, before any event is sent, so they keep
+    their HTTP status. A cached result is replayed as events without fetching.
+    """
+    cached = lookup_cached("analysis", _cache_version(), _cache_input(payload), AnalyzeResponse)
+    if cached is not None:
+        cached.request_id = payload.request_id
+        _refresh_cached(cached)
+        return _replay_events(cached)
+
+    if payload.input_type == "url" and FETCH_BACKEND == "async":
+        article = await _fetch_article_async(payload.url)
     else:
-        article = _article_from_text(payload.text, payload.published_date)
+        article = await run_inference("sentiment", _resolve_article, payload, None)
+    return _stream_events(payload, article)
+
+
+async def _stream_events(payload: AnalyzeRequest, article: ArticleContent) -> AsyncIterator[Tuple[str, Any]]:
+    # Each step of the pipeline runs on the sentiment executor; events are
+    # yielded as soon as their step is done
+    failed_stages: List[str] = []
+    steps = _analysis_steps(payload, article, failed_stages)
+    executor = get_executor("sentiment")
+    pending: Optional[Future] = None
+    try:
+        while True:
+            pending = executor.submit(next, steps, None)
+            step = await asyncio.wrap_future(pending)
+            if step is None:
+                return
+            event, data = step
+            if event == "result" and not failed_stages:
+                store_cached("analysis", _cache_version(), _cache_input(payload), data)
+            yield event, data
+    finally:
+        # A client that disconnects leaves the steps suspended, holding their
+        # model handle: close them on the executor once the running step is done
+        def _close(_: Any = None) -> None:
+            executor.submit(steps.close)
+
+        if pending is None or pending.done():
+            _close()
+        else:
+            pending.add_done_callback(_close)
+
+
+async def _replay_events(response: AnalyzeResponse) -> AsyncIterator[Tuple[str, Any]]:
+    yield "article", response.article
+    yield "freshness", response.freshness
+    yield "quotes", QuotesFound(
+        quotes=[
+            QuoteFound(quote_text=q.quote_text, position=q.position, author=q.author)
+            for q in response.sentiment.quotes
+        ]
+    )
+    yield "main_sentiment", response.sentiment.main_text
+    for quote in response.sentiment.quotes:
+        yield "quote_sentiment", quote
+    yield "result", response
+
+
+def _resolve_article(payload: AnalyzeRequest, article: Optional[ArticleContent]) -> ArticleContent:
+    if article is None:
+        if payload.input_type == "url":
+            article = _article_from_url(payload.url)
+        else:
+            article = _article_from_text(payload.text, payload.published_date)
 
     if not article.content:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "EMPTY_CONTENT", "message": "Article content is empty"},
         )
+    return article
+
+
+def _analyze_request(
+    payload: AnalyzeRequest,
+    article: Optional[ArticleContent] = None,
+    failed_stages: Optional[List[str]] = None,
+) -> AnalyzeResponse:
+    for event, data in _analysis_steps(payload, _resolve_article(payload, article), failed_stages):
+        if event == "result":
+            return data
+    raise RuntimeError("analysis finished without a result")  # pragma: no cover
+
+
+@dataclass
+class _StageResult:
+    value: Any
+    errors: List[str] = field(default_factory=list)
+    sentiment_errors: List[str] = field(default_factory=list)
+    # The stage raised and `value` is its fallback
+    failed: bool = False
+
+
+def _freshness_errors(freshness: FreshnessResult) -> List[str]:
+    return [freshness.message] if freshness.status == "unknown" else []
+
+
+def _freshness_stage(article: ArticleContent) -> _StageResult:
+    from components.freshness import assess_freshness  # type: ignore
+
+    try:
+        with timed_stage("freshness"):
+            freshness_raw = assess_freshness(article.published_at)
+    except Exception as exc:
+        message = f"Не удалось определить свежесть: {exc}"
+        fallback = FreshnessResult(status="unknown", reference_date=date.today().isoformat(), message=message)
+        return _StageResult(fallback, [message], failed=True)
 
-    # Freshness calculation
-    freshness_raw = assess_freshness(article.published_at)
-    if freshness_raw.status == "unknown":
-        errors.append(freshness_raw.message)
     freshness = FreshnessResult(
         status=freshness_raw.status,
         age_days=freshness_raw.age_days,
@@ -77,82 +255,164 @@ def analyze_request(payload: AnalyzeRequest) -> AnalyzeResponse:
         message=freshness_raw.message,
         source_date=freshness_raw.source_date.isoformat() if freshness_raw.source_date else None,
     )
+    return _StageResult(freshness, _freshness_errors(freshness))
 
-    # Quote extraction and replacement
-    quotes_with_authors = find_quotes_and_authors(article.content)
-    quotes = [q["quote"] for q in quotes_with_authors]
-    if not quotes:
-        errors.append("Цитаты не найдены в тексте")
-    main_text = replace_quotes_with_placeholder(article.content)
 
-    # Sentiment analysis
+def _quotes_stage(article: ArticleContent) -> _StageResult:
+    from parser.quotes_test import find_quotes_and_authors  # type: ignore
+
     try:
-        sentiment_raw = analyze_sentiment_segments(main_text, quotes)
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        errors.append("Не удалось выполнить анализ тональности")
-        sentiment_raw = {
-            "main_text": {
-                "text": main_text,
-                "sentiment_label": "neutral",
-                "confidence": 0.0,
-            },
-            "quotes": [],
-            "errors": [str(exc)],
-        }
-
-    sentiment = SentimentResult(
-        main_text=SentimentSummary(**sentiment_raw["main_text"]),
-        quotes=[
-            QuoteSentiment(
-                **quote,
-                author=quotes_with_authors[idx]["authors"][0]
-                if quotes_with_authors[idx]["authors"]
-                else None,
-            )
-            for idx, quote in enumerate(sentiment_raw["quotes"])
-        ],
-        errors=sentiment_raw.get("errors", []),
-    )
+        with timed_stage("quotes"):
+            quotes_with_authors = find_quotes_and_authors(article.content)
+    except Exception as exc:
+        return _StageResult([], [f"Не удалось извлечь цитаты: {exc}"], failed=True)
 
-    errors.extend(sentiment.errors)
-
-    return AnalyzeResponse(
-        request_id=payload.request_id,
-        article=article,
-        freshness=freshness,
-        sentiment=sentiment,
-        meta=AnalysisMeta(
-            contract_version=CONTRACT_VERSION,
-            analysis_version=get_model_version(),
-            analyzed_at=datetime.now(timezone.utc).isoformat(),
-            seed=ctx.seed,
-        ),
-        errors=errors,
-    )
+    quotes = [
+        QuoteFound(quote_text=q["quote"], position=idx, author=q["authors"][0] if q["authors"] else None)
+        for idx, q in enumerate(quotes_with_authors)
+    ]
+    return _StageResult(quotes, [] if quotes else ["Цитаты не найдены в тексте"])
 
 
-def _article_from_url(url: Optional[str]) -> ArticleContent:
+def _placeholder_stage(article: ArticleContent) -> _StageResult:
+    from parser.quotes_test import replace_quotes_with_placeholder  # type: ignore
+
+    try:
+        with timed_stage("placeholder"):
+            return _StageResult(replace_quotes_with_placeholder(article.content))
+    except Exception as exc:
+        return _StageResult(article.content, [f"Не удалось заменить цитаты плейсхолдерами: {exc}"], failed=True)
+
+
+def _sentiment_stage(placeholder: _StageResult, quotes: _StageResult, analyzer: Any) -> _StageResult:
+    main_text = placeholder.value
+    found: List[QuoteFound] = quotes.value
+    try:
+        with timed_stage("sentiment"):
+            raw = analyze_sentiment_segments(main_text, [q.quote_text for q in found], analyzer)
+    except Exception as exc:
+        fallback = SentimentSummary(text=main_text, sentiment_label="neutral", confidence=0.0)
+        return _StageResult((fallback, []), ["Не удалось выполнить анализ тональности"], [str(exc)], failed=True)
+    main_sentiment = SentimentSummary(**raw["main_text"])
+    quote_sentiments = [QuoteSentiment(**summary, author=q.author) for q, summary in zip(found, raw["quotes"])]
+    return _StageResult((main_sentiment, quote_sentiments))
+
+
+def _analysis_steps(
+    payload: AnalyzeRequest,
+    article: ArticleContent,
+    failed_stages: Optional[List[str]] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    The analysis pipeline as a sequence of (event, partial result) steps:
+    article, freshness, quotes, main_sentiment, one quote_sentiment per quote
+    and finally result (the complete AnalyzeResponse).
+
+    Freshness, quote extraction and placeholder replacement run together on
+    the stage pool; the main text and the quotes are then scored in one
+    batched sentiment pass on the calling thread (a sentiment executor
+    thread, so the model stays within that pool's bound). Every stage
+    handles its own failure, so one failing stage only adds to `errors`; the
+    names of stages that fell back are appended to `failed_stages`.
+    """
+    ctx = create_determinism_context()
+    yield "article", article
+
+    # One sentiment model version serves the whole request, even across a reload
+    sentiment_model = _acquire_sentiment_model()
+    analyzer = sentiment_model.model if sentiment_model is not None else None
+    try:
+        graph = StageGraph()
+        graph.add("freshness", lambda: _freshness_stage(article))
+        graph.add("quotes", lambda: _quotes_stage(article))
+        graph.add("placeholder", lambda: _placeholder_stage(article))
+        futures = graph.run()
+
+        freshness = futures["freshness"].result()
+        yield "freshness", freshness.value
+        quotes = futures["quotes"].result()
+        yield "quotes", QuotesFound(quotes=quotes.value)
+        placeholder = futures["placeholder"].result()
+        sentiment_stage = _sentiment_stage(placeholder, quotes, analyzer)
+        main_sentiment, quote_sentiments = sentiment_stage.value
+        yield "main_sentiment", main_sentiment
+        for quote in quote_sentiments:
+            yield "quote_sentiment", quote
+
+        named = {"freshness": freshness, "quotes": quotes, "placeholder": placeholder, "sentiment": sentiment_stage}
+        stages = list(named.values())
+        if failed_stages is not None:
+            failed_stages.extend(name for name, stage in named.items() if stage.failed)
+        sentiment = SentimentResult(
+            main_text=main_sentiment,
+            quotes=quote_sentiments,
+            errors=[error for stage in stages for error in stage.sentiment_errors],
+        )
+        errors = [error for stage in stages for error in stage.errors]
+        errors.extend(sentiment.errors)
+
+        yield "result", AnalyzeResponse(
+            request_id=payload.request_id,
+            article=article,
+            freshness=freshness.value,
+            sentiment=sentiment,
+            meta=AnalysisMeta(
+                contract_version=CONTRACT_VERSION,
+                analysis_version=sentiment_model.version if sentiment_model is not None else get_model_version(),
+                analyzed_at=datetime.now(timezone.utc).isoformat(),
+                seed=ctx.seed,
+            ),
+            errors=errors,
+        )
+    finally:
+        if sentiment_model is not None:
+            registry.release(sentiment_model)
+
+
+def _acquire_sentiment_model() -> Optional[ModelHandle]:
+    # A model that fails to load is retried and reported by the sentiment stages
+    try:
+        return registry.acquire("sentiment")
+    except Exception:
+        return None
+
+
+def _require_url(url: Optional[str]) -> None:
     if not url:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "MISSING_URL", "message": "url must be provided for input_type='url'"},
         )
 
+
+def _fetch_error(exc: FetchError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail={"code": "FETCH_ERROR", "message": str(exc)},
+    )
+
+
+def _article_from_url(url: Optional[str]) -> ArticleContent:
+    _require_url(url)
+
     try:
-        raw = fetch_article(url=url)
+        with timed_stage("fetch"):
+            raw = fetch_article(url=url)
     except FetchError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"code": "FETCH_ERROR", "message": str(exc)},
-        ) from exc
+        raise _fetch_error(exc) from exc
+
+    return _article_from_raw(raw)
+
 
+def _article_from_raw(raw: Dict[str, Optional[str]]) -> ArticleContent:
     if raw.get("error"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"code": "FETCH_FAILED", "message": raw["error"]},
         )
 
-    return normalize_article(raw)
+    with timed_stage("normalize"):
+        return normalize_article(raw)
 
 
 def _article_from_text(text: Optional[str], published_date: Optional[str]) -> ArticleContent:
@@ -0,0 +1,489 @@
+import asyncio
+import ipaddress
+import re
+import socket
+import ssl
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from src.lib.cache import MISSING
+from src.lib.fetch_config import (
+    ASYNC_FETCH_ALLOW_PRIVATE_NETWORKS,
+    ASYNC_FETCH_CONNECT_TIMEOUT_SECONDS,
+    ASYNC_FETCH_MAX_BYTES,
+    ASYNC_FETCH_MAX_CONCURRENCY,
+    ASYNC_FETCH_MAX_REDIRECTS,
+    ASYNC_FETCH_PER_HOST_CONCURRENCY,
+    ASYNC_FETCH_READ_TIMEOUT_SECONDS,
+    ASYNC_FETCH_TOTAL_TIMEOUT_SECONDS,
+    ASYNC_FETCH_USER_AGENT,
+)
+
+from .fetcher import (
+    FetchError,
+    cache_fetch_failure,
+    cache_fetch_result,
+    canonicalize_url,
+    get_cached_fetch,
+    unwrap_cached_fetch,
+)
+
+
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([A-Za-z0-9_\-]+)""", re.IGNORECASE)
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def text(self) -> str:
+        charset = None
+        match = re.search(r"charset=([A-Za-z0-9_\-]+)", self.headers.get("content-type", ""))
+        if match:
+            charset = match.group(1)
+        else:
+            meta = _CHARSET_RE.search(self.body[:4096])
+            if meta:
+                charset = meta.group(1).decode("ascii")
+        try:
+            return self.body.decode(charset or "utf-8", errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+async def _read_line(reader: asyncio.StreamReader, timeout: float) -> bytes:
+    return await asyncio.wait_for(reader.readline(), timeout)
+
+
+async def _read_body(
+    reader: asyncio.StreamReader,
+    headers: Dict[str, str],
+    read_timeout: float,
+    max_bytes: int,
+) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+
+    def take(data: bytes) -> None:
+        nonlocal size
+        size += len(data)
+        if size > max_bytes:
+            raise FetchError(f"Response exceeds {max_bytes} bytes")
+        chunks.append(data)
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            line = await _read_line(reader, read_timeout)
+            chunk_size = int(line.split(b";", 1)[0].strip() or b"0", 16)
+            if chunk_size == 0:
+                # Trailer headers end with an empty line
+                while (await _read_line(reader, read_timeout)).strip():
+                    pass
+                break
+            take(await asyncio.wait_for(reader.readexactly(chunk_size), read_timeout))
+            await _read_line(reader, read_timeout)
+    elif "content-length" in headers:
+        length = int(headers["content-length"])
+        if length > max_bytes:
+            raise FetchError(f"Response exceeds {max_bytes} bytes")
+        take(await asyncio.wait_for(reader.readexactly(length), read_timeout))
+    else:
+        while True:
+            data = await asyncio.wait_for(reader.read(65536), read_timeout)
+            if not data:
+                break
+            take(data)
+
+    body = b"".join(chunks)
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        body = _decompress(body, 16 + zlib.MAX_WBITS, max_bytes)
+    elif encoding == "deflate":
+        try:
+            body = _decompress(body, zlib.MAX_WBITS, max_bytes)
+        except zlib.error:
+            body = _decompress(body, -zlib.MAX_WBITS, max_bytes)
+    return body
+
+
+def _decompress(data: bytes, wbits: int, max_bytes: int) -> bytes:
+    # The compressed size was checked while reading; bound the output too, so
+    # a small compressed body cannot expand without limit
+    decompressor = zlib.decompressobj(wbits)
+    body = decompressor.decompress(data, max_bytes + 1)
+    if len(body) > max_bytes or decompressor.unconsumed_tail:
+        raise FetchError(f"Decompressed response exceeds {max_bytes} bytes")
+    return body
+
+
+def _is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def _resolve(host: str, port: int, allow_private: bool) -> str:
+    """
+    Resolve `host` and return the address to connect to. Unless
+    `allow_private`, every address it resolves to must be public: loopback,
+    private, link-local (cloud metadata) and reserved ranges are refused.
+    The caller connects to the returned address, so a second lookup cannot
+    swap in another one.
+    """
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as exc:
+        raise FetchError(f"Cannot resolve {host}: {exc}") from exc
+    addresses = [info[4][0] for info in infos]
+    if not addresses:
+        raise FetchError(f"Cannot resolve {host}")
+    if not allow_private:
+        blocked = [address for address in addresses if not _is_public_address(address)]
+        if blocked:
+            raise FetchError(f"Refusing to fetch {host}: it resolves to non-public address {blocked[0]}")
+    return addresses[0]
+
+
+async def http_get(
+    url: str,
+    connect_timeout: float = ASYNC_FETCH_CONNECT_TIMEOUT_SECONDS,
+    read_timeout: float = ASYNC_FETCH_READ_TIMEOUT_SECONDS,
+    max_bytes: int = ASYNC_FETCH_MAX_BYTES,
+    user_agent: str = ASYNC_FETCH_USER_AGENT,
+    allow_private: bool = ASYNC_FETCH_ALLOW_PRIVATE_NETWORKS,
+) -> HttpResponse:
+    """
+    Minimal asyncio HTTP/1.1 GET (one request per connection) with separate
+    connect and per-read timeouts. Hosts resolving to non-public addresses are
+    refused unless `allow_private`. Raises FetchError on network failures.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise FetchError(f"Unsupported URL: {url}")
+
+    secure = parts.scheme == "https"
+    port = parts.port or (443 if secure else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+
+    try:
+        address = await asyncio.wait_for(_resolve(parts.hostname, port, allow_private), connect_timeout)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                address,
+                port,
+                ssl=ssl.create_default_context() if secure else None,
+                server_hostname=parts.hostname if secure else None,
+            ),
+            connect_timeout,
+        )
+    except asyncio.TimeoutError as exc:
+        raise FetchError(f"Connect timeout after {connect_timeout:.1f}s: {url}") from exc
+    except OSError as exc:
+        raise FetchError(f"Connection failed: {exc}") from exc
+
+    try:
+        host_header = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        request = (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            f"User-Agent: {user_agent}\r\n"
+            "Accept: text/html,application/xhtml+xml;q=0.9,*/*;q=0.8\r\n"
+            "Accept-Encoding: gzip, deflate\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(request.encode("latin-1"))
+        await asyncio.wait_for(writer.drain(), read_timeout)
+
+        status_line = await _read_line(reader, read_timeout)
+        fields = status_line.decode("latin-1").split(" ", 2)
+        if len(fields) < 2 or not fields[1].isdigit():
+            raise FetchError(f"Malformed response from {parts.hostname}")
+        status = int(fields[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await _read_line(reader, read_timeout)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        body = await _read_body(reader, headers, read_timeout, max_bytes)
+        return HttpResponse(url=url, status=status, headers=headers, body=body)
+    except asyncio.TimeoutError as exc:
+        raise FetchError(f"Read timeout after {read_timeout:.1f}s: {url}") from exc
+    except (OSError, asyncio.IncompleteReadError, ValueError, zlib.error) as exc:
+        raise FetchError(f"Failed to read response from {parts.hostname}: {exc}") from exc
+    finally:
+        writer.close()
+
+
+def parse_article_html(html: str, url: str) -> Dict[str, Optional[str]]:
+    """
+    Extract title/text/date/author from article HTML with newspaper3k, falling
+    back to a plain BeautifulSoup extraction.
+    """
+    try:
+        from newspaper import Article  # type: ignore
+
+        article = Article(url, language="ru")
+        article.download(input_html=html)
+        article.parse()
+        if article.text:
+            return {
+                "title": article.title or None,
+                "text": article.text,
+                "date": article.publish_date.isoformat() if article.publish_date else None,
+                "author": ", ".join(article.authors) or None,
+            }
+    except Exception:  # pragma: no cover - optional dependency / parser failure
+        pass
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+
+    def meta(*names: str) -> Optional[str]:
+        for name in names:
+            tag = soup.find("meta", attrs={"property": name}) or soup.find("meta", attrs={"name": name})
+            if tag and tag.get("content"):
+                return tag["content"].strip()
+        return None
+
+    title = meta("og:title") or (soup.title.string.strip() if soup.title and soup.title.string else None)
+    paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
+    return {
+        "title": title,
+        "text": "\n".join(p for p in paragraphs if p),
+        "date": meta("article:published_time", "pubdate", "date"),
+        "author": meta("author", "article:author"),
+    }
+
+
+@dataclass
+class _InflightFetch:
+    task: "asyncio.Task[Dict[str, Optional[str]]]"
+    waiters: int = 0
+
+
+class AsyncFetcher:
+    """
+    asyncio-native article fetcher that bounds total and per-host concurrency
+    and enforces connect/read/total timeouts. Cancelling the awaiting task
+    closes the upstream connection. URLs come from users, so hosts (including
+    redirect targets) resolving to non-public addresses are refused.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = ASYNC_FETCH_MAX_CONCURRENCY,
+        per_host_concurrency: int = ASYNC_FETCH_PER_HOST_CONCURRENCY,
+        connect_timeout: float = ASYNC_FETCH_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = ASYNC_FETCH_READ_TIMEOUT_SECONDS,
+        total_timeout: float = ASYNC_FETCH_TOTAL_TIMEOUT_SECONDS,
+        max_redirects: int = ASYNC_FETCH_MAX_REDIRECTS,
+        use_cache: bool = True,
+        allow_private: bool = ASYNC_FETCH_ALLOW_PRIVATE_NETWORKS,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.max_redirects = max_redirects
+        self.use_cache = use_cache
+        self.allow_private = allow_private
+
+        self._total: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[str, _InflightFetch] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._active = 0
+        self._peak_active = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._cancelled = 0
+        self._coalesced = 0
+        self._latencies_ms: Deque[float] = deque(maxlen=2048)
+
+    def _bind_loop(self) -> None:
+        # Semaphores belong to one event loop; rebuild them if the loop changed.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._total = asyncio.Semaphore(self.max_concurrency)
+            self._hosts = {}
+            self._inflight = {}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._hosts[host] = semaphore
+        return semaphore
+
+    async def fetch(self, url: str) -> Dict[str, Optional[str]]:
+        """
+        Fetch and parse an article. Same result shape as `fetch_article`;
+        shares its cache and coalesces concurrent requests for one URL.
+        """
+        self._bind_loop()
+        key = canonicalize_url(url)
+
+        if self.use_cache:
+            cached = get_cached_fetch(key)
+            if cached is not MISSING:
+                return unwrap_cached_fetch(cached)
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = _InflightFetch(asyncio.ensure_future(self._fetch_entry(url, key)))
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._coalesced += 1
+
+        inflight.waiters += 1
+        try:
+            # shield: one caller cancelling must not cancel the fetch for the others
+            return dict(await asyncio.shield(inflight.task))
+        except asyncio.CancelledError:
+            if inflight.waiters == 1 and not inflight.task.done():
+                inflight.task.cancel()
+            raise
+        finally:
+            inflight.waiters -= 1
+
+    async def _fetch_entry(self, url: str, key: str) -> Dict[str, Optional[str]]:
+        try:
+            result = await self._fetch_uncached(url)
+        except FetchError as exc:
+            if self.use_cache:
+                cache_fetch_failure(key, str(exc))
+            raise
+        if self.use_cache:
+            cache_fetch_result(key, result)
+        return result
+
+    async def _fetch_uncached(self, url: str) -> Dict[str, Optional[str]]:
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(self._get_following_redirects(url), self.total_timeout)
+        except asyncio.TimeoutError as exc:
+            self._timeouts += 1
+            self._failed += 1
+            raise FetchError(f"Fetch timed out after {self.total_timeout:.1f}s: {url}") from exc
+        except asyncio.CancelledError:
+            self._cancelled += 1
+            raise
+        except FetchError:
+            self._failed += 1
+            raise
+        finally:
+            self._latencies_ms.append((time.perf_counter() - started) * 1000.0)
+
+        self._completed += 1
+        if response.status >= 400:
+            return _result(url, response.url, error=f"HTTP {response.status}")
+
+        fields = await asyncio.to_thread(parse_article_html, response.text(), response.url)
+        if not fields.get("text"):
+            return _result(url, response.url, error="Article text not found")
+        return _result(url, response.url, **fields)
+
+    async def _get_following_redirects(self, url: str) -> HttpResponse:
+        # Every hop is resolved and checked again by http_get
+        current = url
+        for _ in range(self.max_redirects + 1):
+            response = await self._get_limited(current)
+            location = response.headers.get("location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            current = urljoin(current, location)
+        raise FetchError(f"Too many redirects: {url}")
+
+    async def _get_limited(self, url: str) -> HttpResponse:
+        host = (urlsplit(url).hostname or "").lower()
+        assert self._total is not None
+        async with self._total, self._host_semaphore(host):
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+            try:
+                return await http_get(
+                    url,
+                    connect_timeout=self.connect_timeout,
+                    read_timeout=self.read_timeout,
+                    allow_private=self.allow_private,
+                )
+            finally:
+                self._active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies_ms)
+
+        def pct(q: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(round(q * (len(latencies) - 1))))]
+
+        return {
+            "max_concurrency": self.max_concurrency,
+            "per_host_concurrency": self.per_host_concurrency,
+            "active": self._active,
+            "peak_active": self._peak_active,
+            "hosts": len(self._hosts),
+            "completed": self._completed,
+            "failed": self._failed,
+            "timeouts": self._timeouts,
+            "cancelled": self._cancelled,
+            "coalesced": self._coalesced,
+            "latency_ms": {"p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99), "max": pct(1.0)},
+        }
+
+
+def _result(url: str, final_url: str, error: Optional[str] = None, **fields: Any) -> Dict[str, Optional[str]]:
+    return {
+        "title": fields.get("title"),
+        "text": fields.get("text"),
+        "date": fields.get("date"),
+        "author": fields.get("author"),
+        "url": final_url or url,
+        "parser_type": "async",
+        "error": error,
+    }
+
+
+_fetcher: Optional[AsyncFetcher] = None
+
+
+def get_async_fetcher() -> AsyncFetcher:
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = AsyncFetcher()
+    return _fetcher
+
+
+async def fetch_article_async(url: str) -> Dict[str, Optional[str]]:
+    """
+    Async counterpart of `fetch_article` used when FETCH_BACKEND=async.
+    """
+    return await get_async_fetcher().fetch(url)
+
+
+def async_fetch_stats() -> Dict[str, Any]:
+    if _fetcher is None:
+        return {"started": False}
+    return {"started": True, **_fetcher.stats()}
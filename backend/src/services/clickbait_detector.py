@@ -1,20 +1,40 @@
 import importlib.util
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 from fastapi import HTTPException, status
 
 from src.api.schemas_clickbait import ClickbaitAnalyzeRequest, ClickbaitAnalyzeResponse
 from src.lib.clickbait_config import (
+    CLICKBAIT_BACKEND,
+    CLICKBAIT_BATCH_MAX_SIZE,
+    CLICKBAIT_BATCH_MAX_WAIT_MS,
+    CLICKBAIT_BATCHING_ENABLED,
     CLICKBAIT_CONTRACT_VERSION,
     CLICKBAIT_DETECTOR_VERSION,
     CLICKBAIT_MODEL_PATH,
     CLICKBAIT_MODULE_PATH,
+    CLICKBAIT_ONNX_PATH,
     CLICKBAIT_THRESHOLD,
 )
-from src.lib.determinism import create_determinism_context
+from src.lib.determinism import configure_deterministic_inference
+from src.lib.metrics import timed_stage
+from src.lib.profiling import profiling_active
 
+from .model_registry import ModelHandle, registry
+from .result_cache import cached_batch, cached_call, normalize_text
+
+logger = logging.getLogger(__name__)
 
 def _load_predict_module():
     if not CLICKBAIT_MODULE_PATH.exists():
@@ -29,13 +49,256 @@ def _load_predict_module():
     return module
 
 
-@lru_cache(maxsize=1)
-def _get_detector():
+def _load_detector(model_path: Optional[str] = None) -> Any:
     module = _load_predict_module()
+    # The predict module imported torch; configure it before the first inference
+    configure_deterministic_inference()
     detector_cls = getattr(module, "ClickbaitDetector", None)
     if detector_cls is None:
         raise RuntimeError("ClickbaitDetector class not found in predict module")
-    return detector_cls(model_path=str(CLICKBAIT_MODEL_PATH))
+    detector = detector_cls(model_path=model_path or str(CLICKBAIT_MODEL_PATH))
+    info: Dict[str, Any] = {"requested": CLICKBAIT_BACKEND}
+    if CLICKBAIT_BACKEND == "onnx":
+        detector = _use_onnx(detector, _onnx_path(model_path), info)
+    info["active"] = getattr(detector, "backend", "torch")
+    # Kept on the loaded version, so a reload does not rewrite what the
+    # serving one reports
+    detector.backend_info = info
+    return detector
+
+
+def _onnx_path(model_path: Optional[str]) -> Path:
+    # A reloaded checkpoint exports next to itself, under the configured file name
+    if model_path is None:
+        return CLICKBAIT_ONNX_PATH
+    path = Path(model_path)
+    return (path if path.is_dir() else path.parent) / CLICKBAIT_ONNX_PATH.name
+
+
+def _use_onnx(detector: Any, onnx_path: Path, info: Dict[str, Any]) -> Any:
+    # Any failure (missing onnxruntime, export error, parity drift) keeps torch
+    try:
+        from .clickbait_onnx import load_onnx_detector
+
+        onnx_detector, details = load_onnx_detector(detector, onnx_path)
+    except Exception as exc:
+        logger.warning("ONNX clickbait backend unavailable, using torch: %s", exc)
+        info["error"] = str(exc)
+        return detector
+    info.update(details)
+    return onnx_detector
+
+
+def get_backend_info() -> Dict[str, Any]:
+    """
+    Report the requested and active inference backend of the serving version
+    (active is None until the model loads).
+    """
+    handle = registry.peek("clickbait")
+    info = getattr(handle.model, "backend_info", None) if handle is not None else None
+    return dict(info) if info else {"requested": CLICKBAIT_BACKEND, "active": None}
+
+
+def _warm_up_detector(detector: Any) -> None:
+    detector.score("Учёные раскрыли секрет, о котором молчали годами")
+
+
+registry.register("clickbait", _load_detector, _warm_up_detector, CLICKBAIT_DETECTOR_VERSION)
+
+
+def load_model() -> Any:
+    """
+    Load the clickbait detector (once per process) and return the current version.
+    """
+    return registry.current("clickbait").model
+
+
+def warm_up() -> None:
+    """
+    Run one dummy headline through the detector to warm tokenizer and kernels.
+    """
+    _warm_up_detector(load_model())
+
+
+@dataclass
+class _PendingHeadline:
+    headline: str
+    handle: ModelHandle
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: Future = field(default_factory=Future)
+
+
+class ClickbaitBatcher:
+    """
+    Collect concurrent headline requests into micro-batches and score each batch
+    with a single padded forward pass. A batch is dispatched when it reaches
+    `max_batch_size` or when its oldest request has waited `max_wait_ms`.
+    Every headline is scored by the model version its caller holds: during a
+    reload, a batch that mixes versions runs one forward pass per version.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[ModelHandle, List[str]], List[Dict[str, Any]]],
+        max_batch_size: int = CLICKBAIT_BATCH_MAX_SIZE,
+        max_wait_ms: float = CLICKBAIT_BATCH_MAX_WAIT_MS,
+        stats_window: int = 1024,
+    ) -> None:
+        self._runner = runner
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: "queue.Queue[_PendingHeadline]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+
+        self._batches = 0
+        self._items = 0
+        self._max_batch_seen = 0
+        self._size_histogram: Dict[int, int] = {}
+        self._waits_ms: deque = deque(maxlen=stats_window)
+        self._max_wait_ms = 0.0
+
+    def submit(self, headline: str, handle: ModelHandle) -> Future:
+        """
+        Enqueue a headline to be scored by `handle` (which the caller keeps
+        acquired until the result arrives) and return a future resolved with
+        its prediction.
+        """
+        self._ensure_worker()
+        pending = _PendingHeadline(headline=headline, handle=handle)
+        self._queue.put(pending)
+        return pending.future
+
+    def predict(self, headline: str, handle: ModelHandle) -> Dict[str, Any]:
+        return self.submit(headline, handle).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Batch-size and queue-wait statistics since process start (waits are
+        computed over the most recent requests only).
+        """
+        with self._lock:
+            waits = sorted(self._waits_ms)
+            batches = self._batches
+            items = self._items
+            return {
+                "enabled": True,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+                "queue_depth": self._queue.qsize(),
+                "batches": batches,
+                "items": items,
+                "avg_batch_size": (items / batches) if batches else 0.0,
+                "max_batch_size_seen": self._max_batch_seen,
+                "batch_size_histogram": dict(sorted(self._size_histogram.items())),
+                "queue_wait_ms": {
+                    "avg": (sum(waits) / len(waits)) if waits else 0.0,
+                    "p50": _percentile(waits, 0.50),
+                    "p95": _percentile(waits, 0.95),
+                    "max": self._max_wait_ms,
+                },
+            }
+
+    def _ensure_worker(self) -> None:
+        # A forked child inherits the thread object but not the running thread.
+        pid = os.getpid()
+        if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+                return
+            if self._worker_pid != pid:
+                self._queue = queue.Queue()
+            self._worker = threading.Thread(target=self._run, name="clickbait-batcher", daemon=True)
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _collect(self) -> List[_PendingHeadline]:
+        first = self._queue.get()
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            dispatched_at = time.monotonic()
+            self._record(batch, dispatched_at)
+
+            groups: Dict[int, List[_PendingHeadline]] = {}
+            for item in batch:
+                groups.setdefault(id(item.handle), []).append(item)
+            for group in groups.values():
+                self._dispatch(group)
+
+    def _dispatch(self, group: List[_PendingHeadline]) -> None:
+        try:
+            results = self._runner(group[0].handle, [item.headline for item in group])
+            if len(results) != len(group):
+                raise RuntimeError(
+                    f"clickbait batch returned {len(results)} results for {len(group)} inputs"
+                )
+        except Exception as exc:
+            for item in group:
+                item.future.set_exception(exc)
+            return
+
+        for item, result in zip(group, results):
+            item.future.set_result(result)
+
+    def _record(self, batch: List[_PendingHeadline], dispatched_at: float) -> None:
+        size = len(batch)
+        with self._lock:
+            self._batches += 1
+            self._items += size
+            self._max_batch_seen = max(self._max_batch_seen, size)
+            self._size_histogram[size] = self._size_histogram.get(size, 0) + 1
+            for item in batch:
+                wait_ms = (dispatched_at - item.enqueued_at) * 1000.0
+                self._waits_ms.append(wait_ms)
+                self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def _run_batch(handle: ModelHandle, headlines: List[str]) -> List[Dict[str, Any]]:
+    return handle.model.score_batch(headlines)
+
+
+@lru_cache(maxsize=1)
+def _get_batcher() -> ClickbaitBatcher:
+    return ClickbaitBatcher(runner=_run_batch)
+
+
+def get_batching_stats() -> Dict[str, Any]:
+    """
+    Return micro-batching statistics for the clickbait detector.
+    """
+    if not CLICKBAIT_BATCHING_ENABLED:
+        return {"enabled": False}
+    return _get_batcher().stats()
+
+
+def _score(handle: ModelHandle, headline: str) -> Dict[str, Any]:
+    # A profiled request scores on its own thread so model time is in the profile
+    if CLICKBAIT_BATCHING_ENABLED and not profiling_active():
+        return _get_batcher().predict(headline, handle)
+    return handle.model.score(headline)
 
 
 def _normalize_score(raw_score: Any) -> float:
@@ -61,34 +324,102 @@ def _fallback_response(message: str) -> ClickbaitAnalyzeResponse:
         label="status unavailable",
         confidence_note=message,
         contract_version=CLICKBAIT_CONTRACT_VERSION,
-        detector_version=CLICKBAIT_DETECTOR_VERSION,
+        detector_version=registry.version("clickbait"),
         evaluated_at=now,
     )
 
 
+def _cache_version(detector_version: str) -> str:
+    # Follows the active model version, so a reload invalidates cached results
+    return f"{CLICKBAIT_CONTRACT_VERSION}:{detector_version}:{CLICKBAIT_THRESHOLD}"
+
+
+def _cache_input(payload: ClickbaitAnalyzeRequest) -> Dict[str, Any]:
+    return {"headline": normalize_text(payload.headline)}
+
+
+def _cacheable(detector_version: str) -> Callable[[ClickbaitAnalyzeResponse], bool]:
+    # A reload may swap versions between building the cache key and scoring:
+    # only a response from the key's version is stored under it
+    return lambda response: (
+        response.label != "status unavailable" and response.detector_version == detector_version
+    )
+
+
 def analyze_clickbait(payload: ClickbaitAnalyzeRequest) -> ClickbaitAnalyzeResponse:
     """
     Run clickbait detection for a single headline. Returns a structured response or
-    a neutral fallback when inference fails.
+    a neutral fallback when inference fails. Repeated headlines are served from
+    the result cache.
     """
-    create_determinism_context()  # sets seeds for deterministic scoring
+    detector_version = registry.version("clickbait")
+    response, cached = cached_call(
+        "clickbait",
+        _cache_version(detector_version),
+        _cache_input(payload),
+        ClickbaitAnalyzeResponse,
+        lambda: _analyze_clickbait(payload),
+        cacheable=_cacheable(detector_version),
+    )
+    response.cached = cached
+    return response
+
 
+def _analyze_clickbait(payload: ClickbaitAnalyzeRequest) -> ClickbaitAnalyzeResponse:
     try:
-        detector = _get_detector()
+        registry.current("clickbait")
     except Exception as exc:  # pragma: no cover - defensive path
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"code": "CLICKBAIT_INIT_ERROR", "message": str(exc)},
         ) from exc
 
+    with registry.use("clickbait") as handle:
+        try:
+            with timed_stage("clickbait"):
+                result = _score(handle, payload.headline)
+        except Exception as exc:
+            # Graceful neutral fallback while preserving API contract
+            return _fallback_response(f"clickbait detector unavailable: {exc}")
+
+        return _build_response(handle, result)
+
+
+def analyze_clickbait_batch(payloads: List[ClickbaitAnalyzeRequest]) -> List[ClickbaitAnalyzeResponse]:
+    """
+    Run clickbait detection for several headlines with one batched forward pass.
+    Cached and repeated headlines are scored once. Returns responses in input order.
+    """
+    detector_version = registry.version("clickbait")
+    results = cached_batch(
+        "clickbait",
+        _cache_version(detector_version),
+        [_cache_input(payload) for payload in payloads],
+        ClickbaitAnalyzeResponse,
+        lambda indices: _analyze_clickbait_batch([payloads[i] for i in indices]),
+        cacheable=_cacheable(detector_version),
+    )
+    responses = []
+    for response, cached in results:
+        response.cached = cached
+        responses.append(response)
+    return responses
+
+
+def _analyze_clickbait_batch(payloads: List[ClickbaitAnalyzeRequest]) -> List[ClickbaitAnalyzeResponse]:
     try:
-        result = detector.predict(payload.headline)
+        with registry.use("clickbait") as handle:
+            unique = list(dict.fromkeys(payload.headline for payload in payloads))
+            with timed_stage("clickbait"):
+                scored = dict(zip(unique, handle.model.score_batch(unique)))
+            return [_build_response(handle, scored[payload.headline]) for payload in payloads]
     except Exception as exc:
-        # Graceful neutral fallback while preserving API contract
-        return _fallback_response(f"clickbait detector unavailable: {exc}")
+        return [_fallback_response(f"clickbait detector unavailable: {exc}") for _ in payloads]
+
 
+def _build_response(handle: ModelHandle, result: Dict[str, Any]) -> ClickbaitAnalyzeResponse:
     score = _normalize_score(result.get("score"))
-    is_clickbait = detector.is_clickbait(payload.headline, threshold=CLICKBAIT_THRESHOLD)
+    is_clickbait = handle.model.decide(result, threshold=CLICKBAIT_THRESHOLD)
     label = "clickbait" if is_clickbait else "not clickbait"
     note = _confidence_note(score)
 
@@ -98,6 +429,6 @@ def analyze_clickbait(payload: ClickbaitAnalyzeRequest) -> ClickbaitAnalyzeRespo
         label=label,
         confidence_note=note,
         contract_version=CLICKBAIT_CONTRACT_VERSION,
-        detector_version=CLICKBAIT_DETECTOR_VERSION,
+        detector_version=handle.version,
         evaluated_at=datetime.now(timezone.utc),
     )
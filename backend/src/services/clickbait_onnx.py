@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.lib.clickbait_config import (
+    CLICKBAIT_ONNX_INTRA_OP_THREADS,
+    CLICKBAIT_ONNX_PARITY_TOLERANCE,
+    CLICKBAIT_ONNX_PATH,
+)
+
+_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+_WEIGHT_SUFFIXES = (".json", ".safetensors", ".bin", ".txt", ".model")
+
+PARITY_HEADLINES = [
+    "Учёные раскрыли секрет, о котором молчали годами",
+    "Вы не поверите, что случилось дальше",
+    "Центробанк сохранил ключевую ставку на прежнем уровне",
+    "Правительство утвердило бюджет на следующий год",
+    "Эта простая привычка изменит вашу жизнь навсегда",
+    "В Москве открылась новая станция метро",
+]
+
+
+class OnnxClickbaitDetector:
+    """
+    Scores headlines with an exported ONNX graph through onnxruntime. Exposes the
+    same `score`/`score_batch`/`decide` interface as the PyTorch ClickbaitDetector.
+    ORT sessions and their thread pools are not fork-safe, so the session is
+    created on first use in each process: the pre-fork master only validates
+    the graph and drops its session (`close_session`) before forking.
+    """
+
+    backend = "onnx"
+
+    def __init__(
+        self,
+        onnx_path: Path,
+        tokenizer: Any,
+        id2label: Dict[int, str],
+        decide: Callable[..., bool],
+    ) -> None:
+        self.onnx_path = onnx_path
+        self.tokenizer = tokenizer
+        self.id2label = id2label
+        self.decide = decide
+        self._session: Any = None
+        self._session_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> Any:
+        if self._session is None or self._session_pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._session_pid != os.getpid():
+                    self._session = create_session(self.onnx_path)
+                    self._session_pid = os.getpid()
+        return self._session
+
+    def close_session(self) -> None:
+        with self._lock:
+            self._session = None
+            self._session_pid = None
+
+    def score(self, text: str, thresholds: Optional[Iterable[float]] = None) -> Dict:
+        return self.score_batch([text], thresholds=thresholds)[0]
+
+    def score_batch(self, texts, thresholds: Optional[Iterable[float]] = None) -> List[Dict]:
+        texts = list(texts)
+        if not texts:
+            return []
+        thresholds = list(thresholds) if thresholds is not None else None
+
+        session = self.session
+        encoded = self.tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        feed = {i.name: encoded[i.name].astype(np.int64) for i in session.get_inputs()}
+        logits = session.run(None, feed)[0].astype(np.float64)
+        if logits.shape[-1] == 1:
+            probs = 1.0 / (1.0 + np.exp(-logits))
+        else:
+            shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probs = shifted / shifted.sum(axis=-1, keepdims=True)
+
+        results = []
+        for row in probs.tolist():
+            top = max(range(len(row)), key=row.__getitem__)
+            result = {
+                "label": self.id2label[top],
+                "score": row[top],
+                "probabilities": {self.id2label[i]: p for i, p in enumerate(row)},
+            }
+            if thresholds is not None:
+                result["decisions"] = {t: self.decide(result, t) for t in thresholds}
+            results.append(result)
+        return results
+
+
+def _model_dir(detector: Any) -> Optional[Path]:
+    name = getattr(detector.model, "name_or_path", "") or ""
+    path = Path(name)
+    return path if name and path.is_dir() else None
+
+
+def _fingerprint(detector: Any, onnx_path: Path) -> Dict[str, Any]:
+    # The export is reused only while the source checkpoint files are unchanged;
+    # the export and its metadata may live in the same directory and are skipped
+    import torch
+
+    files = {}
+    model_dir = _model_dir(detector)
+    if model_dir is not None:
+        for item in sorted(model_dir.iterdir()):
+            if item.name.startswith(onnx_path.stem) and ".onnx" in item.name:
+                continue
+            if item.is_file() and item.suffix in _WEIGHT_SUFFIXES:
+                stat = item.stat()
+                files[item.name] = [stat.st_size, stat.st_mtime_ns]
+    return {"source": str(model_dir) if model_dir else None, "files": files, "torch": torch.__version__}
+
+
+def _keyed_path(onnx_path: Path, fingerprint: Dict[str, Any]) -> Path:
+    # One file per checkpoint state: a reload exports a new file instead of
+    # rewriting the graph that serving (or draining) versions still load
+    digest = hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()[:12]
+    return onnx_path.with_name(f"{onnx_path.stem}-{digest}{onnx_path.suffix}")
+
+
+def _meta_path(onnx_path: Path) -> Path:
+    return onnx_path.with_name(onnx_path.name + ".json")
+
+
+def _is_fresh(onnx_path: Path, fingerprint: Dict[str, Any]) -> bool:
+    meta_path = _meta_path(onnx_path)
+    if not onnx_path.exists() or not meta_path.exists():
+        return False
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8")) == fingerprint
+    except (OSError, ValueError):
+        return False
+
+
+def export_onnx(detector: Any, onnx_path: Path) -> None:
+    """
+    Export the detector's classifier to ONNX with dynamic batch and sequence axes.
+    The file is written atomically so concurrent loaders never see a partial graph.
+    """
+    import torch
+
+    class _Logits(torch.nn.Module):
+        def __init__(self, model: Any, names: List[str]) -> None:
+            super().__init__()
+            self.model = model
+            self.names = names
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(self.names, inputs))).logits
+
+    model = detector.model.eval()
+    sample = detector.tokenizer(PARITY_HEADLINES[:2], padding=True, return_tensors="pt")
+    names = [name for name in _INPUT_NAMES if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    onnx_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = onnx_path.with_name(f"{onnx_path.name}.{os.getpid()}.tmp")
+    kwargs = dict(
+        input_names=names,
+        output_names=["logits"],
+        dynamic_axes=dynamic_axes,
+        opset_version=17,
+    )
+    wrapper = _Logits(model, names).eval()
+    args = tuple(sample[name] for name in names)
+    with torch.no_grad():
+        try:
+            torch.onnx.export(wrapper, args, str(tmp_path), dynamo=False, **kwargs)
+        except TypeError:  # torch < 2.5 has no `dynamo` switch
+            torch.onnx.export(wrapper, args, str(tmp_path), **kwargs)
+    os.replace(tmp_path, onnx_path)
+
+
+def create_session(onnx_path: Path, intra_op_threads: int = CLICKBAIT_ONNX_INTRA_OP_THREADS) -> Any:
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.inter_op_num_threads = 1
+    if intra_op_threads > 0:
+        options.intra_op_num_threads = intra_op_threads
+    return ort.InferenceSession(str(onnx_path), sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def parity_gap(reference: Any, candidate: Any, texts: List[str] = PARITY_HEADLINES) -> float:
+    """
+    Largest absolute difference between per-label probabilities of two detectors.
+    """
+    gap = 0.0
+    for expected, actual in zip(reference.score_batch(texts), candidate.score_batch(texts)):
+        if expected["label"] != actual["label"]:
+            return float("inf")
+        for label, prob in expected["probabilities"].items():
+            gap = max(gap, abs(prob - actual["probabilities"][label]))
+    return gap
+
+
+def load_onnx_detector(
+    detector: Any,
+    onnx_path: Path = CLICKBAIT_ONNX_PATH,
+    tolerance: float = CLICKBAIT_ONNX_PARITY_TOLERANCE,
+) -> tuple[OnnxClickbaitDetector, Dict[str, Any]]:
+    """
+    Build an ONNX Runtime detector from a loaded PyTorch detector, exporting the
+    graph first unless a fresh export is cached. The export is named after
+    `onnx_path` plus a digest of the checkpoint files (`model-<digest>.onnx`),
+    so an existing graph is never overwritten. Raises when the
+    ONNX scores differ from PyTorch by more than `tolerance`. The session used
+    for the check is dropped again, so the detector is safe to fork.
+    """
+    fingerprint = _fingerprint(detector, onnx_path)
+    onnx_path = _keyed_path(onnx_path, fingerprint)
+    exported = False
+    if not _is_fresh(onnx_path, fingerprint):
+        export_onnx(detector, onnx_path)
+        _meta_path(onnx_path).write_text(json.dumps(fingerprint), encoding="utf-8")
+        exported = True
+
+    id2label = {int(k): v for k, v in detector.model.config.id2label.items()}
+    candidate = OnnxClickbaitDetector(onnx_path, detector.tokenizer, id2label, type(detector).decide)
+
+    gap = parity_gap(detector, candidate)
+    candidate.close_session()
+    if gap > tolerance:
+        raise RuntimeError(f"ONNX parity check failed: max probability gap {gap:.2e} > {tolerance:.0e}")
+
+    return candidate, {"onnx_path": str(onnx_path), "exported": exported, "parity_max_abs_diff": gap}
@@ -0,0 +1,141 @@
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.lib.metrics import INFERENCE_IN_FLIGHT, QUEUE_SECONDS
+from src.lib.profiling import run_profiled
+from src.lib.server_config import (
+    CLICKBAIT_EXECUTOR_WORKERS,
+    SENTIMENT_EXECUTOR_WORKERS,
+    STAGE_EXECUTOR_WORKERS,
+    WATER_EXECUTOR_WORKERS,
+)
+
+
+POOL_SIZES: Dict[str, int] = {
+    "sentiment": SENTIMENT_EXECUTOR_WORKERS,
+    "clickbait": CLICKBAIT_EXECUTOR_WORKERS,
+    "water": WATER_EXECUTOR_WORKERS,
+    "stage": STAGE_EXECUTOR_WORKERS,
+}
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool dedicated to one model family. Tracks how many tasks are
+    waiting for a free thread (queue depth) and how many are running. Tasks run
+    in a copy of the caller's context, so request-scoped context variables
+    (stage timings, profiling) follow them onto the pool thread.
+    """
+
+    def __init__(self, family: str, max_workers: int) -> None:
+        self.family = family
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"infer-{family}",
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            self._queued += 1
+        INFERENCE_IN_FLIGHT.inc(family=self.family, state="queued")
+        context = contextvars.copy_context()
+        enqueued_at = time.perf_counter()
+
+        def task() -> Any:
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            INFERENCE_IN_FLIGHT.dec(family=self.family, state="queued")
+            INFERENCE_IN_FLIGHT.inc(family=self.family, state="running")
+            QUEUE_SECONDS.observe(time.perf_counter() - enqueued_at, family=self.family)
+            try:
+                return context.run(run_profiled, self.family, fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                INFERENCE_IN_FLIGHT.dec(family=self.family, state="running")
+
+        future = self._pool.submit(task)
+
+        def _on_done(done: Future) -> None:
+            # Cancelled before a thread picked it up: it never left the queue.
+            if done.cancelled():
+                with self._lock:
+                    self._queued -= 1
+                INFERENCE_IN_FLIGHT.dec(family=self.family, state="queued")
+
+        future.add_done_callback(_on_done)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executors: Dict[str, InferenceExecutor] = {}
+_executors_pid: Optional[int] = None
+_executors_lock = threading.Lock()
+
+
+def get_executor(family: str) -> InferenceExecutor:
+    """
+    Return the executor for a model family, creating it on first use.
+    Pools are per process: a forked worker builds its own.
+    """
+    global _executors, _executors_pid
+    if family not in POOL_SIZES:
+        raise KeyError(f"Unknown inference family: {family}")
+
+    with _executors_lock:
+        if _executors_pid != os.getpid():
+            _executors = {}
+            _executors_pid = os.getpid()
+        executor = _executors.get(family)
+        if executor is None:
+            executor = InferenceExecutor(family, POOL_SIZES[family])
+            _executors[family] = executor
+        return executor
+
+
+async def run_inference(family: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking inference call on the family's pool and await its result
+    without blocking the event loop.
+    """
+    return await get_executor(family).run(fn, *args, **kwargs)
+
+
+def executor_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Queue depth and utilisation for every model family pool.
+    """
+    return {family: get_executor(family).stats() for family in POOL_SIZES}
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
@@ -1,10 +1,24 @@
 import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from dotenv import load_dotenv
 
+from src.lib.cache import MISSING, SingleFlight, TTLCache
+from src.lib.fetch_config import (
+    FETCH_CACHE_ENABLED,
+    FETCH_CACHE_NEGATIVE_TTL_SECONDS,
+    FETCH_CACHE_SIZE,
+    FETCH_CACHE_TTL_SECONDS,
+    NEWS_PARSER_ACQUIRE_TIMEOUT_SECONDS,
+    NEWS_PARSER_MAX_AGE_SECONDS,
+    NEWS_PARSER_MAX_USES,
+    NEWS_PARSER_POOL_SIZE,
+)
+
 
 def _ensure_code_on_path() -> None:
     """
@@ -39,17 +53,22 @@ def _ensure_code_on_path() -> None:
 
 _ensure_code_on_path()
 
-from parser.main import NewsParser  # type: ignore  # noqa: E402
+from .parser_pool import ParserPool, PoolTimeout, configure_keep_alive  # noqa: E402
+
+if TYPE_CHECKING:  # newspaper3k and the site parsers load with the first parser
+    from parser.main import NewsParser  # type: ignore
 
 
 class FetchError(Exception):
     pass
 
 
-def get_news_parser() -> NewsParser:
+def get_news_parser() -> "NewsParser":
     """
     Create a NewsParser instance using Oxylabs credentials from environment.
     """
+    from parser.main import NewsParser  # type: ignore
+
     username = os.getenv("OXYLABS_USERNAME")
     password = os.getenv("OXYLABS_PASSWORD")
 
@@ -62,14 +81,149 @@ def get_news_parser() -> NewsParser:
     return NewsParser(username=username, password=password)
 
 
+_parser_pool = ParserPool(
+    factory=lambda: configure_keep_alive(get_news_parser()),
+    size=NEWS_PARSER_POOL_SIZE,
+    max_uses=NEWS_PARSER_MAX_USES,
+    max_age=NEWS_PARSER_MAX_AGE_SECONDS,
+    acquire_timeout=NEWS_PARSER_ACQUIRE_TIMEOUT_SECONDS,
+)
+
+
+def parser_pool_stats() -> Dict[str, Any]:
+    """
+    Saturation and health metrics of the NewsParser session pool.
+    """
+    return _parser_pool.stats()
+
+
+# Query parameters that only track the visit and never change the article.
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "yclid", "ysclid", "dclid", "msclkid", "igshid",
+    "mc_cid", "mc_eid", "_openstat",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL used as the fetch cache key: https scheme,
+    lowercased host without "www." and default port, no fragment, tracking
+    parameters (utm_*, fbclid, ...) removed and remaining parameters sorted.
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    host = (parts.hostname or "").rstrip(".")
+    try:
+        host = host.encode("idna").decode("ascii")
+    except UnicodeError:
+        pass
+    host = host.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+@dataclass(frozen=True)
+class _FetchFailure:
+    message: str
+
+
+_fetch_cache = TTLCache(maxsize=FETCH_CACHE_SIZE, ttl=FETCH_CACHE_TTL_SECONDS)
+_fetch_flight = SingleFlight()
+
+
 def fetch_article(url: str, debug: bool = False) -> Dict[str, Optional[str]]:
     """
     Fetch and parse article information using the existing NewsParser.
+    Results are cached by canonical URL (failures for a shorter TTL) and
+    concurrent requests for the same URL share one upstream fetch.
 
     Returns a dict with keys: title, text, date, author, url, parser_type, error.
     """
-    parser = get_news_parser()
-    result: Dict[str, Any] = parser.get_news_info(url=url, debug=debug)
+    if debug or not FETCH_CACHE_ENABLED:
+        return _fetch_uncached(url, debug=debug)
+
+    key = canonicalize_url(url)
+    cached = _fetch_cache.get(key)
+    if cached is MISSING:
+        cached, _ = _fetch_flight.do(key, lambda: _fetch_and_cache(url, key))
+    return unwrap_cached_fetch(cached)
+
+
+def _fetch_and_cache(url: str, key: str) -> Any:
+    try:
+        result = _fetch_uncached(url)
+    except FetchError as exc:
+        return cache_fetch_failure(key, str(exc))
+    return cache_fetch_result(key, result)
+
+
+def get_cached_fetch(key: str) -> Any:
+    """
+    Raw fetch cache entry for a canonical URL (MISSING when absent). Shared with
+    the async fetch path so both backends fill and reuse the same cache.
+    """
+    if not FETCH_CACHE_ENABLED:
+        return MISSING
+    return _fetch_cache.get(key)
+
+
+def unwrap_cached_fetch(entry: Any) -> Dict[str, Optional[str]]:
+    if isinstance(entry, _FetchFailure):
+        raise FetchError(entry.message)
+    return dict(entry)
+
+
+def cache_fetch_result(key: str, result: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    if FETCH_CACHE_ENABLED:
+        ttl = FETCH_CACHE_NEGATIVE_TTL_SECONDS if result.get("error") else None
+        _fetch_cache.set(key, result, ttl=ttl)
+    return result
+
+
+def cache_fetch_failure(key: str, message: str) -> Any:
+    failure = _FetchFailure(message)
+    if FETCH_CACHE_ENABLED:
+        _fetch_cache.set(key, failure, ttl=FETCH_CACHE_NEGATIVE_TTL_SECONDS)
+    return failure
+
+
+def fetch_cache_stats() -> Dict[str, Any]:
+    if not FETCH_CACHE_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **_fetch_cache.stats(), **_fetch_flight.stats()}
+
+
+def _fetch_uncached(url: str, debug: bool = False) -> Dict[str, Optional[str]]:
+    try:
+        with _parser_pool.acquire() as parser:
+            result: Dict[str, Any] = parser.get_news_info(url=url, debug=debug)
+    except PoolTimeout as exc:
+        raise FetchError(str(exc)) from exc
 
     # Normalize keys we care about; keep unknown keys for potential debugging.
     return {
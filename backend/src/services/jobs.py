@@ -0,0 +1,179 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import CancelledError
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from src.api.schemas import AnalyzeRequest
+from src.api.schemas_clickbait import ClickbaitAnalyzeRequest
+from src.api.schemas_water import WaterAnalyzeRequest
+from src.lib.job_queue import JobQueue
+from src.lib.jobs_config import (
+    JOBS_DB_PATH,
+    JOBS_LEASE_SECONDS,
+    JOBS_MAX_ATTEMPTS,
+    JOBS_POLL_INTERVAL_SECONDS,
+    JOBS_RESULT_TTL_SECONDS,
+    JOBS_WORKERS,
+)
+
+from .analyzer import analyze_request
+from .clickbait_detector import analyze_clickbait
+from .executor import get_executor
+from .water_detector import analyze_water
+
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> (request model, executor family, handler). Jobs run on the same
+# per-family executors as the synchronous endpoints and share their limits.
+JOB_KINDS: Dict[str, Tuple[Type[BaseModel], str, Callable[[Any], BaseModel]]] = {
+    "analysis": (AnalyzeRequest, "sentiment", analyze_request),
+    "clickbait": (ClickbaitAnalyzeRequest, "clickbait", analyze_clickbait),
+    "water": (WaterAnalyzeRequest, "water", analyze_water),
+}
+
+_PURGE_INTERVAL_SECONDS = 300.0
+
+_wakeup = threading.Condition()
+_workers: List[threading.Thread] = []
+_stop = threading.Event()
+_last_purge = 0.0
+
+
+@lru_cache(maxsize=1)
+def get_job_queue() -> JobQueue:
+    return JobQueue(JOBS_DB_PATH, lease_seconds=JOBS_LEASE_SECONDS, max_attempts=JOBS_MAX_ATTEMPTS)
+
+
+def parse_job_payload(kind: str, payload: Dict[str, Any]) -> BaseModel:
+    """
+    Validate a job payload against the request model of its kind; raises
+    pydantic.ValidationError like the synchronous endpoint would.
+    """
+    request_model, _, _ = JOB_KINDS[kind]
+    return request_model.model_validate(payload)
+
+
+def submit_job(kind: str, request: BaseModel) -> Dict[str, Any]:
+    """
+    Persist a validated request as a queued job and wake an idle worker.
+    """
+    job = get_job_queue().submit(kind, request.model_dump_json())
+    with _wakeup:
+        _wakeup.notify()
+    return job
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    return get_job_queue().get(job_id)
+
+
+def _error_json(exc: Exception) -> str:
+    if isinstance(exc, HTTPException) and isinstance(exc.detail, dict):
+        detail = exc.detail
+    else:
+        detail = {"code": "JOB_FAILED", "message": str(exc)}
+    return json.dumps(detail, ensure_ascii=False)
+
+
+def _renew_lease(queue: JobQueue, job: Dict[str, Any], done: threading.Event) -> None:
+    # Renew well before expiry, so a long job is never claimed a second time
+    interval = max(1.0, queue.lease_seconds / 3)
+    while not done.wait(interval):
+        try:
+            if not queue.renew(job["id"], job["attempts"]):
+                logger.warning("job %s attempt %d lost its lease", job["id"], job["attempts"])
+                return
+        except sqlite3.Error as exc:  # pragma: no cover - retried on the next tick
+            logger.warning("could not renew the lease of job %s: %s", job["id"], exc)
+
+
+def _run_job(queue: JobQueue, job: Dict[str, Any]) -> None:
+    request_model, family, handler = JOB_KINDS[job["kind"]]
+    done = threading.Event()
+    heartbeat = threading.Thread(target=_renew_lease, args=(queue, job, done), name=f"lease-{job['id']}", daemon=True)
+    heartbeat.start()
+    try:
+        request = request_model.model_validate_json(job["payload"])
+        result = get_executor(family).submit(handler, request).result()
+    except CancelledError:
+        # Shutting down: the lease expires and another worker picks it up
+        logger.info("job %s interrupted by shutdown", job["id"])
+        return
+    except Exception as exc:
+        finished = queue.fail(job["id"], job["attempts"], _error_json(exc))
+    else:
+        finished = queue.complete(job["id"], job["attempts"], result.model_dump_json())
+    finally:
+        done.set()
+    if not finished:
+        logger.warning("job %s attempt %d was claimed again; its outcome is discarded", job["id"], job["attempts"])
+
+
+def _maybe_purge(queue: JobQueue) -> None:
+    global _last_purge
+    now = time.monotonic()
+    if now - _last_purge < _PURGE_INTERVAL_SECONDS:
+        return
+    _last_purge = now
+    purged = queue.purge_finished(JOBS_RESULT_TTL_SECONDS)
+    if purged:
+        logger.info("purged %d finished jobs", purged)
+
+
+def _worker_loop() -> None:
+    queue = get_job_queue()
+    while not _stop.is_set():
+        try:
+            job = queue.claim()
+            if job is None:
+                _maybe_purge(queue)
+        except sqlite3.Error as exc:  # pragma: no cover - e.g. a locked database file
+            logger.warning("job queue unavailable: %s", exc)
+            job = None
+        if job is None:
+            with _wakeup:
+                _wakeup.wait(JOBS_POLL_INTERVAL_SECONDS)
+            continue
+        _run_job(queue, job)
+
+
+def start_job_workers(workers: int = JOBS_WORKERS) -> List[threading.Thread]:
+    """
+    Start the threads draining the job queue in this process. Idempotent.
+    """
+    with _wakeup:
+        if not _workers:
+            _stop.clear()
+            for index in range(max(1, workers)):
+                thread = threading.Thread(target=_worker_loop, name=f"jobs-{index}", daemon=True)
+                thread.start()
+                _workers.append(thread)
+    return list(_workers)
+
+
+def stop_job_workers(timeout: float = 5.0) -> None:
+    """
+    Ask the workers to stop after their current job and wait up to `timeout`
+    seconds. Jobs still running when the process exits are retried by a
+    later worker once their lease expires.
+    """
+    _stop.set()
+    with _wakeup:
+        _wakeup.notify_all()
+        workers = list(_workers)
+        _workers.clear()
+    deadline = time.monotonic() + timeout
+    for thread in workers:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+
+def job_stats() -> Dict[str, Any]:
+    return {"workers": len(_workers), **get_job_queue().stats()}
@@ -0,0 +1,230 @@
+import gc
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.lib.metrics import MODEL_LOAD_SECONDS, MODEL_WARMUP_SECONDS
+
+
+logger = logging.getLogger(__name__)
+
+
+def freeze_weights(model: Any) -> None:
+    # Inference never writes to parameters; marking them read-only keeps
+    # autograd bookkeeping off the shared pages after fork.
+    module = getattr(model, "model", None)
+    if hasattr(module, "eval") and hasattr(module, "requires_grad_"):
+        module.eval()
+        module.requires_grad_(False)
+
+
+@dataclass
+class ModelHandle:
+    """
+    One loaded version of a model. `refs` counts the requests using it; a
+    retired handle is freed once the last of them releases it.
+    """
+
+    name: str
+    version: str
+    source: Optional[str]
+    model: Any
+    loaded_at: float = field(default_factory=time.time)
+    refs: int = 0
+    retired: bool = False
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "loaded_at": self.loaded_at,
+            "in_flight": self.refs,
+        }
+
+
+@dataclass
+class _ModelSpec:
+    load: Callable[[Optional[str]], Any]
+    warm_up: Callable[[Any], None]
+    version: str
+    generation: int = 0
+    reload: Dict[str, Any] = field(default_factory=lambda: {"status": "idle"})
+
+
+class ModelRegistry:
+    """
+    Versioned model handles. Requests take the current version with `use()`
+    and keep it for their whole duration. `reload()` loads and warms a new
+    version on a background thread while the old one keeps serving, then
+    swaps it in atomically; the old version is dropped when its last
+    in-flight request finishes.
+    """
+
+    def __init__(self) -> None:
+        self._specs: Dict[str, _ModelSpec] = {}
+        self._current: Dict[str, ModelHandle] = {}
+        self._draining: Dict[str, List[ModelHandle]] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def register(
+        self,
+        name: str,
+        load: Callable[[Optional[str]], Any],
+        warm_up: Callable[[Any], None],
+        version: str,
+    ) -> None:
+        """
+        Declare a model: `load(source)` builds it from a checkpoint path (None
+        for the configured one), `warm_up(model)` runs a dummy inference, and
+        `version` is reported for the initially configured checkpoint.
+        """
+        with self._lock:
+            self._specs[name] = _ModelSpec(load=load, warm_up=warm_up, version=version)
+            self._draining.setdefault(name, [])
+            self._load_locks.setdefault(name, threading.Lock())
+
+    def names(self) -> List[str]:
+        return list(self._specs)
+
+    def _build(self, name: str, source: Optional[str], version: str) -> ModelHandle:
+        model = self._specs[name].load(source)
+        freeze_weights(model)
+        return ModelHandle(name=name, version=version, source=source, model=model)
+
+    def current(self, name: str) -> ModelHandle:
+        """
+        The handle new requests get, loading the configured version on first use.
+        """
+        handle = self._current.get(name)
+        if handle is not None:
+            return handle
+        if name not in self._specs:
+            raise KeyError(f"Unknown model: {name}")
+        with self._load_locks[name]:
+            handle = self._current.get(name)
+            if handle is None:
+                handle = self._build(name, None, self._specs[name].version)
+                with self._lock:
+                    self._current[name] = handle
+        return handle
+
+    def peek(self, name: str) -> Optional[ModelHandle]:
+        """
+        The current handle, or None when the model has not been loaded.
+        """
+        return self._current.get(name)
+
+    def version(self, name: str) -> str:
+        """
+        Version of the current handle (the configured version before loading).
+        """
+        handle = self._current.get(name)
+        return handle.version if handle is not None else self._specs[name].version
+
+    def acquire(self, name: str) -> ModelHandle:
+        """
+        Take a reference to the current version; pair with `release()`.
+        """
+        self.current(name)
+        with self._lock:
+            handle = self._current[name]
+            handle.refs += 1
+        return handle
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[ModelHandle]:
+        """
+        Hold the current version for the duration of the block, even if a
+        reload swaps in a newer one meanwhile.
+        """
+        handle = self.acquire(name)
+        try:
+            yield handle
+        finally:
+            self.release(handle)
+
+    def release(self, handle: ModelHandle) -> None:
+        with self._lock:
+            handle.refs -= 1
+            free = handle.retired and handle.refs == 0
+            if free:
+                self._draining[handle.name].remove(handle)
+        if free:
+            self._free(handle)
+
+    def _free(self, handle: ModelHandle) -> None:
+        handle.model = None
+        gc.collect()
+        logger.info("freed %s model version %s", handle.name, handle.version)
+
+    def _swap(self, handle: ModelHandle) -> None:
+        # The load lock orders the swap after a first load still in progress
+        with self._load_locks[handle.name], self._lock:
+            old = self._current.get(handle.name)
+            self._current[handle.name] = handle
+            if old is None:
+                return
+            old.retired = True
+            free = old.refs == 0
+            if not free:
+                self._draining[handle.name].append(old)
+        if free:
+            self._free(old)
+
+    def reload(self, name: str, source: Optional[str] = None, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Start loading `source` (the configured checkpoint when None) as a new
+        version of `name` in the background. Returns the reload status, with
+        `started` False when a reload of the model was already running (only
+        one runs at a time) and this call did nothing.
+        """
+        if name not in self._specs:
+            raise KeyError(f"Unknown model: {name}")
+        spec = self._specs[name]
+        with self._lock:
+            if spec.reload["status"] in ("loading", "warming"):
+                return {**spec.reload, "started": False}
+            spec.generation += 1
+            version = version or f"{spec.version}+r{spec.generation}"
+            spec.reload = {"status": "loading", "version": version, "source": source, "error": None}
+        thread = threading.Thread(
+            target=self._reload, args=(name, source, version), name=f"reload-{name}", daemon=True
+        )
+        thread.start()
+        return {**spec.reload, "started": True}
+
+    def _reload(self, name: str, source: Optional[str], version: str) -> None:
+        spec = self._specs[name]
+        try:
+            started = time.perf_counter()
+            handle = self._build(name, source, version)
+            MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=name)
+            spec.reload["status"] = "warming"
+            started = time.perf_counter()
+            spec.warm_up(handle.model)
+            MODEL_WARMUP_SECONDS.set(time.perf_counter() - started, model=name)
+        except Exception as exc:
+            logger.warning("Failed to reload %s model from %s: %s", name, source, exc)
+            spec.reload.update(status="failed", error=str(exc))
+            return
+        self._swap(handle)
+        spec.reload["status"] = "swapped"
+        logger.info("%s model switched to version %s", name, version)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                name: {
+                    "current": self._current[name].info() if name in self._current else None,
+                    "draining": [handle.info() for handle in self._draining[name]],
+                    "reload": dict(spec.reload),
+                }
+                for name, spec in self._specs.items()
+            }
+
+
+registry = ModelRegistry()
@@ -0,0 +1,151 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from src.lib.metrics import MODEL_LOAD_SECONDS, MODEL_WARMUP_SECONDS
+from src.lib.server_config import READY_REQUIRED_MODELS
+from . import clickbait_detector, sentiment_adapter, water_detector
+
+
+logger = logging.getLogger(__name__)
+
+MODEL_LOADERS: Dict[str, Callable[[], Any]] = {
+    "sentiment": sentiment_adapter.load_model,
+    "clickbait": clickbait_detector.load_model,
+    "water": water_detector.load_model,
+}
+
+MODEL_WARMUPS: Dict[str, Callable[[], None]] = {
+    "sentiment": sentiment_adapter.warm_up,
+    "clickbait": clickbait_detector.warm_up,
+    "water": water_detector.warm_up,
+}
+
+
+@dataclass
+class ModelState:
+    status: str = "pending"  # pending | loading | loaded | warming | ready | failed
+    load_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+_states: Dict[str, ModelState] = {name: ModelState() for name in MODEL_LOADERS}
+_states_lock = threading.Lock()
+
+
+def _set_state(name: str, **changes: Any) -> None:
+    with _states_lock:
+        for key, value in changes.items():
+            setattr(_states[name], key, value)
+
+
+def _load(name: str) -> None:
+    already_loaded = _states[name].status == "loaded"
+    _set_state(name, status="loading", error=None)
+    started = time.perf_counter()
+    # The registry freezes the weights of every version it loads
+    MODEL_LOADERS[name]()
+    if already_loaded:
+        # Inherited from the pre-fork master; keep the time it took there.
+        _set_state(name, status="loaded")
+    else:
+        elapsed = time.perf_counter() - started
+        MODEL_LOAD_SECONDS.set(elapsed, model=name)
+        _set_state(name, status="loaded", load_seconds=elapsed)
+
+
+def _prepare(name: str) -> None:
+    try:
+        _load(name)
+        _set_state(name, status="warming")
+        started = time.perf_counter()
+        MODEL_WARMUPS[name]()
+        elapsed = time.perf_counter() - started
+        MODEL_WARMUP_SECONDS.set(elapsed, model=name)
+        _set_state(name, status="ready", warmup_seconds=elapsed)
+    except Exception as exc:  # pragma: no cover - depends on model files
+        logger.warning("Failed to warm up %s model: %s", name, exc)
+        _set_state(name, status="failed", error=str(exc))
+
+
+def preload_models(names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    """
+    Load every model (or only `names`) in the current process. Used by the
+    pre-fork server and the bulk CLI so forked workers inherit the weights
+    copy-on-write instead of loading their own.
+    Failures are logged and left for lazy loading on first request.
+    """
+    loaded: Dict[str, bool] = {}
+    for name in MODEL_LOADERS if names is None else names:
+        try:
+            _load(name)
+            loaded[name] = True
+        except Exception as exc:  # pragma: no cover - depends on model files
+            logger.warning("Failed to preload %s model: %s", name, exc)
+            _set_state(name, status="pending", error=str(exc))
+            loaded[name] = False
+    _import_pipeline()
+    return loaded
+
+
+def _import_pipeline() -> None:
+    from .analyzer import import_pipeline_modules
+
+    try:
+        import_pipeline_modules()
+    except Exception as exc:  # pragma: no cover - depends on code/ packages
+        logger.warning("Failed to import analysis pipeline modules: %s", exc)
+
+
+def warm_up_models() -> Dict[str, Any]:
+    """
+    Load all models in parallel and run one dummy inference through each.
+    Returns the readiness report.
+    """
+    with ThreadPoolExecutor(max_workers=len(MODEL_LOADERS), thread_name_prefix="warmup") as pool:
+        pipeline = pool.submit(_import_pipeline)
+        list(pool.map(_prepare, MODEL_LOADERS))
+        pipeline.result()
+    return readiness()
+
+
+def start_warm_up() -> threading.Thread:
+    """
+    Warm up models on a background thread so the server accepts connections
+    (and answers /health) while the models load.
+    """
+    thread = threading.Thread(target=warm_up_models, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def readiness() -> Dict[str, Any]:
+    """
+    Readiness of every model with load and warm-up timings in seconds. The
+    service is ready once the required models are warm and every other model
+    is warm or has failed; a failed optional model makes it "degraded".
+    """
+    with _states_lock:
+        models = {name: asdict(state) for name, state in _states.items()}
+    required = [name for name in models if name in READY_REQUIRED_MODELS]
+    optional = [name for name in models if name not in READY_REQUIRED_MODELS]
+    if any(models[name]["status"] == "failed" for name in required):
+        status = "failed"
+    elif not all(models[name]["status"] == "ready" for name in required) or not all(
+        models[name]["status"] in ("ready", "failed") for name in optional
+    ):
+        status = "starting"
+    elif any(models[name]["status"] == "failed" for name in optional):
+        status = "degraded"
+    else:
+        status = "ready"
+    return {
+        "ready": status in ("ready", "degraded"),
+        "status": status,
+        "required": required,
+        "models": models,
+    }
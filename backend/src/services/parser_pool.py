@@ -0,0 +1,192 @@
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+@dataclass
+class _PooledEntry:
+    instance: Any
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    broken: bool = False
+
+
+class ParserPool:
+    """
+    Thread-safe pool of long-lived parser instances, each owning its own HTTP
+    session, created once per process and reused across requests.
+
+    Instances are checked before every checkout and replaced when they exceed
+    `max_uses` or `max_age`, or when their last use raised an exception.
+    Idle instances are handed out most-recently-used first so warm keep-alive
+    connections are reused.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int,
+        max_uses: int = 500,
+        max_age: float = 1800.0,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        self._factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._idle: "queue.LifoQueue[_PooledEntry]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._live = 0
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._created = 0
+        self._recycled = 0
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+
+    def _check_fork(self) -> None:
+        # Sessions and sockets inherited from a pre-fork master are not reused.
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+
+    def _healthy(self, entry: _PooledEntry) -> bool:
+        # A session is replaced once it raised, or it is old or worn enough
+        # that stale keep-alive connections and cookies become likely
+        if entry.broken:
+            return False
+        if self.max_uses and entry.uses >= self.max_uses:
+            return False
+        return not (self.max_age and time.monotonic() - entry.created_at >= self.max_age)
+
+    def _checkout(self) -> _PooledEntry:
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._healthy(entry):
+                return entry
+            self._discard(entry)
+
+        instance = self._factory()
+        with self._lock:
+            self._live += 1
+            self._created += 1
+        return _PooledEntry(instance=instance)
+
+    def _discard(self, entry: _PooledEntry) -> None:
+        session = getattr(entry.instance, "session", None)
+        close = getattr(session, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:  # pragma: no cover - best effort
+                pass
+        with self._lock:
+            self._live -= 1
+            self._recycled += 1
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """
+        Check out an instance for the duration of the block, waiting up to
+        `acquire_timeout` seconds when every instance is busy.
+        """
+        self._check_fork()
+        started = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._waited += 1
+            if not self._slots.acquire(timeout=self.acquire_timeout):
+                with self._lock:
+                    self._timeouts += 1
+                raise PoolTimeout(
+                    f"No parser session available within {self.acquire_timeout:.0f}s "
+                    f"(pool size {self.size})"
+                )
+        waited = time.monotonic() - started
+
+        try:
+            entry = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._acquired += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+        try:
+            yield entry.instance
+        except Exception:
+            entry.broken = True
+            raise
+        finally:
+            entry.uses += 1
+            with self._lock:
+                self._in_use -= 1
+            if self._healthy(entry):
+                self._idle.put(entry)
+            else:
+                self._discard(entry)
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            acquired = self._acquired
+            return {
+                "size": self.size,
+                "live": self._live,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "saturation": self._in_use / self.size,
+                "peak_in_use": self._peak_in_use,
+                "created": self._created,
+                "recycled": self._recycled,
+                "acquired": acquired,
+                "waited": self._waited,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": (self._wait_seconds / acquired * 1000.0) if acquired else 0.0,
+                "max_wait_ms": self._max_wait_seconds * 1000.0,
+            }
+
+
+def configure_keep_alive(instance: Any, pool_maxsize: int = 4) -> Any:
+    """
+    If the parser exposes a requests.Session as `session`, mount keep-alive
+    adapters sized for one in-flight request at a time.
+    """
+    session = getattr(instance, "session", None)
+    mount = getattr(session, "mount", None)
+    if callable(mount):
+        try:
+            from requests.adapters import HTTPAdapter
+        except Exception:  # pragma: no cover - requests is a dependency
+            return instance
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        mount("https://", adapter)
+        mount("http://", adapter)
+    return instance
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.lib.cache import MISSING, SQLiteCache, SingleFlight, TTLCache
+from src.lib.cache_config import (
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_SIZE,
+    RESULT_CACHE_SQLITE_PATH,
+    RESULT_CACHE_SQLITE_TTL_SECONDS,
+    RESULT_CACHE_TTL_SECONDS,
+)
+from src.lib.profiling import profiling_active
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_SPACES_RE = re.compile(r"[ \t ]+")
+
+
+def normalize_text(text: Optional[str]) -> Optional[str]:
+    """
+    Canonical form of an input text for cache keys: NFC, trimmed, runs of
+    horizontal whitespace collapsed (line breaks are kept).
+    """
+    if text is None:
+        return None
+    return _SPACES_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_key(namespace: str, version: str, normalized_input: Dict[str, Any]) -> str:
+    """
+    Content address of a request: hash of endpoint namespace, detector/contract
+    version and the normalized input.
+    """
+    blob = json.dumps(
+        {"ns": namespace, "version": version, "input": normalized_input},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier result cache (in-memory LRU with TTL, optional SQLite) with
+    single-flight coalescing of concurrent identical computations.
+    Values are stored as response JSON and re-validated on every hit, so
+    callers never share mutable response objects.
+    """
+
+    def __init__(self, memory: TTLCache, disk: Optional[SQLiteCache] = None) -> None:
+        self.memory = memory
+        self.disk = disk
+        self.flight = SingleFlight()
+
+    def lookup(self, key: str, model_cls: Type[ModelT]) -> Optional[ModelT]:
+        value = self.memory.get(key)
+        if value is MISSING and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not MISSING:
+                self.memory.set(key, value)
+        if value is MISSING:
+            return None
+        return model_cls.model_validate_json(value)
+
+    def store(self, key: str, response: BaseModel) -> None:
+        value = response.model_dump_json()
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def get_or_compute(
+        self,
+        key: str,
+        model_cls: Type[ModelT],
+        compute: Callable[[], ModelT],
+        cacheable: Callable[[ModelT], bool] = lambda _: True,
+    ) -> Tuple[ModelT, bool]:
+        """
+        Return (response, served_from_cache). Concurrent callers with the same key
+        wait for a single computation and get a copy of it, reported as a cache
+        hit only when it was cacheable (and stored).
+        """
+        cached = self.lookup(key, model_cls)
+        if cached is not None:
+            return cached, True
+
+        def compute_and_store() -> Tuple[ModelT, bool]:
+            response = compute()
+            stored = cacheable(response)
+            if stored:
+                self.store(key, response)
+            return response, stored
+
+        (response, stored), shared = self.flight.do(key, compute_and_store)
+        if shared:
+            return model_cls.model_validate_json(response.model_dump_json()), stored
+        return response, False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+            **self.flight.stats(),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Process-wide result cache, or None when disabled via RESULT_CACHE_ENABLED.
+    """
+    if not RESULT_CACHE_ENABLED:
+        return None
+    disk = (
+        SQLiteCache(RESULT_CACHE_SQLITE_PATH, ttl=RESULT_CACHE_SQLITE_TTL_SECONDS)
+        if RESULT_CACHE_SQLITE_PATH
+        else None
+    )
+    return ResultCache(TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL_SECONDS), disk)
+
+
+def cached_call(
+    namespace: str,
+    version: str,
+    normalized_input: Dict[str, Any],
+    model_cls: Type[ModelT],
+    compute: Callable[[], ModelT],
+    cacheable: Callable[[ModelT], bool] = lambda _: True,
+) -> Tuple[ModelT, bool]:
+    """
+    Serve a response through the result cache (or compute it directly when the
+    cache is disabled or the request is being profiled). Returns
+    (response, served_from_cache).
+    """
+    cache = get_result_cache()
+    if cache is None or profiling_active():
+        return compute(), False
+    key = make_key(namespace, version, normalized_input)
+    return cache.get_or_compute(key, model_cls, compute, cacheable)
+
+
+def lookup_cached(
+    namespace: str,
+    version: str,
+    normalized_input: Dict[str, Any],
+    model_cls: Type[ModelT],
+) -> Optional[ModelT]:
+    """
+    Look a response up without computing it (None on a miss, or when the cache
+    is disabled or the request is being profiled).
+    """
+    cache = get_result_cache()
+    if cache is None or profiling_active():
+        return None
+    return cache.lookup(make_key(namespace, version, normalized_input), model_cls)
+
+
+def store_cached(namespace: str, version: str, normalized_input: Dict[str, Any], response: BaseModel) -> None:
+    """
+    Store a response computed outside `cached_call` (e.g. by a streaming endpoint).
+    """
+    cache = get_result_cache()
+    if cache is None or profiling_active():
+        return
+    cache.store(make_key(namespace, version, normalized_input), response)
+
+
+def cached_batch(
+    namespace: str,
+    version: str,
+    normalized_inputs: List[Dict[str, Any]],
+    model_cls: Type[ModelT],
+    compute: Callable[[List[int]], List[ModelT]],
+    cacheable: Callable[[ModelT], bool] = lambda _: True,
+) -> List[Tuple[ModelT, bool]]:
+    """
+    Batch counterpart of `cached_call`: look every input up, then call `compute`
+    once with the indices of the misses. Returns (response, served_from_cache)
+    per input, in input order.
+    """
+    cache = get_result_cache()
+    if cache is None or profiling_active():
+        return [(response, False) for response in compute(list(range(len(normalized_inputs))))]
+
+    keys = [make_key(namespace, version, item) for item in normalized_inputs]
+    results: List[Optional[Tuple[ModelT, bool]]] = [None] * len(keys)
+    missing: List[int] = []
+    for index, key in enumerate(keys):
+        hit = cache.lookup(key, model_cls)
+        if hit is not None:
+            results[index] = (hit, True)
+        else:
+            missing.append(index)
+
+    if missing:
+        for index, response in zip(missing, compute(missing)):
+            if cacheable(response):
+                cache.store(keys[index], response)
+            results[index] = (response, False)
+
+    return results  # type: ignore[return-value]
+
+
+def result_cache_stats() -> Dict[str, Any]:
+    cache = get_result_cache()
+    if cache is None:
+        return {"enabled": False}
+    return cache.stats()
@@ -1,8 +1,12 @@
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from src.lib.determinism import MODEL_VERSION
+from src.lib.determinism import MODEL_VERSION, configure_deterministic_inference
+from src.lib.sentiment_config import SENTIMENT_MODEL_PATH
+
+from .model_registry import freeze_weights, registry
+from .sentiment_batch import BATCH_ALL, BATCH_OFF, batching_mode, fits_one_window, score_texts
 
 
 def _ensure_code_on_path() -> None:
@@ -16,28 +20,54 @@ def _ensure_code_on_path() -> None:
 
 _ensure_code_on_path()
 
-from sentimen_analiz.main import RuBERTSentimentAnalyzer  # type: ignore  # noqa: E402
+if TYPE_CHECKING:  # imports torch and transformers; loaded with the model
+    from sentimen_analiz.main import RuBERTSentimentAnalyzer  # type: ignore
+
+
+def _load_analyzer(model_path: Optional[str] = None) -> "RuBERTSentimentAnalyzer":
+    from sentimen_analiz.main import RuBERTSentimentAnalyzer  # type: ignore
+
+    # The analyzer module imported torch; configure it before the first inference
+    configure_deterministic_inference()
+    analyzer = RuBERTSentimentAnalyzer(
+        model_name=model_path or str(SENTIMENT_MODEL_PATH),
+        device="cpu",
+        confidence_threshold=0.5,
+    )
+    # Check batched scoring against the analyzer's own API before serving
+    # (in eval mode, as it will serve)
+    freeze_weights(analyzer)
+    batching_mode(analyzer)
+    return analyzer
+
 
+def _warm_up_analyzer(analyzer: "RuBERTSentimentAnalyzer") -> None:
+    analyzer.predict_sentiment_with_chunking("Компания сообщила о росте прибыли по итогам квартала.")
 
-_analyzer: Optional[RuBERTSentimentAnalyzer] = None
+
+registry.register("sentiment", _load_analyzer, _warm_up_analyzer, MODEL_VERSION)
+
+
+def get_analyzer() -> "RuBERTSentimentAnalyzer":
+    """
+    Return the current version of the RuBERT sentiment analyzer, loading the
+    fine-tuned model on first use.
+    """
+    return registry.current("sentiment").model
 
 
-def get_analyzer() -> RuBERTSentimentAnalyzer:
+def load_model() -> "RuBERTSentimentAnalyzer":
     """
-    Lazily initialize the RuBERT sentiment analyzer using the fine-tuned model.
+    Load the sentiment analyzer (once per process) and return it.
     """
-    global _analyzer
-    if _analyzer is None:
-        repo_root = Path(__file__).resolve().parents[3]
-        model_dir = repo_root / "code" / "sentimen_analiz" / "rubert_finetuned"
-        model_name = str(model_dir)
+    return get_analyzer()
 
-        _analyzer = RuBERTSentimentAnalyzer(
-            model_name=model_name,
-            device="cpu",
-            confidence_threshold=0.5,
-        )
-    return _analyzer
+
+def warm_up() -> None:
+    """
+    Run one dummy text through the analyzer to warm tokenizer and kernels.
+    """
+    _warm_up_analyzer(get_analyzer())
 
 
 def analyze_sentiment(text: str) -> Dict[str, Any]:
@@ -65,17 +95,20 @@ def map_label_to_contract(label: str) -> str:
 
 def get_model_version() -> str:
     """
-    Return model version string used in API responses.
-    Prefer explicit MODEL_VERSION from determinism module.
+    Return the version of the current sentiment model used in API responses:
+    MODEL_VERSION until a reload swaps in a new checkpoint.
     """
-    return MODEL_VERSION
+    return registry.version("sentiment")
 
 
 def summarize_sentiment(text: str) -> Dict[str, Any]:
     """
     Analyze sentiment for a single text segment and map to contract fields.
     """
-    raw = analyze_sentiment(text)
+    return _summary(text, analyze_sentiment(text))
+
+
+def _summary(text: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "text": text,
         "sentiment_label": map_label_to_contract(raw.get("predicted_label", "NEUTRAL")),
@@ -83,27 +116,56 @@ def summarize_sentiment(text: str) -> Dict[str, Any]:
     }
 
 
-def analyze_sentiment_segments(main_text: str, quotes: list[str]) -> Dict[str, Any]:
+def summarize_many(texts: List[str], analyzer: Optional["RuBERTSentimentAnalyzer"] = None) -> List[Dict[str, Any]]:
     """
-    Analyze sentiment for main text (with placeholders) and each quote individually.
+    Analyze sentiment for many segments at once. Duplicates are scored once and
+    segments share padded batches as far as the analyzer's parity check allows
+    (see `batching_mode`); the rest go through its chunking API one by one.
+    `analyzer` pins a model version (the current one by default).
     """
-    main_summary = summarize_sentiment(main_text)
-
-    quote_summaries = []
-    for idx, quote_text in enumerate(quotes):
-        summary = summarize_sentiment(quote_text)
-        quote_summaries.append(
-            {
-                "quote_text": quote_text,
-                "sentiment_label": summary["sentiment_label"],
-                "confidence": summary["confidence"],
-                "position": idx,
-            }
-        )
-
+    unique = list(dict.fromkeys(texts))
+    analyzer = analyzer or get_analyzer()
+    mode = batching_mode(analyzer)
+    if mode == BATCH_ALL:
+        batched = [True] * len(unique)
+    elif mode == BATCH_OFF:
+        batched = [False] * len(unique)
+    else:
+        batched = fits_one_window(analyzer, unique)
+
+    scores = iter(score_texts(analyzer, [text for text, ok in zip(unique, batched) if ok]))
+    raw_results = [
+        next(scores) if ok else analyzer.predict_sentiment_with_chunking(text) for text, ok in zip(unique, batched)
+    ]
+
+    by_text = {text: _summary(text, raw) for text, raw in zip(unique, raw_results)}
+    return [dict(by_text[text]) for text in texts]
+
+
+def _quote_summaries(quotes: List[str], summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "quote_text": quote_text,
+            "sentiment_label": summary["sentiment_label"],
+            "confidence": summary["confidence"],
+            "position": idx,
+        }
+        for idx, (quote_text, summary) in enumerate(zip(quotes, summaries))
+    ]
+
+
+def analyze_sentiment_segments(
+    main_text: str,
+    quotes: list[str],
+    analyzer: Optional["RuBERTSentimentAnalyzer"] = None,
+) -> Dict[str, Any]:
+    """
+    Analyze sentiment for main text (with placeholders) and each quote individually,
+    in one batched pass over all of them. `analyzer` pins a model version.
+    """
+    summaries = summarize_many([main_text, *quotes], analyzer)
     return {
-        "main_text": main_summary,
-        "quotes": quote_summaries,
+        "main_text": summaries[0],
+        "quotes": _quote_summaries(quotes, summaries[1:]),
         "errors": [],
     }
-
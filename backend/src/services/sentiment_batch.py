@@ -0,0 +1,282 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from src.lib.metrics import TOKENS_TOTAL
+from src.lib.sentiment_config import (
+    SENTIMENT_BATCH_PARITY_TOLERANCE,
+    SENTIMENT_BATCH_SIZE,
+    SENTIMENT_MAX_LENGTH,
+)
+
+if TYPE_CHECKING:  # torch is imported with the model, not with this module
+    import torch
+
+logger = logging.getLogger(__name__)
+
+# Batched scoring modes, decided per analyzer by `check_parity`:
+BATCH_ALL = "all"  # every text, chunked into windows here
+BATCH_SINGLE_WINDOW = "single_window"  # texts that fit one window; longer ones use the analyzer's API
+BATCH_OFF = "off"  # everything through predict_sentiment_with_chunking
+
+# Probes for the parity check: short texts (one window) and one long text that
+# needs several windows, so both the batching and the chunking are compared
+_PARITY_SHORT_TEXTS = (
+    "Компания сообщила о росте прибыли по итогам квартала.",
+    "Эксперты раскритиковали новый законопроект, назвав его провальным.",
+    "Заседание перенесли на следующую неделю.",
+)
+_PARITY_LONG_TEXT = " ".join(
+    f"В {year} году региональный бюджет вырос, но расходы на медицину и образование "
+    "сократились, что вызвало недовольство жителей и депутатов."
+    for year in range(1950, 2030)
+)
+
+_parity_lock = threading.Lock()
+
+
+@dataclass
+class _Segment:
+    owner: int  # index of the text this chunk belongs to
+    input_ids: List[int]
+
+
+class PaddingStats:
+    """
+    Counts real versus pad token positions fed to the model, and the pad
+    positions the same batches would have needed in arrival order.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.segments = 0
+        self.tokens = 0
+        self.padded = 0
+        self.padded_unsorted = 0
+
+    def record(self, batches: int, segments: int, tokens: int, padded: int, padded_unsorted: int) -> None:
+        TOKENS_TOTAL.inc(tokens, model="sentiment", kind="processed")
+        TOKENS_TOTAL.inc(padded, model="sentiment", kind="padding")
+        with self._lock:
+            self.batches += batches
+            self.segments += segments
+            self.tokens += tokens
+            self.padded += padded
+            self.padded_unsorted += padded_unsorted
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.tokens + self.padded
+            return {
+                "batches": self.batches,
+                "segments": self.segments,
+                "tokens_processed": self.tokens,
+                "tokens_padded": self.padded,
+                "padding_ratio": self.padded / total if total else 0.0,
+                "tokens_padded_without_bucketing": self.padded_unsorted,
+                "tokens_padded_saved": self.padded_unsorted - self.padded,
+            }
+
+
+_padding_stats = PaddingStats()
+
+
+def get_padding_stats() -> Dict[str, Any]:
+    return _padding_stats.stats()
+
+
+def supports_batching(analyzer: Any) -> bool:
+    """
+    Batched scoring drives the analyzer's tokenizer and model directly.
+    """
+    return getattr(analyzer, "tokenizer", None) is not None and getattr(analyzer, "model", None) is not None
+
+
+def _matches(expected: Dict[str, Any], actual: Dict[str, Any], tolerance: float) -> bool:
+    return (
+        expected.get("predicted_label") == actual["predicted_label"]
+        and abs(float(expected.get("confidence", 0.0)) - actual["confidence"]) <= tolerance
+    )
+
+
+def check_parity(analyzer: Any, tolerance: float = SENTIMENT_BATCH_PARITY_TOLERANCE) -> str:
+    """
+    Compare `score_texts` with the analyzer's own `predict_sentiment_with_chunking`
+    on probe texts and return the batching mode that reproduces it: BATCH_ALL
+    when short and long texts match, BATCH_SINGLE_WINDOW when only texts
+    fitting one window do (the analyzer chunks long texts differently), and
+    BATCH_OFF otherwise.
+    """
+    if not supports_batching(analyzer):
+        return BATCH_OFF
+    predict = getattr(analyzer, "predict_sentiment_with_chunking", None)
+    if not callable(predict):
+        # Nothing to compare with: batching is the only scoring path
+        return BATCH_ALL
+
+    def agrees(texts: Sequence[str]) -> bool:
+        # Texts of different lengths share a padded batch, as in production
+        batched = score_texts(analyzer, texts, record=False)
+        return all(_matches(predict(text), got, tolerance) for text, got in zip(texts, batched))
+
+    try:
+        if not agrees(_PARITY_SHORT_TEXTS):
+            logger.warning("Batched sentiment scores differ from the analyzer's; batching disabled")
+            return BATCH_OFF
+        if not agrees([_PARITY_LONG_TEXT]):
+            logger.warning("Batched chunking differs from the analyzer's; long texts use its own API")
+            return BATCH_SINGLE_WINDOW
+    except Exception as exc:
+        logger.warning("Sentiment batching parity check failed, batching disabled: %s", exc)
+        return BATCH_OFF
+    return BATCH_ALL
+
+
+def batching_mode(analyzer: Any) -> str:
+    """
+    The analyzer's batching mode, checked once per loaded analyzer (see
+    `check_parity`) and remembered on it.
+    """
+    mode = getattr(analyzer, "batch_scoring_mode", None)
+    if mode is None:
+        with _parity_lock:
+            mode = getattr(analyzer, "batch_scoring_mode", None)
+            if mode is None:
+                mode = check_parity(analyzer)
+                analyzer.batch_scoring_mode = mode
+    return mode
+
+
+def fits_one_window(analyzer: Any, texts: Sequence[str], max_length: int = SENTIMENT_MAX_LENGTH) -> List[bool]:
+    """
+    Whether each text fits a single model window (no chunking needed).
+    """
+    window = max(1, max_length - len(_with_special_tokens(analyzer.tokenizer, [])))
+    encoded = analyzer.tokenizer(list(texts), add_special_tokens=False, truncation=False)["input_ids"]
+    return [len(ids) <= window for ids in encoded]
+
+
+def _id2label(analyzer: Any) -> Dict[int, str]:
+    mapping = getattr(analyzer, "id2label", None) or analyzer.model.config.id2label
+    return {int(k): v for k, v in mapping.items()}
+
+
+def _with_special_tokens(tokenizer: Any, ids: List[int]) -> List[int]:
+    build = getattr(tokenizer, "build_inputs_with_special_tokens", None)
+    if callable(build):
+        return build(ids)
+    return [tokenizer.cls_token_id, *ids, tokenizer.sep_token_id]
+
+
+def _segments(tokenizer: Any, texts: Sequence[str], max_length: int) -> List[_Segment]:
+    # Room for [CLS] and [SEP] in every chunk
+    window = max(1, max_length - len(_with_special_tokens(tokenizer, [])))
+    encoded = tokenizer(list(texts), add_special_tokens=False, truncation=False)["input_ids"]
+
+    segments: List[_Segment] = []
+    for owner, ids in enumerate(encoded):
+        if not ids:
+            segments.append(_Segment(owner, []))
+            continue
+        for start in range(0, len(ids), window):
+            segments.append(_Segment(owner, ids[start:start + window]))
+    return segments
+
+
+def _length_buckets(segments: List[_Segment], batch_size: int) -> List[List[_Segment]]:
+    # Sorting by length makes every batch a bucket of similar-length segments,
+    # so padding each batch to its own longest member wastes little.
+    ordered = sorted(segments, key=lambda segment: len(segment.input_ids))
+    return [ordered[start:start + batch_size] for start in range(0, len(ordered), batch_size)]
+
+
+def _pad_count(lengths: Sequence[int]) -> int:
+    return max(lengths) * len(lengths) - sum(lengths) if lengths else 0
+
+
+def _forward(analyzer: Any, batch: List[_Segment]) -> "torch.Tensor":
+    import torch
+
+    tokenizer = analyzer.tokenizer
+    model = analyzer.model
+    rows = [_with_special_tokens(tokenizer, segment.input_ids) for segment in batch]
+    width = max(len(row) for row in rows)
+    pad_id = tokenizer.pad_token_id or 0
+
+    input_ids = torch.full((len(rows), width), pad_id, dtype=torch.long)
+    attention_mask = torch.zeros((len(rows), width), dtype=torch.long)
+    for i, row in enumerate(rows):
+        input_ids[i, : len(row)] = torch.tensor(row, dtype=torch.long)
+        attention_mask[i, : len(row)] = 1
+
+    device = next(model.parameters()).device
+    with torch.no_grad():
+        logits = model(input_ids=input_ids.to(device), attention_mask=attention_mask.to(device)).logits
+    return torch.softmax(logits.float(), dim=-1).cpu()
+
+
+def score_texts(
+    analyzer: Any,
+    texts: Sequence[str],
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    max_length: int = SENTIMENT_MAX_LENGTH,
+    record: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Score many texts with padded batches. Long texts are split into token
+    windows; all windows of all texts are sorted into length buckets and each
+    batch is padded only to its own longest member. Each text's distribution
+    is the token-weighted mean of its windows. Returns, in input order, per text
+    the same keys as `predict_sentiment_with_chunking` uses
+    (predicted_label, confidence) plus the full `probabilities`. `record=False`
+    leaves the padding statistics alone.
+    """
+    if not texts:
+        return []
+
+    segments = _segments(analyzer.tokenizer, texts, max_length)
+    totals: List[Optional["torch.Tensor"]] = [None] * len(texts)
+    weights = [0] * len(texts)
+
+    batch_size = max(1, batch_size)
+    special = len(_with_special_tokens(analyzer.tokenizer, []))
+    lengths = [len(segment.input_ids) + special for segment in segments]
+    batches = _length_buckets(segments, batch_size)
+    if record:
+        _padding_stats.record(
+            batches=len(batches),
+            segments=len(segments),
+            tokens=sum(lengths),
+            padded=sum(_pad_count([len(segment.input_ids) + special for segment in batch]) for batch in batches),
+            padded_unsorted=sum(
+                _pad_count(lengths[start:start + batch_size]) for start in range(0, len(lengths), batch_size)
+            ),
+        )
+
+    for batch in batches:
+        probs = _forward(analyzer, batch)
+        for segment, row in zip(batch, probs):
+            weight = max(1, len(segment.input_ids))
+            weighted = row * weight
+            current = totals[segment.owner]
+            totals[segment.owner] = weighted if current is None else current + weighted
+            weights[segment.owner] += weight
+
+    id2label = _id2label(analyzer)
+    threshold = float(getattr(analyzer, "confidence_threshold", 0.0) or 0.0)
+    results = []
+    for total, weight in zip(totals, weights):
+        dist = (total / weight).tolist()
+        top = max(range(len(dist)), key=dist.__getitem__)
+        confidence = dist[top]
+        label = id2label[top] if confidence >= threshold else "UNCERTAIN"
+        results.append(
+            {
+                "predicted_label": label,
+                "confidence": confidence,
+                "probabilities": {id2label[i]: p for i, p in enumerate(dist)},
+            }
+        )
+    return results
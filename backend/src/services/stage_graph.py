@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+from src.lib.profiling import profiling_active
+
+from .executor import get_executor
+
+
+@dataclass
+class _Stage:
+    fn: Callable[..., Any]
+    deps: Sequence[str]
+    future: Future = field(default_factory=Future)
+    waiting: int = 0
+
+
+class StageGraph:
+    """
+    A small dependency graph of pipeline stages. Each stage is called with the
+    results of its dependencies, in order, and is submitted to the stage pool
+    as soon as the last of them finishes, so independent stages run
+    concurrently and the total time follows the critical path. No pool thread
+    ever blocks waiting on another stage.
+    """
+
+    def __init__(self, family: str = "stage") -> None:
+        self.family = family
+        self._stages: Dict[str, _Stage] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Sequence[str] = ()) -> Future:
+        for dep in deps:
+            if dep not in self._stages:
+                raise KeyError(f"Stage {name!r} depends on unknown stage {dep!r}")
+        stage = _Stage(fn=fn, deps=tuple(deps), waiting=len(deps))
+        self._stages[name] = stage
+        for dep in deps:
+            self._dependents.setdefault(dep, []).append(name)
+        return stage.future
+
+    def run(self) -> Dict[str, Future]:
+        """
+        Start every stage and return their futures (stages were added in a
+        valid order, since dependencies must exist when a stage is added).
+        A profiled request runs the stages in order on the calling thread,
+        so the profile sees them.
+        """
+        if profiling_active():
+            for name in self._stages:
+                self._execute(name)
+        else:
+            for name, stage in self._stages.items():
+                if not stage.deps:
+                    self._submit(name)
+        return {name: stage.future for name, stage in self._stages.items()}
+
+    def _submit(self, name: str) -> None:
+        get_executor(self.family).submit(self._execute, name)
+
+    def _execute(self, name: str) -> None:
+        stage = self._stages[name]
+        try:
+            result = stage.fn(*(self._stages[dep].future.result() for dep in stage.deps))
+        except BaseException as exc:  # failed dependencies propagate to dependents
+            stage.future.set_exception(exc)
+        else:
+            stage.future.set_result(result)
+        if profiling_active():
+            return
+
+        ready = []
+        with self._lock:
+            for dependent in self._dependents.get(name, []):
+                self._stages[dependent].waiting -= 1
+                if self._stages[dependent].waiting == 0:
+                    ready.append(dependent)
+        for dependent in ready:
+            self._submit(dependent)
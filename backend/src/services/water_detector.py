@@ -1,7 +1,7 @@
 import importlib.util
+import sys
 from datetime import datetime, timezone
-from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException, status
 
@@ -10,14 +10,20 @@ from src.api.schemas_water import (
     WaterAnalyzeRequest,
     WaterAnalyzeResponse,
 )
-from src.lib.determinism import create_determinism_context
+from src.lib.metrics import timed_stage
 from src.lib.water_config import (
     WATER_CONTRACT_VERSION,
     WATER_DETECTOR_VERSION,
     WATER_MODEL_PATH,
     WATER_MODULE_PATH,
+    WATER_MORPH_CACHE_SIZE,
+    WATER_MORPH_SEED_PATH,
+    WATER_MORPH_SEED_TOP_N,
 )
 
+from .model_registry import registry
+from .result_cache import cached_batch, cached_call, normalize_text
+
 
 def _load_analyzer_module():
     if not WATER_MODULE_PATH.exists():
@@ -28,17 +34,57 @@ def _load_analyzer_module():
         raise RuntimeError("Unable to load water analyzer module")
 
     module = importlib.util.module_from_spec(spec)
+    # Registered so process-pool workers can unpickle the module's functions
+    sys.modules[spec.name] = module
     spec.loader.exec_module(module)  # type: ignore[attr-defined]
     return module
 
 
-@lru_cache(maxsize=1)
-def _get_analyzer():
+def _load_analyzer(model_path: Optional[str] = None) -> Any:
     module = _load_analyzer_module()
     analyzer_cls = getattr(module, "WaterAnalyzer", None)
     if analyzer_cls is None:
         raise RuntimeError("WaterAnalyzer class not found in analyzer module")
-    return analyzer_cls(model_path=str(WATER_MODEL_PATH))
+    return analyzer_cls(
+        model_path=model_path or str(WATER_MODEL_PATH),
+        morph_cache_size=WATER_MORPH_CACHE_SIZE,
+        morph_seed_path=WATER_MORPH_SEED_PATH,
+        morph_seed_top_n=WATER_MORPH_SEED_TOP_N,
+    )
+
+
+def _warm_up_analyzer(analyzer: Any) -> None:
+    analyzer.analyze(
+        "Сегодня в городе открылся новый парк. Жители очень довольны красивыми аллеями.",
+        detailed=True,
+    )
+
+
+registry.register("water", _load_analyzer, _warm_up_analyzer, WATER_DETECTOR_VERSION)
+
+
+def load_model() -> Any:
+    """
+    Load the water analyzer (once per process) and return the current version.
+    """
+    return registry.current("water").model
+
+
+def warm_up() -> None:
+    """
+    Run one dummy text through the analyzer to warm the morphology and model paths.
+    """
+    _warm_up_analyzer(load_model())
+
+
+def get_morph_cache_stats() -> Dict[str, Any]:
+    """
+    Return hit-rate statistics of the analyzer's morphology cache.
+    """
+    handle = registry.peek("water")
+    if handle is None:
+        return {"loaded": False}
+    return {"loaded": True, **handle.model.morph_cache.stats()}
 
 
 def _safe_float(value: Any) -> float:
@@ -62,7 +108,7 @@ def _map_features(raw: Dict[str, Any] | None) -> FeatureMetrics | None:
     )
 
 
-def _fallback_response(message: str) -> WaterAnalyzeResponse:
+def _fallback_response(message: str, version: Optional[str] = None) -> WaterAnalyzeResponse:
     now = datetime.now(timezone.utc)
     return WaterAnalyzeResponse(
         is_water=False,
@@ -72,31 +118,99 @@ def _fallback_response(message: str) -> WaterAnalyzeResponse:
         features=None,
         interpretations=None,
         contract_version=WATER_CONTRACT_VERSION,
-        detector_version=WATER_DETECTOR_VERSION,
+        detector_version=version or registry.version("water"),
         evaluated_at=now,
         errors=[message],
     )
 
 
+def _cache_version() -> str:
+    # Follows the active model version, so a reload invalidates cached results
+    return f"{WATER_CONTRACT_VERSION}:{registry.version('water')}"
+
+
+def _cache_input(payload: WaterAnalyzeRequest) -> Dict[str, Any]:
+    return {"text": normalize_text(payload.text), "include_features": payload.include_features}
+
+
+def _is_cacheable(response: WaterAnalyzeResponse) -> bool:
+    return not response.errors
+
+
 def analyze_water(payload: WaterAnalyzeRequest) -> WaterAnalyzeResponse:
     """
     Run water detection for a single text sample. Returns structured response.
+    Repeated texts are served from the result cache.
     """
-    create_determinism_context()
+    response, cached = cached_call(
+        "water",
+        _cache_version(),
+        _cache_input(payload),
+        WaterAnalyzeResponse,
+        lambda: _analyze_water(payload),
+        cacheable=_is_cacheable,
+    )
+    response.cached = cached
+    return response
+
 
+def _analyze_water(payload: WaterAnalyzeRequest) -> WaterAnalyzeResponse:
     try:
-        analyzer = _get_analyzer()
+        registry.current("water")
     except Exception as exc:  # pragma: no cover - defensive path
         return _fallback_response(f"water detector init error: {exc}")
 
+    with registry.use("water") as handle:
+        try:
+            with timed_stage("water"):
+                result = handle.model.analyze(payload.text, detailed=payload.include_features)
+        except Exception as exc:
+            return _fallback_response(f"water detector unavailable: {exc}", handle.version)
+
+    return _build_response(result, payload.include_features, handle.version)
+
+
+def analyze_water_batch(payloads: List[WaterAnalyzeRequest]) -> List[WaterAnalyzeResponse]:
+    """
+    Run water detection for several texts, scoring all of them with one model call.
+    Cached and repeated texts are analyzed once. Returns responses in input order.
+    """
+    results = cached_batch(
+        "water",
+        _cache_version(),
+        [_cache_input(payload) for payload in payloads],
+        WaterAnalyzeResponse,
+        lambda indices: _analyze_water_batch([payloads[i] for i in indices]),
+        cacheable=_is_cacheable,
+    )
+    responses = []
+    for response, cached in results:
+        response.cached = cached
+        responses.append(response)
+    return responses
+
+
+def _analyze_water_batch(payloads: List[WaterAnalyzeRequest]) -> List[WaterAnalyzeResponse]:
     try:
-        result = analyzer.analyze(payload.text, detailed=payload.include_features)
-    except Exception as exc:
-        return _fallback_response(f"water detector unavailable: {exc}")
+        registry.current("water")
+    except Exception as exc:  # pragma: no cover - defensive path
+        return [_fallback_response(f"water detector init error: {exc}") for _ in payloads]
+
+    with registry.use("water") as handle:
+        try:
+            unique = list(dict.fromkeys(payload.text for payload in payloads))
+            with timed_stage("water"):
+                results = dict(zip(unique, handle.model.analyze_batch(unique, detailed=True)))
+        except Exception as exc:
+            return [_fallback_response(f"water detector unavailable: {exc}", handle.version) for _ in payloads]
+
+    return [_build_response(results[payload.text], payload.include_features, handle.version) for payload in payloads]
+
 
-    features = _map_features(result.get("features") if payload.include_features else None)
+def _build_response(result: Dict[str, Any], include_features: bool, version: str) -> WaterAnalyzeResponse:
+    features = _map_features(result.get("features") if include_features else None)
     interpretations = (
-        result.get("interpretations") if payload.include_features else None
+        result.get("interpretations") if include_features else None
     )
 
     response = WaterAnalyzeResponse(
@@ -107,7 +221,7 @@ def analyze_water(payload: WaterAnalyzeRequest) -> WaterAnalyzeResponse:
         features=features,
         interpretations=interpretations,
         contract_version=WATER_CONTRACT_VERSION,
-        detector_version=WATER_DETECTOR_VERSION,
+        detector_version=version,
         evaluated_at=datetime.now(timezone.utc),
     )
 